@@ -1,10 +1,15 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 import sys
 import os
 import re
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
 
-from src.naver_api import get_search_volume, get_blog_count, get_autocomplete
+from config import API_CONCURRENCY
+from src.naver_api import get_search_volume_by_hint, get_blog_count, get_autocomplete, get_metric, DOC_METRICS
+from src.cache import get_cache
+from src import http_client, rate_limiter, job_queue, keyword_analysis, quota, circuit_breaker
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,32 +20,30 @@ app = Flask(__name__, template_folder='templates', static_folder='output')
 def index():
     return render_template('manual.html')
 
-@app.route('/analyze', methods=['POST'])
-def analyze():
-    data = request.json
-    raw_text = data.get('sentences', [])
-    
-    if not raw_text:
-        return jsonify({'error': '입력된 문장이 없습니다.'})
-    
-    # 정제
+# 입력 줄 중 키워드가 아닌 것 (순위 번호, 날짜, 사이트명 등)
+SKIP_PATTERNS = [
+    r'^\d+$',
+    r'^\d{4}년',
+    r'^daum$', r'^zum$', r'^nate$', r'^googletrend$',
+    r'실시간 검색어',
+    r'기준$',
+    r'🔍',
+    r'\d+,\d+',
+    r'^\d+\s+\d+',
+]
+
+# 연관검색어를 조회할 상위 키워드 수
+RELATED_TOP = 10
+
+
+def clean_sentences(raw_text):
+    """붙여넣은 줄 → 분석할 키워드 목록 (순서 유지, 중복 제거)"""
     sentences = []
     for line in raw_text:
         line = line.strip()
         
-        skip_patterns = [
-            r'^\d+$',
-            r'^\d{4}년',
-            r'^daum$', r'^zum$', r'^nate$', r'^googletrend$',
-            r'실시간 검색어',
-            r'기준$',
-            r'🔍',
-            r'\d+,\d+',
-            r'^\d+\s+\d+',
-        ]
-        
         skip = False
-        for pattern in skip_patterns:
+        for pattern in SKIP_PATTERNS:
             if re.search(pattern, line, re.IGNORECASE):
                 skip = True
                 break
@@ -57,7 +60,19 @@ def analyze():
         if line and len(line) >= 2:
             sentences.append(line)
     
-    sentences = list(dict.fromkeys(sentences))
+    return list(dict.fromkeys(sentences))
+
+
+@app.route('/analyze', methods=['POST'])
+def analyze():
+    data = request.json
+    raw_text = data.get('sentences', [])
+    
+    if not raw_text:
+        return jsonify({'error': '입력된 문장이 없습니다.'})
+    
+    # 정제
+    sentences = clean_sentences(raw_text)
     
     if not sentences:
         return jsonify({'error': '유효한 키워드가 없습니다.'})
@@ -66,20 +81,31 @@ def analyze():
     print(f"    → {sentences[:5]}...")
     
     all_keywords = list(set(sentences))
-    print(f"�� {len(all_keywords)}개 키워드 분석 시작")
+    print(f"🔍 {len(all_keywords)}개 키워드 분석 시작")
+    
+    # 스트리밍 모드: 키워드 결과/연관검색어를 나오는 대로 한 줄씩 (NDJSON)
+    if data.get('stream') or request.args.get('stream'):
+        return Response(
+            stream_with_context(ndjson(stream_analysis(all_keywords))),
+            mimetype='application/x-ndjson',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
     
     # 직접 분석
     results = analyze_direct(all_keywords)
     print(f"✅ {len(results)}개 키워드 분석 완료")
     
+    # 요청한 경우에만 뉴스/웹문서 수 추가 조회 (예: "metrics": ["news_count"])
+    extra_metrics = [metric for metric in data.get('metrics', []) if metric in DOC_METRICS]
+    if extra_metrics:
+        with ThreadPoolExecutor(max_workers=API_CONCURRENCY) as executor:
+            list(executor.map(
+                lambda task: get_metric(*task),
+                [(item, metric) for item in results for metric in extra_metrics]
+            ))
+    
     # 연관검색어 조회 (상위 10개)
-    related_data = []
-    for item in results[:10]:
-        related = get_autocomplete(item['keyword'])
-        related_data.append({
-            'keyword': item['keyword'],
-            'related': related[:5]
-        })
+    related_data = keyword_analysis.fetch_related(results, RELATED_TOP)
     
     # 아카이브 저장 제거 - 화면에만 표시 (휘발)
     
@@ -92,55 +118,138 @@ def analyze():
     })
 
 
-def analyze_direct(keywords):
-    """입력 키워드만 직접 분석 (필터링 없음)"""
-    print(f"    🔍 {len(keywords)}개 키워드 검색량 조회 중...")
-    search_volumes = get_search_volume(keywords)
-    
-    filtered_volumes = {}
-    for kw in keywords:
-        kw_clean = kw.replace(" ", "")
-        for api_kw, volume in search_volumes.items():
-            if api_kw.replace(" ", "") == kw_clean:
-                filtered_volumes[kw] = volume
-                break
-        if kw not in filtered_volumes:
-            filtered_volumes[kw] = 0
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """큰 입력용 백그라운드 분석 - 작업 ID를 바로 돌려주고 /jobs/<id>로 진행 상황 조회"""
+    data = request.json or {}
+    raw_text = data.get('sentences', [])
+    
+    if not raw_text:
+        return jsonify({'error': '입력된 문장이 없습니다.'}), 400
+    
+    sentences = clean_sentences(raw_text)
+    if not sentences:
+        return jsonify({'error': '유효한 키워드가 없습니다.'}), 400
+    
+    try:
+        job, coalesced = job_queue.get_queue().submit(sentences, stream_analysis)
+    except job_queue.QueueFull as e:
+        return jsonify({'error': str(e)}), 503
+    
+    print(f"📥 작업 {job.id[:8]} {'합류' if coalesced else '등록'} ({len(sentences)}개 키워드)")
+    return jsonify({
+        'job_id': job.id,
+        'status': job.status,
+        'total_keywords': job.total,
+        'coalesced': coalesced
+    }), 202
+
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    """작업 진행 상황 - ?since=N 이면 N번째 이후 부분 결과만"""
+    job = job_queue.get_queue().get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    
+    since = request.args.get('since', 0, type=int)
+    return jsonify(job.snapshot(since))
+
+
+def ndjson(events):
+    """이벤트 dict → NDJSON 줄"""
+    for event in events:
+        yield json.dumps(event, ensure_ascii=False) + "\n"
+
+
+def stream_analysis(keywords):
+    """analyze_direct와 같은 분석을 키워드마다 결과가 나오는 즉시 이벤트로 전달
     
-    print(f"    ✅ {len(filtered_volumes)}개 키워드 분석 대상")
+    검색량(5개 힌트씩)과 블로그 문서수를 모두 동시에 요청하고,
+    한 키워드의 두 값이 모이면 바로 result 이벤트를 보낸다.
+    전체 결과가 모이면 블로그 문서수 상위 키워드의 연관검색어를 동시에 조회해 related 이벤트로 보낸다.
+    """
+    yield {'type': 'start', 'total_keywords': len(keywords)}
     
+    volumes = {}
+    blog_counts = {}
     results = []
-    count = 0
-    for keyword, monthly in filtered_volumes.items():
-        count += 1
-        blog_count = get_blog_count(keyword)
-        
-        if monthly > 0:
-            saturation = round(blog_count / monthly, 2)
-        else:
-            saturation = 0
-        
-        if blog_count <= 1000:
-            possibility = "🟢"
-        elif blog_count <= 10000:
-            possibility = "🟡"
-        elif blog_count <= 50000:
-            possibility = "🟠"
-        else:
-            possibility = "🔴"
+    batches = [keywords[i:i + 5] for i in range(0, len(keywords), 5)]
+    
+    # with 블록은 끝날 때 실행 중/대기 중 조회를 모두 기다리므로 직접 만들고 finally에서 정리
+    executor = ThreadPoolExecutor(max_workers=API_CONCURRENCY)
+    try:
+        # 배치별로 검색량과 블로그 문서수를 나란히 요청해야 첫 결과가 한 번의 왕복 만에 나옴
+        futures = {}
+        for batch in batches:
+            futures[executor.submit(get_search_volume_by_hint, batch)] = ('volume', batch)
+            for keyword in batch:
+                futures[executor.submit(get_blog_count, keyword)] = ('blog', keyword)
         
-        results.append({
-            'keyword': keyword,
-            'monthly_search': monthly,
-            'blog_count': blog_count,
-            'saturation': saturation,
-            'possibility': possibility
-        })
+        for future in as_completed(futures):
+            kind, target = futures[future]
+            if kind == 'volume':
+                batch_volumes = {}
+                for hint_volumes in future.result().values():
+                    batch_volumes.update(hint_volumes)
+                index = keyword_analysis.VolumeIndex(batch_volumes)
+                ready = []
+                for keyword in target:
+                    volumes[keyword] = index.lookup(keyword)
+                    if keyword in blog_counts:
+                        ready.append(keyword)
+            else:
+                blog_counts[target] = future.result()
+                ready = [target] if target in volumes else []
+            
+            for keyword in ready:
+                item = keyword_analysis.build_result(keyword, volumes[keyword], blog_counts[keyword])
+                results.append(item)
+                yield {'type': 'result', 'item': item}
         
-        if count % 10 == 0:
-            print(f"    ⏳ {count}개 분석 중...")
+        # 연관검색어 (블로그 문서수 적은 순 상위 N개) - 조회되는 대로 전달
+        top = sorted(results, key=keyword_analysis.blog_order)[:RELATED_TOP]
+        related_futures = {
+            executor.submit(get_autocomplete, item['keyword']): rank
+            for rank, item in enumerate(top)
+        }
+        for future in as_completed(related_futures):
+            rank = related_futures[future]
+            yield {
+                'type': 'related',
+                'rank': rank,
+                'item': {'keyword': top[rank]['keyword'], 'related': future.result()[:5]}
+            }
+    
+    except Exception as e:
+        print(f"❌ 스트리밍 분석 에러: {e}")
+        yield {'type': 'error', 'error': f'분석 중 오류가 발생했습니다: {e}'}
+        return
+    finally:
+        # 클라이언트가 연결을 끊으면(GeneratorExit) 아직 시작하지 않은 조회는 취소하고 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    return sorted(results, key=lambda x: x['blog_count'])
+    print(f"✅ {len(results)}개 키워드 분석 완료 (스트리밍)")
+    yield {'type': 'done', 'total_keywords': len(keywords), 'results': len(results)}
+
+
+@app.route('/stats')
+def stats():
+    """키워드 캐시 적중 / HTTP 연결 재사용 / 속도 제한 통계"""
+    cache = get_cache()
+    return jsonify({
+        'cache': cache.stats() if cache else None,
+        'http': http_client.stats(),
+        'rate_limits': rate_limiter.stats(),
+        'jobs': job_queue.get_queue().stats(),
+        'quota': quota.stats(),
+        'circuits': circuit_breaker.stats()
+    })
+
+
+def analyze_direct(keywords):
+    """입력 키워드만 직접 분석 (필터링 없음)"""
+    return keyword_analysis.analyze_keywords(keywords)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""성능 측정 스크립트 (API 호출 없음)
+
+사용법:
+    python benchmark.py render      # 페이지 렌더링 비용
+    python benchmark.py extract     # LLM 추출 처리량 (로컬 대체 서버)
+    python benchmark.py local       # 로컬 추출기 속도 + 저장된 LLM 결과 대비 재현율
+    python benchmark.py dedup       # 비슷한 헤드라인 묶기 처리량
+    python benchmark.py trends      # 키워드-날짜 기록 추세 계산 속도
+    python benchmark.py match       # 입력 키워드 ↔ 검색량 응답 매칭 (1k / 10k 키워드)
+    python benchmark.py prefilter   # 저장된 일별 CSV 재생: 검색량 상위 N개 조회 vs 사전 필터 후 N개 조회
+    python benchmark.py e2e         # main.main + app.analyze 전체 실행 (로컬 대체 서버, --json으로 결과 저장)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import fake_server
+from config import NEWS_CATEGORIES, RATE_LIMITS, TREND_WINDOWS
+from src import builder, template_engine, cache, local_extractor, dedup, trends, keyword_analysis, prefilter
+from src import seen_store, history_store, quota
+
+
+def measure(fn, repeat):
+    """fn을 repeat번 실행한 1회 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def legacy_render_page(content_template_path, context):
+    """기존 방식: 매번 파일을 읽고 키마다 str.replace"""
+    base = builder.read_file("templates/base.html")
+    content = builder.read_file(content_template_path)
+    for k, v in context.items():
+        content = content.replace("{{" + k + "}}", str(v))
+    context2 = dict(context)
+    context2["content"] = content
+    for k, v in context2.items():
+        base = base.replace("{{" + k + "}}", str(v))
+    return base
+
+
+def sample_category_context():
+    """키워드 80개짜리 카테고리 페이지 context"""
+    share_buttons, share_js = builder.load_partials()
+    rows = "".join(
+        f"<tr><td>{i}</td><td><strong>샘플키워드{i}</strong></td><td>{i * 100:,}</td></tr>"
+        for i in range(1, 81)
+    )
+    cards = "".join(f'<div class="related-card"><strong>샘플키워드{i}</strong></div>' for i in range(10))
+    return {
+        "page_title": "📈 증권/주식 - 뉴스 키워드",
+        "meta_tags": "",
+        "head_extra": "",
+        "body_extra": "",
+        "header_title": "📈 증권/주식 키워드",
+        "header_subtitle": "상위노출 가능한 블로그 키워드 80개",
+        "update_time": "2026년 01월 01일 07시 00분",
+        "share_buttons": share_buttons,
+        "share_js": share_js,
+        "nav_links": builder.generate_nav_links(current_category=next(iter(NEWS_CATEGORIES))),
+        "keyword_rows": rows,
+        "related_cards": cards,
+        "rising_section": "",
+    }
+
+
+def bench_render(repeat):
+    """카테고리 페이지 렌더링: 기존 방식 vs 템플릿 캐시"""
+    context = sample_category_context()
+    path = "templates/pages/category.html"
+
+    legacy = legacy_render_page(path, context)
+    current = builder.render_page(path, context)
+    print(f"🔎 출력 동일 여부: {'✅ 동일' if legacy == current else '❌ 다름'} ({len(current):,} bytes)")
+
+    legacy_ms = measure(lambda: legacy_render_page(path, context), repeat)
+    template_engine.clear()
+    cold_ms = measure(lambda: (template_engine.clear(), builder.render_page(path, context)), repeat)
+    warm_ms = measure(lambda: builder.render_page(path, context), repeat)
+
+    print(f"⏱️ 페이지당 렌더링 ({repeat}회 평균)")
+    print(f"   • 기존 (매번 읽기 + replace): {legacy_ms:.3f} ms")
+    print(f"   • 캐시 없음 (읽기 + 분해):    {cold_ms:.3f} ms")
+    print(f"   • 캐시 사용 (join 1회):       {warm_ms:.3f} ms")
+
+
+def sample_headlines(category_name, count=35):
+    """카테고리별 가짜 헤드라인"""
+    return [f"{category_name} 관련 주요 이슈 {i}번째 소식 정리 {category_name}전망" for i in range(count)]
+
+
+def bench_extract(latency):
+    """카테고리 7개 키워드 추출: 순차 vs 동시 (캐시 없이, 로컬 대체 서버 사용)"""
+    server, base_url = fake_server.start(latency=latency)
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    os.environ["OPENAI_API_KEY"] = "benchmark"
+    cache.CACHE_ENABLED = False
+
+    from src import analyzer
+
+    jobs = {
+        cat_id: (sample_headlines(cat_info["name"]), cat_info["name"])
+        for cat_id, cat_info in NEWS_CATEGORIES.items()
+    }
+
+    start = time.perf_counter()
+    for headlines, category_name in jobs.values():
+        analyzer.extract_keywords(headlines, category_name)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = analyzer.extract_all(jobs)
+    concurrent = time.perf_counter() - start
+
+    server.shutdown()
+
+    print(f"⏱️ 카테고리 {len(jobs)}개 추출 (요청당 지연 {latency}s)")
+    print(f"   • 순차: {sequential:.2f}s ({len(jobs) / sequential:.2f} 요청/s)")
+    print(f"   • 동시: {concurrent:.2f}s ({len(jobs) / concurrent:.2f} 요청/s)")
+    print(f"   • 추출 키워드: {sum(len(v) for v in results.values())}개")
+
+
+def bench_local(batch_size=35):
+    """저장된 LLM 추출 결과(헤드라인 캐시)와 로컬 추출기 비교"""
+    keyword_cache = cache.get_cache()
+    stored = [
+        value for _, value in (keyword_cache.items("llm_keywords") if keyword_cache else [])
+        if value.get("headline")
+    ]
+    if not stored:
+        print("⚠️ 저장된 LLM 추출 결과 없음 - main.py를 한 번 실행한 뒤 다시 시도하세요")
+        return
+
+    corpus = local_extractor.load_corpus()
+    batches = [stored[i:i + batch_size] for i in range(0, len(stored), batch_size)]
+
+    hits = 0
+    total = 0
+    elapsed = 0.0
+    for batch in batches:
+        headlines = [item["headline"] for item in batch]
+        expected = {kw for item in batch for kw in item["keywords"]}
+
+        start = time.perf_counter()
+        found = set(local_extractor.extract_keywords(headlines, corpus=corpus))
+        elapsed += time.perf_counter() - start
+
+        hits += len(expected & found)
+        total += len(expected)
+
+    print(f"📚 LLM 결과 {len(stored)}개 헤드라인 / {len(batches)}개 배치 (배치당 {batch_size}개)")
+    print(f"   • 로컬 추출 시간: 배치당 {elapsed / len(batches) * 1000:.1f} ms")
+    print(f"   • 재현율 (LLM 키워드 중 로컬도 찾은 비율): {hits / total:.1%} ({hits}/{total})")
+
+
+def synthetic_headlines(stories, variants, seed=1):
+    """같은 기사를 언론사 꼬리표/머리표/문장부호만 바꿔 여러 번 쓴 헤드라인"""
+    rng = random.Random(seed)
+    outlets = ["연합뉴스", "매일경제", "한국경제", "머니투데이", "뉴시스", "이데일리"]
+    tags = ["", "[속보] ", "(종합) ", "[단독] "]
+    syllables = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초"
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+
+    headlines = []
+    for _ in range(stories):
+        base = " ".join(word() for _ in range(rng.randint(5, 8)))
+        for _ in range(variants):
+            title = rng.choice(tags) + base
+            if rng.random() < 0.5:
+                title = title.replace(" ", "  ", 1) + "..."
+            if rng.random() < 0.7:
+                title += f" - {rng.choice(outlets)}"
+            headlines.append(title)
+    rng.shuffle(headlines)
+    return headlines
+
+
+def bench_dedup(count=20000, variants=4):
+    """비슷한 헤드라인 묶기: 정확히 같은 제목만 제거 vs MinHash/LSH"""
+    headlines = synthetic_headlines(count // variants, variants)
+
+    start = time.perf_counter()
+    exact = list(dict.fromkeys(headlines))
+    exact_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    collapsed = dedup.collapse(headlines)
+    elapsed = time.perf_counter() - start
+
+    print(f"📰 헤드라인 {len(headlines):,}개 (기사 {count // variants:,}개 × 변형 {variants}개)")
+    print(f"   • 정확히 같은 제목만 제거: {len(exact):,}개 남음 ({exact_ms:.1f} ms)")
+    print(f"   • 비슷한 제목 묶기:       {len(collapsed):,}개 남음 ({elapsed * 1000:.0f} ms)")
+    print(f"   • 처리량: {len(headlines) / elapsed:,.0f} 헤드라인/s")
+
+
+def bench_trends(rows=400000, keywords=20000, days=60, run_rows=560):
+    """가짜 기록 rows행(days일치)을 기록 저장소(SQLite)에 넣고 trends.load(기본 기간) + 모든 기간 추세 계산
+
+    load는 처음(스냅샷 생성)과 한 번 실행분(run_rows행)이 추가된 뒤(스냅샷 + 새 기록만 읽기)를 따로 측정
+    """
+    rng = random.Random(1)
+    categories = list(NEWS_CATEGORIES)
+    today = datetime.now(history_store.KST)
+    dates = [(today - timedelta(days=day)).strftime("%Y-%m-%d 07:00") for day in range(1, days)]
+
+    def fake_rows(count, dates):
+        batches = {}
+        for _ in range(count):
+            batches.setdefault((rng.choice(categories), rng.choice(dates)), []).append({
+                "keyword": f"키워드{rng.randrange(keywords)}",
+                "monthly_search": rng.randint(100, 100000),
+                "blog_count": rng.randint(1, 50000),
+                "saturation": rng.random() * 2,
+                "possibility": "🟢",
+            })
+        return batches
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench_"))
+    store = history_store.HistoryStore(workdir / "history.db")
+    for (category, ts), results in fake_rows(rows, dates).items():
+        store.record(category, results, ts=ts)
+    store.flush()
+    snapshot_path = workdir / "trend_columns.npz"
+
+    start = time.perf_counter()
+    trends.load(store=store, snapshot_path=snapshot_path)
+    cold = time.perf_counter() - start
+
+    # 오늘 실행분 추가
+    for (category, ts), results in fake_rows(run_rows, [today.strftime("%Y-%m-%d 07:00")]).items():
+        store.record(category, results, ts=ts)
+    store.flush()
+
+    start = time.perf_counter()
+    table = trends.load(store=store, snapshot_path=snapshot_path)
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = trends.compute_all(table)
+    rising = trends.rising(table, results[min(results)])
+    computed = time.perf_counter() - start
+    store.close()
+
+    print(f"📈 기록 {rows + run_rows:,}행 ({days}일) → 최근 {max(TREND_WINDOWS)}일 키워드-날짜 {len(table):,}개 "
+          f"(키워드 {keywords:,}개)")
+    print(f"   • trends.load 처음 (SQLite 전체 읽기 + 스냅샷 생성): {cold * 1000:.0f} ms")
+    print(f"   • trends.load 다음 실행 (스냅샷 + 새 기록 {run_rows}행): {loaded * 1000:.0f} ms")
+    print(f"   • 추세 계산 (기간 {', '.join(map(str, results))}일): {computed * 1000:.0f} ms")
+    print(f"   • 다음 실행 합계: {(loaded + computed) * 1000:.0f} ms")
+    print(f"   • 급상승 1위: {rising[0]['keyword'] if rising else '-'}")
+
+
+def legacy_match_volumes(keywords, search_volumes):
+    """기존 방식: 키워드마다 응답 전체를 훑으며 공백 제거 비교"""
+    filtered_volumes = {}
+    for kw in keywords:
+        kw_clean = kw.replace(" ", "")
+        for api_kw, volume in search_volumes.items():
+            if api_kw.replace(" ", "") == kw_clean:
+                filtered_volumes[kw] = volume
+                break
+        if kw not in filtered_volumes:
+            filtered_volumes[kw] = 0
+    return filtered_volumes
+
+
+def bench_match(sizes=(1000, 10000), related_per_keyword=20, legacy_sample=200):
+    """검색량 매칭: 선형 탐색 vs 정규화 키 인덱스
+
+    keywordstool은 힌트마다 연관 키워드 수백 개를 주므로 응답 크기를 입력의 related_per_keyword배로 잡는다.
+    기존 방식은 너무 느려 legacy_sample개만 재고 입력 수에 비례해 환산한다.
+    """
+    rng = random.Random(1)
+    for size in sizes:
+        keywords = [f"키워드 {i} 검색" for i in range(size)]
+        search_volumes = {f"연관{i}키워드{j}": rng.randint(10, 100000)
+                          for i in range(size) for j in range(related_per_keyword - 1)}
+        search_volumes.update({kw.replace(" ", ""): rng.randint(10, 100000) for kw in keywords})
+        items = list(search_volumes.items())
+        rng.shuffle(items)
+        search_volumes = dict(items)
+
+        sample = rng.sample(keywords, min(legacy_sample, size))
+        start = time.perf_counter()
+        legacy = legacy_match_volumes(sample, search_volumes)
+        legacy_s = (time.perf_counter() - start) * size / len(sample)
+
+        start = time.perf_counter()
+        indexed = keyword_analysis.match_volumes(keywords, search_volumes)
+        indexed_s = time.perf_counter() - start
+
+        same = all(indexed[kw] == volume for kw, volume in legacy.items())
+        print(f"🔑 키워드 {size:,}개 / 응답 {len(search_volumes):,}개 (결과 동일: {'✅' if same else '❌'})")
+        print(f"   • 선형 탐색 (환산): {legacy_s:,.2f} s")
+        print(f"   • 해시 인덱스:      {indexed_s * 1000:,.1f} ms ({legacy_s / indexed_s:,.0f}배)")
+
+
+def bench_prefilter(slots=40):
+    """output/csv 기록을 날짜순으로 재생 - 그날 이전 기록만으로 예측해 같은 조회 수에서 통과 키워드를 얼마나 더 찾는지
+
+    그날 카테고리별 기록(실제로 조회된 후보)을 후보 전체로 보고, 조회 수를 slots개로 제한한다.
+    """
+    isolated_workspace()
+    store = history_store.HistoryStore(Path(tempfile.mkdtemp(prefix="bench_")) / "history.db")
+    for path in sorted((Path(__file__).resolve().parent / "output" / "csv").glob("*.csv")):
+        store.import_csv(path)
+    rows = store.columns(("keyword", "ts", "category", "monthly_search", "blog_count"))
+    if not rows:
+        print("⚠️ 재생할 CSV 기록이 없습니다")
+        return
+
+    by_day = {}
+    for keyword, ts, category, volume, blog_count in rows:
+        if blog_count > 0 and volume > 0:
+            by_day.setdefault(ts[:10], []).append((keyword, ts, category, volume, blog_count))
+
+    days = sorted(by_day)
+    totals = {"baseline": 0, "prefilter": 0, "passing": 0, "lookups": 0}
+    start = time.perf_counter()
+    for index, day in enumerate(days[1:], 1):
+        prior = prefilter.Prior.from_rows(
+            (keyword, ts, volume, blog_count)
+            for earlier in days[:index] for keyword, ts, _, volume, blog_count in by_day[earlier]
+        )
+        # 하루에 여러 번 실행했으면 그날 첫 실행 값 사용
+        candidates = {}
+        for keyword, ts, category, volume, blog_count in sorted(by_day[day], key=lambda row: row[1]):
+            candidates.setdefault(category, {}).setdefault(keyword, (volume, blog_count))
+
+        for items in candidates.values():
+            volumes = {keyword: volume for keyword, (volume, _) in items.items()}
+            passing = {keyword for keyword, (volume, blog) in items.items() if prefilter.passes(volume, blog)}
+            baseline = sorted(volumes, key=volumes.get, reverse=True)[:slots]
+            selected, predictions = prefilter.select(volumes, prior, slots=slots)
+            prefilter.record_outcomes(
+                (predictions[cache.normalize_keyword(keyword)], volume, items[keyword][1])
+                for keyword, volume in selected
+            )
+
+            totals["passing"] += len(passing)
+            totals["lookups"] += slots
+            totals["baseline"] += len(passing.intersection(baseline))
+            totals["prefilter"] += len(passing.intersection(keyword for keyword, _ in selected))
+    elapsed = time.perf_counter() - start
+
+    print(f"📅 {len(days) - 1}일 재생 / 카테고리별 조회 {slots}개 (전체 {totals['lookups']:,}회)")
+    print(f"   • 기준 통과 키워드 (후보 전체): {totals['passing']:,}개")
+    print(f"   • 검색량 상위 {slots}개 조회: {totals['baseline']:,}개 찾음 "
+          f"({totals['baseline'] / totals['lookups']:.0%} / 조회)")
+    print(f"   • 사전 필터 후 {slots}개 조회: {totals['prefilter']:,}개 찾음 "
+          f"({totals['prefilter'] / totals['lookups']:.0%} / 조회, {elapsed:.2f} s)")
+    prefilter.print_stats()
+    check_stale_prior()
+
+
+def check_stale_prior(count=300):
+    """만료된 블로그 문서수가 캐시 정리(_evict) 뒤에도 남아 사전 필터의 예전 값으로 쓰이는지 확인"""
+    stale = cache.KeywordCache(Path(tempfile.mkdtemp(prefix="bench_")) / "cache.db", {"blog_count": 0}, count * 2)
+    keywords = [f"만료키워드{i}" for i in range(count)]
+    for i, keyword in enumerate(keywords):
+        stale.set("blog_count", keyword, i + 1)    # EVICT_EVERY회마다 정리 (TTL 0이라 모두 만료 상태)
+
+    prior = prefilter.Prior({}, {})
+    prior.add_cached(keywords, cache=stale)
+    expired = stale.get("blog_count", keywords[0]) is None
+    ok = expired and len(prior.blog_counts) == count
+    print(f"🗄️ 만료 캐시 → 예전 문서수 {len(prior.blog_counts)}/{count}개 (get 미스: {expired}) {'✅' if ok else '❌'}")
+
+
+def isolated_workspace():
+    """임시 작업 폴더로 BASE_DIR 교체 - 출력 페이지/캐시/기록/한도 사용량이 저장소를 건드리지 않도록"""
+    workspace = Path(tempfile.mkdtemp(prefix="bench_"))
+    shutil.copytree(builder.BASE_DIR / "templates", workspace / "templates")
+    static_dir = builder.BASE_DIR / "src" / "static"
+    if static_dir.exists():
+        shutil.copytree(static_dir, workspace / "src" / "static")
+    (workspace / "output").mkdir()
+
+    for module in (builder, template_engine, cache, seen_store, history_store, local_extractor, quota, trends):
+        module.BASE_DIR = workspace
+    # 이미 열린 한도 저장소/캐시가 있으면 새 폴더에서 다시 열도록
+    quota.close()
+    cache.close()
+    return workspace
+
+
+def run_measured(label, fn, server):
+    """fn 한 번 실행: 걸린 시간, 대체 서버 호출 수/초당 호출, 최대 메모리"""
+    config = server.config
+    calls_before = dict(config.endpoint_calls)
+    total_before = config.calls
+
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+
+    calls = config.calls - total_before
+    endpoints = {
+        endpoint: count - calls_before.get(endpoint, 0)
+        for endpoint, count in sorted(config.endpoint_calls.items())
+        if count - calls_before.get(endpoint, 0)
+    }
+    return {
+        "label": label,
+        "wall_s": round(wall, 3),
+        "calls": calls,
+        "calls_per_s": round(calls / wall, 1) if wall else 0,
+        "peak_mb": round(peak / 1024 / 1024, 1),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "endpoints": endpoints,
+    }
+
+
+def bench_e2e(latency, rate_scale, keywords=100, json_path=None):
+    """로컬 대체 서버로 main.main(캐시 없음 → 캐시 있음)과 app /analyze(일반/스트리밍) 실행"""
+    server, base_url = fake_server.start(latency=latency)
+    fake_server.redirect(base_url)
+    workspace = isolated_workspace()
+
+    # 실제 속도 제한 그대로면 대부분 대기 시간이라 코드 성능 변화가 묻힘
+    for limit in RATE_LIMITS.values():
+        limit["rate"] *= rate_scale
+        limit["burst"] *= rate_scale
+
+    import main as pipeline
+    import app as web
+
+    client = web.app.test_client()
+    sentences = [f"{word}{suffix}" for word in fake_server.WORDS for suffix in fake_server.SUFFIXES][:keywords]
+
+    def analyze():
+        client.post("/analyze", json={"sentences": sentences}).get_json()
+
+    def analyze_stream():
+        response = client.post("/analyze", json={"sentences": sentences, "stream": True}, buffered=False)
+        for _ in response.response:
+            pass
+
+    tracemalloc.start()
+    reports = [
+        run_measured("main.main (캐시 없음)", pipeline.main, server),
+        run_measured("main.main (캐시 있음)", pipeline.main, server),
+    ]
+    # /analyze는 같은 키워드를 캐시 없이 비교하도록 캐시를 끄고 실행
+    cache.CACHE_ENABLED = False
+    reports.append(run_measured(f"app /analyze ({len(sentences)}개)", analyze, server))
+    reports.append(run_measured(f"app /analyze 스트리밍 ({len(sentences)}개)", analyze_stream, server))
+    tracemalloc.stop()
+
+    server.shutdown()
+    shutil.rmtree(workspace, ignore_errors=True)
+
+    print(f"🧪 대체 서버 지연 {latency}s / 속도 제한 ×{rate_scale}")
+    for report in reports:
+        print(f"\n▶ {report['label']}")
+        print(f"   • 실행 시간: {report['wall_s']:.2f} s")
+        print(f"   • API 호출: {report['calls']:,}회 ({report['calls_per_s']:.1f} 회/s)")
+        print(f"   • 최대 메모리: {report['peak_mb']:.1f} MB (Python 힙) / RSS {report['max_rss_mb']:.0f} MB")
+        print(f"   • 엔드포인트: {', '.join(f'{k} {v}' for k, v in report['endpoints'].items())}")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"latency": latency, "rate_scale": rate_scale, "runs": reports}, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 결과 저장: {json_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 키워드 봇 성능 측정")
+    parser.add_argument("target", choices=["render", "extract", "local", "dedup", "trends", "match", "prefilter", "e2e"])
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=1.0)
+    parser.add_argument("--rate-scale", type=float, default=10.0, help="e2e: 속도 제한 배수")
+    parser.add_argument("--json", help="e2e: 결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"⚡ 벤치마크: {args.target}")
+    print("=" * 60)
+
+    if args.target == "render":
+        bench_render(args.repeat)
+    elif args.target == "extract":
+        bench_extract(args.latency)
+    elif args.target == "local":
+        bench_local()
+    elif args.target == "dedup":
+        bench_dedup()
+    elif args.target == "trends":
+        bench_trends()
+    elif args.target == "match":
+        bench_match()
+    elif args.target == "prefilter":
+        bench_prefilter()
+    elif args.target == "e2e":
+        bench_e2e(args.latency, args.rate_scale, json_path=args.json)
+
+
+if __name__ == "__main__":
+    main()
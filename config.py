@@ -1,5 +1,7 @@
 """카테고리별 뉴스 소스 설정"""
 
+import os
+
 NEWS_CATEGORIES = {
     "stock": {
         "name": "증권/주식",
@@ -50,3 +52,175 @@ KEYWORDS_PER_CATEGORY = 50
 
 # 포화도 필터 기준
 SATURATION_THRESHOLD = 1.0
+
+# 네이버 검색 API 동시 요청 수 (문서수 조회)
+API_CONCURRENCY = 8
+
+# 소비자별로 쓰는 문서수 지표 - 실행에 참여하는 소비자가 쓰는 지표만 미리 조회하고
+# 나머지(뉴스/웹문서 수)는 필요할 때 naver_api.get_metric으로 조회 (캐시 사용, 예: app.py /analyze의 metrics)
+METRIC_CONSUMERS = {
+    "page": ("blog_count",),
+    "csv": ("blog_count",),
+    "history": ("blog_count",),
+    "api": ("blog_count",),
+}
+
+# 키워드 지표 캐시 (SQLite)
+CACHE_ENABLED = True
+CACHE_PATH = ".cache/keyword_cache.db"
+CACHE_MAX_ENTRIES = 200000
+
+# 지표별 캐시 유효시간 (초)
+CACHE_TTL = {
+    "search_volume": 24 * 3600,
+    "blog_count": 6 * 3600,
+    "news_count": 3 * 3600,
+    "web_count": 6 * 3600,
+    "autocomplete": 12 * 3600,
+    "llm_keywords": 7 * 24 * 3600,
+}
+
+# 만료된 값도 이 기간(초)은 지우지 않고 남겨 둠 (사전 필터가 예전 문서수로 사용)
+CACHE_STALE_KEEP = 7 * 24 * 3600
+
+# HTTP 커넥션 풀 (호스트당 최대 연결 수 / 연결 오류 재시도 횟수)
+HTTP_POOL_SIZE = 16
+HTTP_RETRIES = 2
+# 응답 대기 중 시간 초과 재시도 횟수 (계열별, 없으면 HTTP_RETRIES)
+# 문서수/자동완성은 timeout 5초가 재시도로 15초까지 늘어나고 재시도분은 일일 한도에도 안 잡히므로 연결 오류만 재시도
+HTTP_READ_RETRIES = {
+    "search": 0,
+    "autocomplete": 0,
+}
+
+# 엔드포인트 계열별 초당 요청 수 / 순간 허용량 (토큰 버킷)
+RATE_LIMITS = {
+    "search": {"rate": 10, "burst": 10},
+    "keywordstool": {"rate": 5, "burst": 5},
+    "autocomplete": {"rate": 10, "burst": 10},
+    "openai": {"rate": 3, "burst": 3},
+}
+
+# 429/5xx 응답 시 지수 백오프 (최대 재시도 횟수 / 기본 대기 / 최대 대기, 초)
+RATE_MAX_RETRIES = 4
+RATE_BACKOFF_BASE = 1.0
+RATE_BACKOFF_MAX = 30.0
+
+# main.py 파이프라인 단계별 동시 처리 카테고리 수
+# (extract는 전 카테고리 동시 요청, 실제 속도는 RATE_LIMITS["openai"]가 제한)
+# (build는 카테고리마다 다른 파일에 쓰고, 공용 아카이브 매니페스트는 builder의 lock으로 보호)
+PIPELINE_WORKERS = {
+    "crawl": 4,
+    "extract": 7,
+    "build": 4,
+}
+
+# 아카이브 목록 매니페스트 (파일별 날짜/카테고리 + 페이지별 내용 해시)
+ARCHIVE_MANIFEST_PATH = "output/archive/manifest.json"
+
+# 키워드 추출 방식: "llm" (OpenAI), "local" (로컬 TF-IDF), "llm_fallback" (LLM 실패 시 로컬)
+EXTRACTOR_MODE = "llm_fallback"
+
+# 로컬 추출기 헤드라인 코퍼스 (최근 N개) / 카테고리당 추출 키워드 수
+LOCAL_CORPUS_PATH = ".cache/headline_corpus.json"
+LOCAL_CORPUS_SIZE = 5000
+LOCAL_KEYWORD_LIMIT = 80
+
+# 뉴스 수집 (페이지당 기사 수 / 최대 페이지 수 / 카테고리당 최대·최소 헤드라인 수)
+CRAWL_PAGE_SIZE = 100
+CRAWL_MAX_PAGES = 5
+CRAWL_MAX_HEADLINES = 100
+CRAWL_MIN_HEADLINES = 20
+
+# OR 검색어를 단어별로 나눠 동시에 수집 (카테고리당 동시 요청 수)
+CRAWL_TERM_WORKERS = 5
+
+# 헤드라인 수 제한으로 못 쓴 기사를 다음 실행에서 다시 쓰는 기간 (시간) - 더 오래된 기사는 버림
+CRAWL_BACKLOG_HOURS = 48
+
+# 이미 처리한 기사 기록 (SQLite) / 보관 기간 (일)
+SEEN_STORE_PATH = ".cache/seen_articles.db"
+SEEN_RETENTION_DAYS = 7
+
+# 비슷한 헤드라인 묶기 (글자 3-gram 자카드 유사도 기준 / MinHash 해시 수 / LSH 밴드 수)
+DEDUP_THRESHOLD = 0.6
+DEDUP_NUM_PERM = 32
+DEDUP_BANDS = 8
+
+# 키워드 지표 기록 (SQLite, CI에서 커밋됨) / 일별 CSV 내보내기 폴더
+HISTORY_PATH = "data/history.db"
+HISTORY_CSV_DIR = "output/csv"
+
+# 키워드 추세 (계산 기간 일수 - 첫 번째가 페이지 "급상승 키워드" 기준 / 최소 관측일 / 표시 개수)
+TREND_WINDOWS = (7, 30)
+TREND_MIN_POINTS = 2
+TREND_TOP = 10
+# 추세 계산용 기록 배열 스냅샷 (다음 실행은 그 뒤에 추가된 기록만 읽음)
+TREND_SNAPSHOT_PATH = ".cache/trend_columns.npz"
+
+# 수동 분석 작업 큐 (백엔드 / 동시 실행 작업 수 / 최대 대기 작업 수 / 완료 작업 보관 초)
+JOB_BACKEND = "local"
+JOB_WORKERS = 2
+JOB_MAX_PENDING = 20
+JOB_RETENTION = 30 * 60
+
+# 외부 API 주소 - 로컬 대체 서버(fake_server.py)로 돌릴 때 환경변수로 변경
+# (OpenAI는 OPENAI_BASE_URL 사용)
+ENDPOINTS = {
+    "openapi": os.getenv("NAVER_OPENAPI_URL", "https://openapi.naver.com"),
+    "searchad": os.getenv("NAVER_SEARCHAD_URL", "https://api.naver.com"),
+    "autocomplete": os.getenv("NAVER_AC_URL", "https://mac.search.naver.com"),
+}
+
+# 실행 보고서 (단계별 시간, 엔드포인트별 호출/실패/지연, 파일 쓰기 크기)
+RUN_REPORT_PATH = "output/run_report.json"
+
+# 상세 프로파일링 (기본 끔) - PROFILE_MODE=cprofile (메인 스레드) 또는 sample (모든 스레드, 샘플 간격 초)
+PROFILE_MODE = os.getenv("PROFILE_MODE", "")
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_DIR = ".cache/profile"
+
+# 네이버 API 일일 호출 한도 (API 키별, KST 자정 초기화) - None이면 사용량만 기록
+# 검색 API는 뉴스 수집과 문서수 조회, app.py 수동 분석이 같은 키를 나눠 씀
+QUOTA_PATH = ".cache/quota.db"
+QUOTA_LIMITS = {
+    "search": 25000,
+    "keywordstool": None,
+}
+# 계열별 API 키 환경변수 (사용량은 키 해시별로 따로 기록)
+QUOTA_KEYS = {
+    "search": "NAVER_CLIENT_ID",
+    "keywordstool": "NAVER_AD_CUSTOMER_ID",
+}
+# 한도 중 app.py 몫 (비율) - 나머지는 일일 정기 실행(main.py) 몫
+# app.py(Render)와 main.py(GitHub Actions)는 사용량 파일을 공유하지 못해 서로의 사용량을 모르므로
+# 각자 자기 몫 안에서만 호출 (두 몫의 합 = 한도)
+QUOTA_APP_RESERVE = 0.2
+# main.py 실행에 필요한 최소 남은 검색 호출 수 (뉴스 수집 약 150회 + 문서수 일부) - 부족하면 기존 페이지 유지
+QUOTA_MIN_RUN = 300
+QUOTA_RETENTION_DAYS = 30
+
+# 문서수 조회 전 사전 필터 (검색량 상위 후보 수 / 카테고리당 실제 조회 수)
+# 예전 블로그 문서수(기록 저장소 + 만료된 캐시)로 포화도 하한을 추정해 기준을 넘을 후보는 조회하지 않고,
+# 비운 자리는 다음 검색량 후보로 채움
+PREFILTER_POOL = 200
+PREFILTER_SLOTS = 80
+# 예전 문서수 기준 추정 포화도가 SATURATION_THRESHOLD × 이 값을 넘으면 제외
+PREFILTER_MARGIN = 1.2
+# 예전 기록이 없으면 키워드 형태(길이/숫자/영문)별 과거 통과율이 이보다 낮을 때 제외 (표본 수 하한)
+PREFILTER_MIN_PASS_RATE = 0.08
+PREFILTER_MIN_SAMPLES = 50
+PREFILTER_HISTORY_DAYS = 30
+# 제외한 후보 중 실제로 조회해 예측을 검증하는 비율
+PREFILTER_AUDIT_RATE = 0.05
+
+# 엔드포인트별 차단기: 최근 N회 중 실패(연결 오류/시간 초과/5xx) 비율이 기준 이상이면 차단해 바로 실패 처리,
+# 차단 유지 시간이 지나면 시험 호출 몇 번으로 복구 여부 확인
+CIRCUIT_WINDOW = 20
+CIRCUIT_MIN_CALLS = 10
+CIRCUIT_FAILURE_RATE = 0.5
+CIRCUIT_COOLDOWN = 30
+CIRCUIT_HALF_OPEN_CALLS = 2
+
+# main.py 실행 제한 시간 (초) - 지나면 새 API 호출 없이 모은 결과로 페이지 생성
+RUN_DEADLINE = 20 * 60
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""오프라인 테스트용 로컬 대체 서버
+
+흉내 내는 API:
+    GET  /v1/search/{news,blog,webkr}.json   네이버 검색 (openapi.naver.com)
+    GET  /keywordstool                       네이버 검색광고 키워드 도구 (api.naver.com)
+    GET  /mobile/ac                          네이버 자동완성 (mac.search.naver.com)
+    POST /v1/chat/completions                OpenAI
+
+사용법:
+    python fake_server.py --port 8900 --latency 0.8
+    NAVER_OPENAPI_URL=http://127.0.0.1:8900 NAVER_SEARCHAD_URL=http://127.0.0.1:8900 \
+    NAVER_AC_URL=http://127.0.0.1:8900 OPENAI_BASE_URL=http://127.0.0.1:8900/v1 python main.py
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from config import ENDPOINTS
+
+# 가짜 뉴스 제목/연관 키워드 재료
+WORDS = [
+    "실적", "전망", "급등", "하락", "발표", "투자", "계약", "출시", "규제", "지원금",
+    "금리", "환율", "분양", "청약", "배터리", "반도체", "인공지능", "전기차", "보조금", "신제품",
+]
+SUFFIXES = ["주가", "전망", "뉴스", "가격", "방법", "신청", "조회", "후기", "계산기", "일정"]
+
+
+class FakeConfig:
+    """응답 지연 / 에러 비율 / 429 비율 설정 + 엔드포인트별 호출 수"""
+
+    def __init__(self, latency=0.5, error_rate=0.0, throttle_rate=0.0, related_per_hint=20):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.related_per_hint = related_per_hint
+        self.calls = 0
+        self.endpoint_calls = {}
+        self.lock = threading.Lock()
+
+
+def seeded(*parts):
+    """입력이 같으면 같은 값이 나오는 난수 생성기"""
+    return random.Random(zlib.crc32("|".join(map(str, parts)).encode("utf-8")))
+
+
+def fake_news(query, start, display):
+    """검색어별로 항상 같은 가짜 뉴스 목록"""
+    items = []
+    for i in range(start, start + display):
+        rng = seeded("news", query, i)
+        words = rng.sample(WORDS, 4)
+        items.append({
+            "title": f"<b>{query}</b> {words[0]} {words[1]}... {words[2]} {words[3]} 주목",
+            "originallink": f"https://news.example.com/{zlib.crc32(query.encode('utf-8'))}/{i}",
+            "link": f"https://n.news.naver.com/fake/{i}",
+            "description": "",
+            "pubDate": time.strftime("%a, %d %b %Y %H:%M:%S +0900"),
+        })
+    return items
+
+
+def fake_total(kind, query):
+    """문서 수 (블로그 < 뉴스 < 웹문서 규모)"""
+    scale = {"blog": 50000, "news": 20000, "webkr": 2000000}[kind]
+    return seeded(kind, query).randint(0, scale)
+
+
+def fake_keywordstool(hints, related_per_hint):
+    """힌트별 자기 자신 + 연관 키워드 검색량"""
+    rows = []
+    for hint in hints:
+        rng = seeded("volume", hint)
+        related = [hint] + [hint + suffix for suffix in rng.sample(SUFFIXES, min(len(SUFFIXES), related_per_hint - 1))]
+        related += [f"{hint}{rng.choice(WORDS)}{n}" for n in range(max(0, related_per_hint - 1 - len(SUFFIXES)))]
+        for keyword in related:
+            pc = rng.randint(0, 30000)
+            rows.append({
+                "relKeyword": keyword,
+                "monthlyPcQcCnt": "< 10" if pc < 50 else pc,
+                "monthlyMobileQcCnt": rng.randint(0, 90000),
+            })
+    return rows
+
+
+def fake_completion(prompt):
+    """프롬프트의 번호별 헤드라인에서 2글자 이상 단어를 키워드로 돌려줌"""
+    lines = []
+    for match in re.finditer(r"^(\d+)\. (.+)$", prompt, re.MULTILINE):
+        words = [w for w in re.split(r"[^\w]+", match.group(2)) if len(w) >= 2]
+        lines.append(f"{match.group(1)}: {', '.join(words[:6])}")
+    return "\n".join(lines)
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    config = FakeConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def simulate(self, endpoint):
+        """지연 + 429/500 흉내 - 정상 처리하면 True"""
+        config = self.config
+        with config.lock:
+            config.calls += 1
+            config.endpoint_calls[endpoint] = config.endpoint_calls.get(endpoint, 0) + 1
+
+        time.sleep(config.latency)
+
+        roll = random.random()
+        if roll < config.throttle_rate:
+            self.send_json(429, {"error": {"message": "rate limit"}}, {"Retry-After": "1"})
+            return False
+        if roll < config.throttle_rate + config.error_rate:
+            self.send_json(500, {"error": {"message": "fake server error"}})
+            return False
+        return True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        match = re.fullmatch(r"/v1/search/(news|blog|webkr)\.json", url.path)
+        if match:
+            kind = match.group(1)
+            if not self.simulate(kind):
+                return
+            query = params.get("query", "")
+            display = int(params.get("display", 10))
+            start = int(params.get("start", 1))
+            items = fake_news(query, start, display) if kind == "news" else []
+            self.send_json(200, {"total": fake_total(kind, query), "start": start, "display": display, "items": items})
+            return
+
+        if url.path == "/keywordstool":
+            if not self.simulate("keywordstool"):
+                return
+            hints = [hint for hint in params.get("hintKeywords", "").split(",") if hint]
+            self.send_json(200, {"keywordList": fake_keywordstool(hints, self.config.related_per_hint)})
+            return
+
+        if url.path == "/mobile/ac":
+            if not self.simulate("autocomplete"):
+                return
+            query = params.get("q", "")
+            rng = seeded("ac", query)
+            items = [[f"{query} {suffix}"] for suffix in rng.sample(SUFFIXES, 8)]
+            self.send_json(200, {"query": [query], "items": [items]})
+            return
+
+        self.send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+
+        if not self.path.endswith("/chat/completions"):
+            self.send_json(404, {"error": {"message": "not found"}})
+            return
+        if not self.simulate("chat"):
+            return
+
+        prompt = payload.get("messages", [{}])[-1].get("content", "")
+        content = fake_completion(prompt)
+        self.send_json(200, {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "gpt-4o-mini"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": len(prompt) // 2,
+                "completion_tokens": len(content) // 2,
+                "total_tokens": (len(prompt) + len(content)) // 2,
+            },
+        })
+
+
+def start(port=0, **options):
+    """백그라운드 스레드로 서버 시작 → (server, base_url) - 설정은 server.config"""
+    config = FakeConfig(**options)
+    handler = type("Handler", (FakeHandler,), {"config": config})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.config = config
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def redirect(base_url):
+    """이 프로세스의 네이버/OpenAI 호출을 대체 서버로 돌림
+
+    .env의 실제 키가 이미 읽혔어도 가짜 키로 덮어쓴다 (실제 키의 일일 한도를 쓰지 않도록).
+    """
+    ENDPOINTS.update(openapi=base_url, searchad=base_url, autocomplete=base_url)
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    for name in ("OPENAI_API_KEY", "NAVER_CLIENT_ID", "NAVER_CLIENT_SECRET",
+                 "NAVER_AD_CUSTOMER_ID", "NAVER_AD_CLIENT_ID", "NAVER_AD_CLIENT_SECRET"):
+        os.environ[name] = "fake"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 대체 서버")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, base_url = start(
+        args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+    )
+    print(f"🧪 대체 서버 실행 중: {base_url}")
+    print(f"   NAVER_OPENAPI_URL={base_url}")
+    print(f"   NAVER_SEARCHAD_URL={base_url}")
+    print(f"   NAVER_AC_URL={base_url}")
+    print(f"   OPENAI_BASE_URL={base_url}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,94 +4,198 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from config import NEWS_CATEGORIES, KEYWORDS_PER_CATEGORY
-from src import news_crawler, analyzer, naver_api, builder
+from config import NEWS_CATEGORIES, KEYWORDS_PER_CATEGORY, PIPELINE_WORKERS, RUN_REPORT_PATH, PROFILE_DIR, QUOTA_MIN_RUN, RUN_DEADLINE
+from src import news_crawler, analyzer, builder, cache, http_client, history_store, trends, profiler, rate_limiter, quota, naver_api, prefilter, circuit_breaker
+from src.pipeline import run_pipeline
+from src.keyword_registry import KeywordRegistry
+
+
+def crawl_stage(category_id, category_info):
+    """1. 뉴스 API 호출"""
+    print(f"\n  {category_info['icon']} [{category_info['name']}] [1/4] 뉴스 수집 중...")
+    headlines = news_crawler.crawl_news(category_id, category_info['query'])
+
+    if not headlines:
+        print(f"    ⚠️ [{category_info['name']}] 뉴스 없음, 스킵")
+        return None
+
+    print(f"    ✅ [{category_info['name']}] {len(headlines)}개 헤드라인 수집")
+    return {"info": category_info, "headlines": headlines}
+
+
+def extract_stage(category_id, state):
+    """2. AI 키워드 추출"""
+    category_info = state["info"]
+    print(f"\n  {category_info['icon']} [{category_info['name']}] [2/4] AI 키워드 추출 중...")
+    keywords = analyzer.extract_keywords(state["headlines"], category_info['name'])
+
+    if not keywords:
+        print(f"    ⚠️ [{category_info['name']}] 키워드 추출 실패, 스킵")
+        return None
+
+    state["keywords"] = keywords
+    return state
+
+
+def build_stage(category_id, state):
+    """4. 카테고리 페이지 생성"""
+    category_info = state["info"]
+    print(f"\n  {category_info['icon']} [{category_info['name']}] [4/4] 페이지 생성 중...")
+    builder.build_category_page(
+        category_id, category_info, state["results"], state["related"], rising=state["rising"]
+    )
+    return state
+
 
 def main():
+    profiler.reset()
+    # 정기 실행은 app.py 몫을 남기고 일일 한도 사용
+    quota.set_role(quota.BATCH)
     print("=" * 60)
     print("🚀 뉴스 키워드 분석 봇 (Pro Edition)")
     print("=" * 60)
-    
+
     kst = timezone(timedelta(hours=9))
     now = datetime.now(kst)
     print(f"⏰ 실행 시간: {now.strftime('%Y-%m-%d %H:%M')} KST")
     print(f"📂 카테고리: {len(NEWS_CATEGORIES)}개\n")
-    
-    all_results = {}
-    
-    for category_id, category_info in NEWS_CATEGORIES.items():
-        print(f"\n{'─'*60}")
-        print(f"{category_info['icon']} [{category_info['name']}] 처리 시작")
-        print("─" * 60)
-        
-        # 1. 뉴스 API 호출
-        print(f"\n  [1/4] 뉴스 수집 중...")
-        headlines = news_crawler.crawl_news(category_id, category_info['query'])
-        
-        if not headlines:
-            print(f"    ⚠️ 뉴스 없음, 스킵")
-            all_results[category_id] = []
-            continue
-        
-        print(f"    ✅ {len(headlines)}개 헤드라인 수집")
-        
-        # 2. AI 키워드 추출
-        print(f"\n  [2/4] AI 키워드 추출 중...")
-        keywords = analyzer.extract_keywords(headlines, category_info['name'])
-        
-        if not keywords:
-            print(f"    ⚠️ 키워드 추출 실패, 스킵")
-            all_results[category_id] = []
-            continue
-        
-        # 3. 네이버 API 분석
-        print(f"\n  [3/4] 키워드 분석 중...")
-        keyword_results = naver_api.analyze_keywords(keywords, KEYWORDS_PER_CATEGORY)
-        
-        # 연관검색어 조회 (상위 5개만)
-        related_data = []
-        for item in keyword_results[:15]:
-            related = naver_api.get_autocomplete(item['keyword'])
-            related_data.append({
-                "keyword": item['keyword'],
-                "related": related[:5]
-            })
-        
-        all_results[category_id] = keyword_results
-        
-        # 4. 카테고리 페이지 생성
-        print(f"\n  [4/4] 페이지 생성 중...")
-        builder.build_category_page(category_id, category_info, keyword_results, related_data)
-        
-        # 5. CSV에 저장
-        builder.save_to_csv(category_info['name'], keyword_results)
-    
+
+    # 남은 한도로 뉴스 수집도 못 하면 빈 페이지로 덮어쓰지 않고 종료
+    budget = quota.remaining("search")
+    if budget is not None and budget < QUOTA_MIN_RUN:
+        print(f"⚠️ 오늘 검색 API 남은 호출 {budget}회 (최소 {QUOTA_MIN_RUN}회) - 실행하지 않고 기존 페이지 유지")
+        return
+
+    # 제한 시간이 지나면 남은 API 호출은 바로 실패 (조회 못 한 키워드는 ❔로 표시)
+    # 예외로 끝나도 같은 프로세스의 다음 호출에 제한이 남지 않도록 해제
+    circuit_breaker.set_deadline(RUN_DEADLINE)
+    try:
+        run(now)
+    finally:
+        circuit_breaker.set_deadline(None)
+
+
+def run(now):
+    """1~4단계 + 통계/실행 보고서 (main이 실행 제한 시간을 건 뒤 호출)"""
+    # 1~2. 카테고리별로 수집 → 추출 단계를 겹쳐서 진행
+    stages = [
+        ("crawl", crawl_stage),
+        ("extract", extract_stage),
+    ]
+    with profiler.stage("crawl_extract"):
+        states, errors = run_pipeline(NEWS_CATEGORIES, stages, PIPELINE_WORKERS)
+    states = {category_id: state for category_id, state in states.items() if state}
+
+    # 3. 모든 카테고리 키워드를 모아 고유 키워드만 네이버 API로 분석
+    print(f"\n{'─'*60}")
+    print(f"📊 [3/4] 키워드 분석 중 ({len(states)}개 카테고리 통합)...")
+    print("─" * 60)
+    registry = KeywordRegistry()
+    for category_id, state in states.items():
+        registry.add(category_id, state["keywords"])
+
+    # 이번 실행 결과를 쓰는 곳(페이지/CSV/기록)에 필요한 지표만 조회
+    metrics = naver_api.required_metrics(("page", "csv", "history"))
+    with profiler.stage("analyze"):
+        analyzed = registry.analyze(KEYWORDS_PER_CATEGORY, metrics)
+    with profiler.stage("related"):
+        related = registry.fetch_related(analyzed)
+
+    # 이번 실행 결과를 기록 저장소에 한 번에 저장한 뒤 추세 계산
+    history = history_store.get_store()
+    run_ts = now.strftime("%Y-%m-%d %H:%M")
+    with profiler.stage("history"):
+        for category_id, state in states.items():
+            history.record(category_id, analyzed[category_id], ts=run_ts)
+        saved = history.flush()
+    with profiler.stage("trends"):
+        rising = trends.rising_by_category(NEWS_CATEGORIES)
+
+    for category_id, state in states.items():
+        state["results"] = analyzed[category_id]
+        state["related"] = related[category_id]
+        state["rising"] = rising[category_id]
+        unknown = sum(1 for item in state["results"] if item["blog_count"] is None)
+        # 문서수를 하나라도 얻었으면 이번 기사는 본 것으로 기록 (모두 실패했으면 다음 실행에서 다시 수집)
+        if unknown < len(state["results"]):
+            news_crawler.commit(category_id)
+        note = f" (문서수 조회 실패 {unknown}개)" if unknown else ""
+        print(f"    ✅ [{state['info']['name']}] {len(state['results'])}개 키워드 분석 완료{note}")
+
+    # 4. 카테고리 페이지 생성
+    with profiler.stage("build_categories"):
+        built, build_errors = run_pipeline(states, [("build", build_stage)], PIPELINE_WORKERS)
+    errors.update(build_errors)
+
+    for category_id, (stage, error) in errors.items():
+        print(f"    ❌ [{NEWS_CATEGORIES[category_id]['name']}] {stage} 단계 실패: {error}")
+
+    all_results = {
+        category_id: states[category_id]["results"] if built.get(category_id) else []
+        for category_id in NEWS_CATEGORIES
+    }
+
     # 메인 페이지 생성
     print(f"\n{'='*60}")
     print("📄 메인 페이지 및 아카이브 생성")
     print("=" * 60)
-    
-    builder.build_index_page(all_results)
-    builder.build_archive_page()
-    builder.build_manual_archive_page()
-    
-    builder.copy_static_files() 
-    
+
+    with profiler.stage("build_index"):
+        builder.build_index_page(all_results, rising=rising["all"])
+    with profiler.stage("build_archive"):
+        builder.build_archive_page()
+        builder.build_manual_archive_page()
+
+    builder.copy_static_files()
+
+    # 오늘 CSV를 기록 저장소에서 다시 내보내기
+    date_str = now.strftime("%Y-%m-%d")
+    with profiler.stage("export_csv"):
+        exported = history.export_daily_csv(date_str)
+        history_store.close()
+
     # 완료 요약
     print(f"\n{'='*60}")
     print("✅ 모든 작업 완료!")
     print("=" * 60)
-    
+
     total_keywords = sum(len(results) for results in all_results.values())
     print(f"📊 총 {total_keywords}개 키워드 분석됨")
-    
+
     for cat_id, results in all_results.items():
         cat_info = NEWS_CATEGORIES[cat_id]
         print(f"   {cat_info['icon']} {cat_info['name']}: {len(results)}개")
-    
-    print(f"\n📁 CSV 저장: output/history.csv")
 
+    print(f"\n📁 기록 저장: {saved}행 (output/csv/{date_str}.csv {exported}행)")
+    registry.print_report()
+    prefilter.print_stats()
+    analyzer.print_stats()
+    cache.print_stats()
+    http_client.print_stats()
+    quota.print_stats()
+    circuit_breaker.print_stats()
 
-if __name__ == "__main__":
-    main()
+    # 실행 보고서 (JSON) - 다른 통계도 함께 기록
+    cache_instance = cache.get_cache()
+    report = profiler.save_report(builder.BASE_DIR / RUN_REPORT_PATH, extra={
+        "keywords": total_keywords,
+        "errors": {category_id: stage for category_id, (stage, _) in errors.items()},
+        "registry": registry.report(),
+        "skipped_keywords": registry.skipped,
+        "quota": quota.stats(),
+        "circuits": circuit_breaker.stats(),
+        "prefilter": prefilter.stats(),
+        "analyzer": analyzer.stats(),
+        "cache": cache_instance.stats() if cache_instance is not None else None,
+        "connections": http_client.stats(),
+        "rate_limits": rate_limiter.stats(),
+    })
+    profiler.print_report(report)
+    print(f"🧾 실행 보고서: {RUN_REPORT_PATH}")
+    cache.close()
 
+
+if __name__ == "__main__":
+    # PROFILE_MODE=cprofile|sample 일 때만 상세 프로파일링
+    with profiler.deep_profile(PROFILE_DIR):
+        main()
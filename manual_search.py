@@ -4,60 +4,12 @@
 import os
 import re
 from datetime import datetime, timezone, timedelta
-from src.naver_api import get_search_volume, get_blog_count, get_autocomplete
+from src import cache, http_client
+from src.keyword_analysis import analyze_keywords, fetch_related
 from dotenv import load_dotenv
 
 load_dotenv()
 
-def analyze_keywords(keywords):
-    """키워드 분석"""
-    print(f"    🔍 {len(keywords)}개 키워드 검색량 조회 중...")
-    search_volumes = get_search_volume(keywords)
-    
-    filtered_volumes = {}
-    for kw in keywords:
-        kw_clean = kw.replace(" ", "")
-        for api_kw, volume in search_volumes.items():
-            if api_kw.replace(" ", "") == kw_clean:
-                filtered_volumes[kw] = volume
-                break
-        if kw not in filtered_volumes:
-            filtered_volumes[kw] = 0
-    
-    results = []
-    count = 0
-    for keyword, monthly in filtered_volumes.items():
-        count += 1
-        blog_count = get_blog_count(keyword)
-        
-        if monthly > 0:
-            saturation = round(blog_count / monthly, 2)
-        else:
-            saturation = 0
-        
-        if blog_count <= 1000:
-            possibility = "🟢"
-        elif blog_count <= 10000:
-            possibility = "🟡"
-        elif blog_count <= 50000:
-            possibility = "🟠"
-        else:
-            possibility = "🔴"
-        
-        results.append({
-            'keyword': keyword,
-            'monthly_search': monthly,
-            'blog_count': blog_count,
-            'saturation': saturation,
-            'possibility': possibility
-        })
-        
-        if count % 10 == 0:
-            print(f"    ⏳ {count}개 분석 중...")
-    
-    return sorted(results, key=lambda x: x['blog_count'])
-
-
 def save_to_pending(title, results, related_data):
     """pending 폴더에 저장 (push 안 함)"""
     
@@ -85,8 +37,8 @@ def save_to_pending(title, results, related_data):
             <td>{idx}</td>
             <td><strong>{keyword}</strong></td>
             <td>{item['monthly_search']:,}</td>
-            <td>{item['blog_count']:,}</td>
-            <td>{item['saturation']}</td>
+            <td>{'-' if item['blog_count'] is None else f"{item['blog_count']:,}"}</td>
+            <td>{'-' if item['saturation'] is None else item['saturation']}</td>
             <td>{item['possibility']}</td>
             <td><a href="{naver_url}" target="_blank" class="search-link">🔍</a></td>
         </tr>"""
@@ -214,13 +166,7 @@ def main():
     
     # 연관검색어
     print(f"\n🔗 연관검색어 조회 중...")
-    related_data = []
-    for item in results[:10]:
-        related = get_autocomplete(item['keyword'])
-        related_data.append({
-            'keyword': item['keyword'],
-            'related': related[:5]
-        })
+    related_data = fetch_related(results)
     
     # 저장
     title = ", ".join(keywords[:2]) if keywords else "수동분석"
@@ -229,6 +175,8 @@ def main():
     print(f"\n{'=' * 60}")
     print(f"✅ 분석 완료! {len(results)}개 키워드")
     print(f"📁 저장 위치: {filepath}")
+    cache.print_stats()
+    http_client.print_stats()
     print(f"{'=' * 60}")
     print(f"\n💡 나중에 push하려면:")
     print(f"   python publish_pending.py")
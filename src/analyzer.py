@@ -1,22 +1,57 @@
 import os
+import re
 import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 
-def extract_keywords(headlines, category_name=""):
-    """OpenAI GPT로 키워드 추출"""
-    
-    print("    🧠 AI 분석 중...")
-    
+from config import EXTRACTOR_MODE
+from src import rate_limiter, local_extractor, profiler, circuit_breaker
+from src.cache import get_cache
+
+# 프로세스 공용 OpenAI 클라이언트 (httpx 커넥션 풀 재사용, 스레드 안전)
+_client = None
+_client_lock = threading.Lock()
+
+# 실행 중 LLM 캐시 통계
+_stats = {"headlines": 0, "cached": 0, "tokens_used": 0, "tokens_saved": 0}
+_stats_lock = threading.Lock()
+
+# 실행 보고서의 OpenAI 엔드포인트 이름
+OPENAI_ENDPOINT = "openai/chat.completions"
+
+
+def get_client():
+    """공용 OpenAI 클라이언트 - OPENAI_BASE_URL로 로컬 대체 서버 지정 가능"""
+    global _client
+
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        print("    ❌ OPENAI_API_KEY 없음")
-        return []
-    
-    client = OpenAI(api_key=api_key)
-    
-    headlines_text = "\n".join([f"- {h}" for h in headlines])
-    
-    prompt = f"""다음은 [{category_name}] 관련 뉴스 헤드라인입니다:
+        return None
+
+    with _client_lock:
+        if _client is None:
+            # 재시도는 rate_limiter 백오프가 담당하므로 SDK 자체 재시도는 끔
+            _client = OpenAI(
+                api_key=api_key,
+                base_url=os.getenv("OPENAI_BASE_URL") or None,
+                max_retries=0,
+            )
+    return _client
+
+
+def headline_key(headline, category_name=""):
+    """헤드라인 캐시 키 (카테고리 + 공백 정리한 제목의 해시)"""
+    text = f"{category_name}\n{' '.join(headline.split())}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def build_prompt(headlines, category_name=""):
+    """번호별 키워드를 돌려받는 추출 프롬프트"""
+    headlines_text = "\n".join([f"{i}. {h}" for i, h in enumerate(headlines, 1)])
+
+    return f"""다음은 [{category_name}] 관련 뉴스 헤드라인입니다:
 
 {headlines_text}
 
@@ -32,40 +67,231 @@ def extract_keywords(headlines, category_name=""):
    - 복합키워드: 전기차보조금, 청년주택청약, 코스피전망
    - 이슈키워드: 금리인하, 부동산대책
 5. 비슷한 키워드도 다른 형태로 포함 (예: 삼성전자, 삼성전자주가, 삼성전자전망)
-6. 최소 50개 이상의 키워드 추출
-7. 키워드만 쉼표로 구분하여 출력 (설명 없이)
+6. 헤드라인 번호별로 한 줄씩, 키워드만 쉼표로 구분하여 출력 (설명 없이)
+
+응답 형식:
+1: 키워드1, 키워드2, 키워드3
+2: 키워드1, 키워드2, 키워드3
+..."""
+
 
-응답 형식: 키워드1, 키워드2, 키워드3, ..."""
+def clean_keywords(raw_keywords):
+    """공백 제거 + 2글자 미만 제외 + 중복 제거"""
+    keywords = [kw.strip().replace(" ", "") for kw in raw_keywords]
+    keywords = [kw for kw in keywords if len(kw) >= 2]
+    return list(dict.fromkeys(keywords))
+
+
+def parse_numbered(result, count):
+    """'번호: 키워드, ...' 응답 → {헤드라인 인덱스: [키워드]}"""
+    parsed = {}
+    for line in result.splitlines():
+        match = re.match(r"^\s*(\d+)\s*[:.)]\s*(.+)$", line)
+        if not match:
+            continue
+        index = int(match.group(1)) - 1
+        if 0 <= index < count:
+            parsed[index] = clean_keywords(match.group(2).split(","))
+    return parsed
+
+
+@profiler.timed
+def request_keywords(headlines, category_name=""):
+    """새 헤드라인만 모델에 요청 → ({인덱스: [키워드]}, 사용 토큰 수), 실패 시 (None, 0)"""
+
+    client = get_client()
+    if client is None:
+        print("    ❌ OPENAI_API_KEY 없음")
+        return None, 0
+
+    prompt = build_prompt(headlines, category_name)
 
     max_retries = 3
-    
+
     for attempt in range(max_retries):
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2048
-            )
-            
+            # 실행 제한 시간이 지났으면 바로 실패 → 로컬 추출로 대체
+            timeout = circuit_breaker.remaining_time()
+            rate_limiter.acquire("openai")
+            start = time.perf_counter()
+            try:
+                response = client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=2048,
+                    timeout=timeout
+                )
+            except Exception as e:
+                profiler.record_call(OPENAI_ENDPOINT, time.perf_counter() - start, error=e)
+                raise
+            profiler.record_call(OPENAI_ENDPOINT, time.perf_counter() - start, status=200)
+
             result = response.choices[0].message.content
-            
-            keywords = [kw.strip().replace(" ", "") for kw in result.split(",")]
-            keywords = [kw for kw in keywords if len(kw) >= 2]
-            keywords = list(dict.fromkeys(keywords))
-            
-            print(f"    ✅ {len(keywords)}개 키워드 추출")
-            return keywords
-            
+            usage = getattr(response, "usage", None)
+            tokens = getattr(usage, "total_tokens", 0) or 0
+
+            parsed = parse_numbered(result, len(headlines))
+            if not parsed:
+                # 번호 형식을 따르지 않은 응답은 전체를 첫 헤드라인 묶음으로 취급 (캐시하지 않음)
+                return {None: clean_keywords(result.replace("\n", ",").split(","))}, tokens
+            return parsed, tokens
+
         except Exception as e:
             error_str = str(e)
             print(f"    ⚠️ 에러: {error_str[:100]}")
-            
-            if "429" in error_str or "rate" in error_str.lower():
-                wait_time = (attempt + 1) * 10
-                print(f"    ⏳ {wait_time}초 대기 후 재시도...")
+
+            status = getattr(e, "status_code", None)
+            throttled = status == 429 or "429" in error_str or "rate" in error_str.lower()
+
+            if throttled or (status is not None and status >= 500):
+                if attempt == max_retries - 1:
+                    break
+                response_obj = getattr(e, "response", None)
+                retry_after = response_obj.headers.get("Retry-After") if response_obj is not None else None
+                wait_time = rate_limiter.backoff("openai", attempt, throttled=throttled, retry_after=retry_after)
+                print(f"    ⏳ {wait_time:.1f}초 대기 후 재시도...")
                 time.sleep(wait_time)
             else:
-                return []
-    
+                return None, 0
+
     print("    ❌ 최대 재시도 초과")
-    return []
+    return None, 0
+
+
+@profiler.timed
+def extract_keywords(headlines, category_name="", mode=None):
+    """키워드 추출 - EXTRACTOR_MODE에 따라 LLM / 로컬 / LLM 실패 시 로컬"""
+
+    mode = mode or EXTRACTOR_MODE
+
+    if mode == "local":
+        keywords = extract_keywords_local(headlines)
+    else:
+        keywords = extract_keywords_llm(headlines, category_name)
+        if not keywords and mode == "llm_fallback":
+            print("    🔁 로컬 추출기로 대체")
+            keywords = extract_keywords_local(headlines)
+
+    # 다음 실행의 IDF 계산을 위해 헤드라인 누적
+    local_extractor.remember(headlines)
+    return keywords
+
+
+@profiler.timed
+def extract_keywords_local(headlines):
+    """로컬 TF-IDF 키워드 추출"""
+    start = time.perf_counter()
+    keywords = local_extractor.extract_keywords(headlines)
+    print(f"    ✅ {len(keywords)}개 키워드 추출 (로컬, {(time.perf_counter() - start) * 1000:.0f}ms)")
+    return keywords
+
+
+def rank_keywords(groups):
+    """헤드라인별 키워드 목록 → 한 줄 순위 (뒤에서 잘려도 앞쪽 헤드라인만 남지 않도록)
+
+    언급된 헤드라인 수가 많은 순, 같으면 헤드라인 안 순서 → 헤드라인 순서 (번갈아 가며).
+    """
+    ranked = {}     # {키: [헤드라인 수, 처음 나온 위치, 처음 나온 헤드라인, 키워드]}
+    for headline_index, keywords in enumerate(groups):
+        counted = set()
+        for position, keyword in enumerate(keywords):
+            key = keyword.replace(" ", "")
+            if key in counted:
+                continue
+            counted.add(key)
+            if key in ranked:
+                ranked[key][0] += 1
+            else:
+                ranked[key] = [1, position, headline_index, keyword]
+    ordered = sorted(ranked.values(), key=lambda item: (-item[0], item[1], item[2]))
+    return [item[3] for item in ordered]
+
+
+@profiler.timed
+def extract_keywords_llm(headlines, category_name=""):
+    """OpenAI GPT로 키워드 추출 (이전에 본 헤드라인은 캐시 재사용)"""
+
+    print("    🧠 AI 분석 중...")
+
+    cache = get_cache()
+    keys = [headline_key(h, category_name) for h in headlines]
+
+    cached = {}
+    if cache is not None:
+        for key in keys:
+            value = cache.get("llm_keywords", key)
+            if value is not None:
+                cached[key] = value
+
+    new_headlines = [h for h, key in zip(headlines, keys) if key not in cached]
+    saved_tokens = sum(item["tokens"] for item in cached.values())
+
+    if cached:
+        print(f"    ♻️ {len(cached)}개 헤드라인 캐시 재사용, {len(new_headlines)}개만 요청")
+
+    fresh = {}
+    tokens = 0
+    if new_headlines:
+        parsed, tokens = request_keywords(new_headlines, category_name)
+        if parsed is None:
+            if not cached:
+                return []
+            parsed = {}
+
+        per_headline = tokens // len(new_headlines) if new_headlines else 0
+        new_keys = [headline_key(h, category_name) for h in new_headlines]
+        for index, keywords in parsed.items():
+            if index is None:
+                fresh[None] = keywords
+                continue
+            item = {"headline": new_headlines[index], "keywords": keywords, "tokens": per_headline}
+            fresh[new_keys[index]] = item
+            if cache is not None:
+                cache.set("llm_keywords", new_keys[index], item)
+
+    # 여러 헤드라인에 나온 키워드부터, 같으면 헤드라인을 번갈아 가며 합치기
+    groups = []
+    for key in keys:
+        item = cached.get(key) or fresh.get(key)
+        if item:
+            groups.append(item["keywords"])
+    if fresh.get(None):
+        groups.append(fresh[None])
+    keywords = rank_keywords(groups)
+
+    with _stats_lock:
+        _stats["headlines"] += len(headlines)
+        _stats["cached"] += len(cached)
+        _stats["tokens_used"] += tokens
+        _stats["tokens_saved"] += saved_tokens
+
+    print(f"    ✅ {len(keywords)}개 키워드 추출")
+    return keywords
+
+
+def extract_all(jobs, max_workers=None):
+    """여러 카테고리 동시 추출 - jobs: {키: (헤드라인, 카테고리명)} → {키: [키워드]}"""
+    if not jobs:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(jobs)) as executor:
+        futures = {
+            key: executor.submit(extract_keywords, headlines, category_name)
+            for key, (headlines, category_name) in jobs.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+def stats():
+    """헤드라인 캐시 적중 수 / 사용·절약 토큰 수"""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def print_stats():
+    """LLM 캐시 통계 출력"""
+    item = stats()
+    if not item["headlines"]:
+        return
+    print(f"🧠 LLM: 헤드라인 {item['headlines']}개 중 {item['cached']}개 캐시 재사용 "
+          f"(토큰 {item['tokens_used']:,}개 사용 / 약 {item['tokens_saved']:,}개 절약)")
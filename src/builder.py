@@ -1,10 +1,13 @@
 import os
 import shutil
-import csv
+import json
+import hashlib
+import threading
 
 from datetime import datetime, timezone, timedelta
-from config import NEWS_CATEGORIES, SATURATION_THRESHOLD
+from config import NEWS_CATEGORIES, SATURATION_THRESHOLD, ARCHIVE_MANIFEST_PATH, TREND_WINDOWS
 from pathlib import Path
+from src import template_engine, profiler
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -12,23 +15,25 @@ def read_file(path):
     full_path = BASE_DIR / path
     with open(full_path, "r", encoding="utf-8") as f:
         return f.read()
+
+def write_file(path, html):
+    """HTML 파일 쓰기 (쓴 바이트 수는 실행 보고서에 기록)"""
+    path = Path(path)
+    data = html.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+    profiler.add_bytes(path.relative_to(BASE_DIR) if path.is_relative_to(BASE_DIR) else path, len(data))
     
 def render_page(content_template_path, context):
-    base = read_file("templates/base.html")
-    content = read_file(content_template_path)
-    for k, v in context.items():
-        token = "{{" + k + "}}"
-        content = content.replace(token, str(v))
+    # 템플릿은 프로세스당 한 번만 읽고 분해해 둔 것을 재사용
+    content = template_engine.render(content_template_path, context)
     context2 = dict(context)
     context2["content"] = content
-    for k, v in context2.items():
-        token = "{{" + k + "}}"
-        base = base.replace(token, str(v))
-    return base
+    return template_engine.render("templates/base.html", context2)
 
 def load_partials():
-    share_buttons = read_file("templates/partials/share_buttons.html")
-    share_js = read_file("templates/partials/share_buttons_js.html")
+    share_buttons = template_engine.load("templates/partials/share_buttons.html")
+    share_js = template_engine.load("templates/partials/share_buttons_js.html")
     return share_buttons, share_js
 
 def generate_nav_links(current_category=None, is_archive_detail=False):
@@ -42,13 +47,61 @@ def generate_nav_links(current_category=None, is_archive_detail=False):
     nav += '<a href="https://news-keyword-pro.onrender.com" class="nav-btn" target="_blank">🔍 수동검색</a>'
     return nav
 
-def build_category_page(category_id, category_info, keyword_results, related_data=None):
+def build_rising_section(rising, title="🚀 급상승 키워드"):
+    """최근 검색량이 늘고 있는 키워드 표 (기록이 부족하면 빈 문자열)"""
+    if not rising:
+        return ""
+
+    rows = ""
+    for idx, item in enumerate(rising, 1):
+        keyword = item["keyword"]
+        naver_url = f"https://search.naver.com/search.naver?query={keyword}"
+        trend = "📉" if item["saturation_slope"] < 0 else "📈"
+        rows += f"""
+        <tr>
+            <td>{idx}</td>
+            <td><strong>{keyword}</strong></td>
+            <td>{item['monthly_search']:,}</td>
+            <td>+{item['volume_delta']:,} ({item['volume_change']:+.0%})</td>
+            <td>{item['blog_growth']:+,.0f}/일</td>
+            <td>{trend} {item['saturation_slope']:+.3f}/일</td>
+            <td><a href="{naver_url}" target="_blank" class="analyze-btn">🔍</a></td>
+        </tr>
+        """
+
+    return f"""
+<section class="card">
+  <h2>{title}</h2>
+  <p style="color: var(--text-light); margin-bottom: 1rem; font-size: 0.9rem;">
+    최근 {TREND_WINDOWS[0]}일 기록 기준 · 검색량이 블로그 문서보다 빨리 늘어나는 키워드
+  </p>
+  <table class="keyword-table">
+    <thead>
+      <tr>
+        <th>순위</th>
+        <th>키워드</th>
+        <th>월간검색량</th>
+        <th>검색량 변화</th>
+        <th>블로그 증가</th>
+        <th>포화도 추세</th>
+        <th>검색</th>
+      </tr>
+    </thead>
+    <tbody>
+      {rows}
+    </tbody>
+  </table>
+</section>
+"""
+
+def build_category_page(category_id, category_info, keyword_results, related_data=None, rising=None):
     kst = timezone(timedelta(hours=9))
     now = datetime.now(kst)
     update_time = now.strftime("%Y년 %m월 %d일 %H시 %M분")
     date_prefix = now.strftime("%Y-%m-%d_%H-%M")
     
-    filtered_results = [r for r in keyword_results if r.get("saturation", 999999) <= SATURATION_THRESHOLD]
+    # 문서수를 모르는 키워드(포화도 None)는 표시하지 않음
+    filtered_results = [r for r in keyword_results if r.get("saturation") is not None and r["saturation"] <= SATURATION_THRESHOLD]
     
     table_rows = ""
     for idx, item in enumerate(filtered_results, 1):
@@ -103,14 +156,14 @@ def build_category_page(category_id, category_info, keyword_results, related_dat
         "nav_links": generate_nav_links(current_category=category_id, is_archive_detail=False),
         "keyword_rows": table_rows,
         "related_cards": related_cards,
+        "rising_section": build_rising_section(rising),
     }
     
     html = render_page("templates/pages/category.html", context)
     
     output_path = BASE_DIR / "output" / category_info["output"]
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    write_file(output_path, html)
     
     archive_dir = BASE_DIR / "output" / "archive"
     archive_dir.mkdir(parents=True, exist_ok=True)
@@ -121,36 +174,12 @@ def build_category_page(category_id, category_info, keyword_results, related_dat
     archive_context["nav_links"] = generate_nav_links(current_category=category_id, is_archive_detail=True)
     archive_html = render_page("templates/pages/category.html", archive_context)
     
-    with open(archive_path, "w", encoding="utf-8") as f:
-        f.write(archive_html)
+    write_file(archive_path, archive_html)
+    register_archive_file(archive_filename)
     
     print(f"    ✅ {output_path} 생성 완료 ({len(filtered_results)}개 키워드)")
 
-def save_to_csv(category_name, keyword_results):
-    kst = timezone(timedelta(hours=9))
-    now = datetime.now(kst)
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M")
-    csv_dir = "output/csv"
-    os.makedirs(csv_dir, exist_ok=True)
-    csv_path = f"{csv_dir}/{date_str}.csv"
-    file_exists = os.path.exists(csv_path)
-    with open(csv_path, 'a', newline='', encoding='utf-8-sig') as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(['시간', '카테고리', '키워드', '월간검색량', '블로그', '포화도', '난이도'])
-        for item in keyword_results:
-            writer.writerow([
-                time_str,
-                category_name,
-                item['keyword'],
-                item['monthly_search'],
-                item.get('blog_count', 0),
-                item['saturation'],
-                item['possibility']
-            ])
-
-def build_index_page(all_results):
+def build_index_page(all_results, rising=None):
     kst = timezone(timedelta(hours=9))
     now = datetime.now(kst)
     update_time = now.strftime("%Y년 %m월 %d일 %H시 %M분")
@@ -160,7 +189,7 @@ def build_index_page(all_results):
         if not results:
             continue
         cat_info = NEWS_CATEGORIES[cat_id]
-        filtered = [r for r in results if r.get("saturation", 999) <= SATURATION_THRESHOLD]
+        filtered = [r for r in results if r.get("saturation") is not None and r["saturation"] <= SATURATION_THRESHOLD]
         top_keywords = filtered[:3]
         if not top_keywords:
             continue
@@ -193,31 +222,16 @@ def build_index_page(all_results):
         "share_js": share_js,
         "nav_links": generate_nav_links(is_archive_detail=False),
         "summary_cards": summary_cards,
+        "rising_section": build_rising_section(rising),
     }
     
     html = render_page("templates/pages/index.html", context)
     
     output_path = BASE_DIR / "output" / "index.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    write_file(output_path, html)
     print("    ✅ output/index.html 생성 완료")
 
-def build_archive_page():
-    archive_dir = BASE_DIR / "output" / "archive"
-    archive_dir.mkdir(parents=True, exist_ok=True)
-    
-    files = sorted(
-        [p.name for p in archive_dir.glob("*.html") if "_manual_" not in p.name], 
-        reverse=True
-    )
-    
-    items_per_page = 50
-    total_files = len(files)
-    total_pages = (total_files + items_per_page - 1) // items_per_page
-    if total_pages == 0:
-        total_pages = 1
-    
-    ad_code = """
+ARCHIVE_AD_CODE = """
     <li style="list-style:none; text-align:center; padding: 20px; background: #f9f9f9; margin: 10px 0;">
         <ins class="adsbygoogle"
              style="display:block"
@@ -228,37 +242,133 @@ def build_archive_page():
         <script>(adsbygoogle = window.adsbygoogle || []).push({});</script>
     </li>
     """
+
+_manifest_lock = threading.Lock()
+
+def parse_archive_filename(filename):
+    """아카이브 파일명 → 매니페스트 항목 (날짜, 시간, 카테고리/키워드)"""
+    name = filename.replace(".html", "")
+    if "_manual_" in name:
+        date_time, keyword = name.split("_manual_", 1)
+        date_part, _, time_part = date_time.partition("_")
+        return {"date": date_part, "time": time_part, "keyword": keyword, "manual": True}
+    parts = name.split("_")
+    if len(parts) < 3:
+        return None
+    return {"date": parts[0], "time": parts[1], "category": parts[2], "manual": False}
+
+def load_manifest():
+    path = BASE_DIR / ARCHIVE_MANIFEST_PATH
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {"entries": {}, "pages": {}}
+
+def save_manifest(manifest):
+    path = BASE_DIR / ARCHIVE_MANIFEST_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def register_archive_file(filename):
+    """새 아카이브 파일을 매니페스트에 추가"""
+    entry = parse_archive_filename(filename)
+    if entry is None:
+        return
+    with _manifest_lock:
+        manifest = load_manifest()
+        manifest["entries"][filename] = entry
+        save_manifest(manifest)
+
+def sync_manifest(manifest):
+    """publish_pending 등 외부에서 추가/삭제된 파일을 매니페스트에 반영"""
+    archive_dir = BASE_DIR / "output" / "archive"
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    names = {name for name in os.listdir(archive_dir) if name.endswith(".html")}
+    entries = manifest["entries"]
+    
+    for name in names - entries.keys():
+        entry = parse_archive_filename(name)
+        if entry is not None:
+            entries[name] = entry
+    for name in entries.keys() - names:
+        del entries[name]
+    return manifest
+
+def page_signature(*parts):
+    """페이지 내용을 결정하는 값들의 해시"""
+    return hashlib.sha1(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def archive_page_slices(total_files, items_per_page):
+    """페이지별 (시작, 끝) 인덱스 - 오래된 쪽부터 50개씩 고정, 1페이지가 나머지 + 한 묶음(50~99개)을 가짐
+
+    새 파일이 추가되어도 2페이지 이후의 목록은 그대로이므로 1페이지만 다시 만들면 된다.
+    (1페이지가 나머지만 가지면 묶음이 바뀐 직후 1~몇 개만 보이므로 한 묶음을 더 둔다)
+    """
+    total_pages = max(1, total_files // items_per_page)
+    first_page_size = total_files - items_per_page * (total_pages - 1)
+    slices = [(0, first_page_size)]
+    for page in range(2, total_pages + 1):
+        start = first_page_size + (page - 2) * items_per_page
+        slices.append((start, start + items_per_page))
+    return slices
+
+def build_archive_page():
+    with _manifest_lock:
+        manifest = sync_manifest(load_manifest())
+    entries = manifest["entries"]
+    
+    files = sorted(
+        [name for name, entry in entries.items() if not entry["manual"]],
+        reverse=True
+    )
+    
+    items_per_page = 50
+    total_files = len(files)
+    slices = archive_page_slices(total_files, items_per_page)
+    total_pages = len(slices)
     
     kst = timezone(timedelta(hours=9))
     update_time = datetime.now(kst).strftime("%Y년 %m월 %d일 %H시 %M분")
     share_buttons, share_js = load_partials()
     
-    for page in range(1, total_pages + 1):
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
+    rebuilt = 0
+    for page, (start_idx, end_idx) in enumerate(slices, 1):
         page_files = files[start_idx:end_idx]
         
+        if page == 1:
+            output_name = "archive.html"
+        else:
+            output_name = f"archive-{page}.html"
+        output_file = BASE_DIR / "output" / output_name
+        
+        # 목록/페이지 수가 그대로인 페이지는 다시 만들지 않음 (총 개수는 1페이지에만 표시)
+        signature = page_signature(page_files, total_pages, total_files if page == 1 else None)
+        if manifest["pages"].get(output_name) == signature and output_file.exists():
+            continue
+        
         file_list = ""
         for idx, filename in enumerate(page_files, 1):
-            parts = filename.replace(".html", "").split("_")
-            if len(parts) >= 3:
-                date_part = parts[0]
-                time_part = parts[1]
-                category = parts[2]
-                
-                cat_name = category
-                for cat_id, cat_info in NEWS_CATEGORIES.items():
-                    if cat_id == category:
-                        cat_name = f"{cat_info['icon']} {cat_info['name']}"
-                        break
-                
-                try:
-                    date_obj = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H-%M")
-                    display_date = date_obj.strftime("%Y년 %m월 %d일 %H:%M")
-                except:
-                    display_date = date_part
-                
-                file_list += f"""
+            entry = entries[filename]
+            date_part = entry["date"]
+            time_part = entry["time"]
+            category = entry["category"]
+            
+            cat_name = category
+            for cat_id, cat_info in NEWS_CATEGORIES.items():
+                if cat_id == category:
+                    cat_name = f"{cat_info['icon']} {cat_info['name']}"
+                    break
+            
+            try:
+                date_obj = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H-%M")
+                display_date = date_obj.strftime("%Y년 %m월 %d일 %H:%M")
+            except:
+                display_date = date_part
+            
+            file_list += f"""
                 <li>
                     <a href="archive/{filename}">
                         <span class="archive-date">📅 {display_date}</span>
@@ -266,9 +376,9 @@ def build_archive_page():
                     </a>
                 </li>
                 """
-                
-                if idx % 5 == 0:
-                    file_list += ad_code
+            
+            if idx % 5 == 0:
+                file_list += ARCHIVE_AD_CODE
         
         pagination = '<div class="pagination">'
         if page > 1:
@@ -295,22 +405,35 @@ def build_archive_page():
             "share_buttons": share_buttons,
             "share_js": share_js,
             "nav_links": generate_nav_links(is_archive_detail=False),
-            "archive_count": str(total_files),
+            # 2페이지 이후는 새 파일이 생겨도 다시 만들지 않으므로 총 개수를 넣지 않음 (오래된 값 방지)
+            "archive_summary": f"<p>총 <strong>{total_files}</strong>개</p>" if page == 1 else "",
             "archive_list": file_list,
             "pagination": pagination,
         }
         
         html = render_page("templates/pages/archive.html", context)
         
-        if page == 1:
-            output_file = BASE_DIR / "output" / "archive.html"
-        else:
-            output_file = BASE_DIR / "output" / f"archive-{page}.html"
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html)
-    
-    print(f"    ✅ 아카이브 생성 완료 ({total_files}개, {total_pages}페이지)")
+        write_file(output_file, html)
+        manifest["pages"][output_name] = signature
+        rebuilt += 1
+    
+    # 페이지 수가 줄었으면 (페이지 나누는 방식 변경 등) 남은 뒤쪽 페이지 삭제
+    stale_pages = []
+    for path in (BASE_DIR / "output").glob("archive-*.html"):
+        number = path.stem.removeprefix("archive-")
+        if number.isdigit() and int(number) > total_pages:
+            path.unlink()
+            stale_pages.append(path.name)
+    
+    with _manifest_lock:
+        saved = load_manifest()
+        saved["entries"] = entries
+        saved["pages"].update(manifest["pages"])
+        for name in stale_pages:
+            saved["pages"].pop(name, None)
+        save_manifest(saved)
+    
+    print(f"    ✅ 아카이브 생성 완료 ({total_files}개, {total_pages}페이지, {rebuilt}페이지 갱신)")
 
 def copy_static_files():
     output_dir = BASE_DIR / "output"
@@ -324,40 +447,32 @@ def copy_static_files():
     print(f"    ✅ service-worker 복사 완료: {dst_sw}")
 
 def build_manual_archive_page():
-    archive_dir = "output/archive"
-    os.makedirs(archive_dir, exist_ok=True)
+    with _manifest_lock:
+        manifest = sync_manifest(load_manifest())
+    entries = manifest["entries"]
     
     files = sorted(
-        [f for f in os.listdir(archive_dir) if f.endswith(".html") and "_manual_" in f],
+        [name for name, entry in entries.items() if entry["manual"]],
         reverse=True
     )
     
     total_files = len(files)
     
+    output_path = BASE_DIR / "output" / "manual-archive.html"
+    signature = page_signature(files)
+    if manifest["pages"].get("manual-archive.html") == signature and output_path.exists():
+        print(f"    ✅ 수동 아카이브 변경 없음 ({total_files}개)")
+        return
+    
     manual_list = ""
-    ad_code = """
-    <li style="list-style:none; text-align:center; padding: 20px; background: #f9f9f9; margin: 10px 0;">
-        <ins class="adsbygoogle"
-             style="display:block"
-             data-ad-client="ca-pub-6677996696534146"
-             data-ad-slot="4514938349"
-             data-ad-format="auto"
-             data-full-width-responsive="true"></ins>
-        <script>(adsbygoogle = window.adsbygoogle || []).push({});</script>
-    </li>
-    """
     
     for idx, filename in enumerate(files, 1):
-        parts = filename.replace(".html", "").split("_manual_")
-        if len(parts) < 2:
-            continue
-        
-        date_time = parts[0]
-        keyword = parts[1]
+        entry = entries[filename]
+        keyword = entry["keyword"]
+        date_time = f"{entry['date']}_{entry['time']}"
         
         try:
-            date_part, time_part = date_time.split("_")
-            date_obj = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H-%M")
+            date_obj = datetime.strptime(f"{entry['date']} {entry['time']}", "%Y-%m-%d %H-%M")
             display_date = date_obj.strftime("%Y년 %m월 %d일 %H:%M")
         except:
             display_date = date_time
@@ -372,7 +487,7 @@ def build_manual_archive_page():
         """
         
         if idx % 5 == 0:
-            manual_list += ad_code
+            manual_list += ARCHIVE_AD_CODE
     
     kst = timezone(timedelta(hours=9))
     update_time = datetime.now(kst).strftime("%Y년 %m월 %d일 %H시 %M분")
@@ -395,8 +510,12 @@ def build_manual_archive_page():
     
     html = render_page("templates/pages/manual_archive.html", context)
     
-    output_path = BASE_DIR / "output" / "manual-archive.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    write_file(output_path, html)
+    
+    with _manifest_lock:
+        saved = load_manifest()
+        saved["entries"] = entries
+        saved["pages"]["manual-archive.html"] = signature
+        save_manifest(saved)
     
     print(f"    ✅ 수동 아카이브 생성 완료 ({total_files}개)")
@@ -0,0 +1,218 @@
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+from config import CACHE_ENABLED, CACHE_PATH, CACHE_TTL, CACHE_MAX_ENTRIES, CACHE_STALE_KEEP
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# 용량 초과 정리는 쓰기 N회마다 한 번씩만 수행
+EVICT_EVERY = 100
+
+# 적중 시 마지막 사용 시각(LRU 기준)은 모아 두었다가 N개마다 한 번에 저장 (close 때도 저장)
+ACCESS_FLUSH_EVERY = 100
+
+
+def normalize_keyword(keyword):
+    """캐시 키용 키워드 정규화 (NFC + 공백 정리 + 소문자)"""
+    keyword = unicodedata.normalize("NFC", str(keyword))
+    return " ".join(keyword.split()).lower()
+
+
+class KeywordCache:
+    """키워드 지표 디스크 캐시 (SQLite, 지표별 TTL + LRU 용량 제한)"""
+
+    def __init__(self, path, ttls, max_entries, stale_keep=CACHE_STALE_KEEP):
+        self.path = Path(path)
+        self.ttls = ttls
+        self.max_entries = max_entries
+        self.stale_keep = stale_keep
+        self.hits = {}
+        self.misses = {}
+        self._writes = 0
+        self._accessed = {}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS metrics (
+                metric TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (metric, keyword)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_accessed ON metrics (accessed)")
+        self._conn.commit()
+
+    def get(self, metric, keyword):
+        """캐시 조회 - 없거나 만료되면 None"""
+        key = normalize_keyword(keyword)
+        ttl = self.ttls.get(metric, 0)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM metrics WHERE metric = ? AND keyword = ?",
+                (metric, key)
+            ).fetchone()
+
+            if row is None or now - row[1] > ttl:
+                self.misses[metric] = self.misses.get(metric, 0) + 1
+                return None
+
+            # 적중마다 쓰기 트랜잭션을 열지 않도록 사용 시각은 모아서 저장
+            self._accessed[(metric, key)] = now
+            if len(self._accessed) >= ACCESS_FLUSH_EVERY:
+                self._flush_accessed()
+                self._conn.commit()
+            self.hits[metric] = self.hits.get(metric, 0) + 1
+
+        return json.loads(row[0])
+
+    def set(self, metric, keyword, value):
+        """캐시 저장"""
+        key = normalize_keyword(keyword)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metrics (metric, keyword, value, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (metric, key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._writes += 1
+            if self._writes % EVICT_EVERY == 0:
+                # 오래 안 쓴 순서가 정확하도록 모아 둔 사용 시각을 먼저 저장
+                self._flush_accessed()
+                self._evict()
+            self._conn.commit()
+
+    def items(self, metric):
+        """지표의 유효한 (키, 값) 전체 - 통계에는 반영하지 않음"""
+        ttl = self.ttls.get(metric, 0)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT keyword, value FROM metrics WHERE metric = ? AND created >= ?",
+                (metric, time.time() - ttl)
+            ).fetchall()
+        return [(keyword, json.loads(value)) for keyword, value in rows]
+
+    def peek(self, metric, keywords):
+        """만료 여부와 관계없이 저장된 값 {정규화 키: 값} - 추정용, 통계에는 반영하지 않음"""
+        keys = list({normalize_keyword(kw) for kw in keywords})
+        values = {}
+        with self._lock:
+            # SQLite 변수 개수 제한 때문에 나눠서 조회
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i+500]
+                rows = self._conn.execute(
+                    f"SELECT keyword, value FROM metrics WHERE metric = ? AND keyword IN ({','.join('?' * len(chunk))})",
+                    [metric, *chunk]
+                ).fetchall()
+                values.update((keyword, json.loads(value)) for keyword, value in rows)
+        return values
+
+    def _flush_accessed(self):
+        """모아 둔 사용 시각 저장 (호출하는 쪽에서 lock + commit)"""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE metrics SET accessed = ? WHERE metric = ? AND keyword = ?",
+                [(accessed, metric, key) for (metric, key), accessed in self._accessed.items()]
+            )
+            self._accessed = {}
+
+    def _evict(self):
+        """만료 후 stale_keep까지 지난 항목 삭제 후, 최대 개수 초과분은 오래 안 쓴 순으로 삭제
+
+        만료 직후 값은 peek()용으로 남겨 둔다 (get()에서는 이미 미스).
+        """
+        now = time.time()
+        for metric, ttl in self.ttls.items():
+            self._conn.execute(
+                "DELETE FROM metrics WHERE metric = ? AND created < ?",
+                (metric, now - ttl - self.stale_keep)
+            )
+
+        count = self._conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM metrics WHERE rowid IN "
+                "(SELECT rowid FROM metrics ORDER BY accessed LIMIT ?)",
+                (overflow,)
+            )
+
+    def stats(self):
+        """지표별 적중/미스 통계"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+
+        metrics = {}
+        for metric in sorted(set(self.hits) | set(self.misses)):
+            hits = self.hits.get(metric, 0)
+            misses = self.misses.get(metric, 0)
+            metrics[metric] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0,
+            }
+
+        return {
+            "entries": entries,
+            "hits": sum(self.hits.values()),
+            "misses": sum(self.misses.values()),
+            "metrics": metrics,
+        }
+
+    def close(self):
+        """모아 둔 사용 시각을 저장하고 닫기"""
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+            self._conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """프로세스 공용 캐시 (비활성화 시 None)"""
+    global _cache
+
+    if not CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = KeywordCache(BASE_DIR / CACHE_PATH, CACHE_TTL, CACHE_MAX_ENTRIES)
+    return _cache
+
+
+def close():
+    """공용 캐시 닫기 (모아 둔 사용 시각 저장)"""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+def print_stats():
+    """캐시 통계 출력"""
+    cache = get_cache()
+    if cache is None:
+        return
+
+    stats = cache.stats()
+    print(f"💾 캐시: 적중 {stats['hits']}회 / 미스 {stats['misses']}회 (저장 {stats['entries']}개)")
+    for metric, item in stats["metrics"].items():
+        print(f"   • {metric}: {item['hits']}/{item['hits'] + item['misses']} ({item['hit_rate']:.0%})")
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import deque
+
+from config import CIRCUIT_WINDOW, CIRCUIT_MIN_CALLS, CIRCUIT_FAILURE_RATE, CIRCUIT_COOLDOWN, CIRCUIT_HALF_OPEN_CALLS
+
+# 차단기 상태
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class FastFail(Exception):
+    """요청을 보내지 않고 바로 실패 (차단 중이거나 실행 제한 시간 초과)"""
+
+
+class CircuitOpen(FastFail):
+    """엔드포인트 차단 중"""
+
+
+class DeadlineExceeded(FastFail):
+    """실행 제한 시간 초과"""
+
+
+class CircuitBreaker:
+    """엔드포인트 하나의 차단기 (최근 호출 실패율 기준 closed → open → half_open → closed)"""
+
+    def __init__(self, name, window=CIRCUIT_WINDOW, min_calls=CIRCUIT_MIN_CALLS,
+                 failure_rate=CIRCUIT_FAILURE_RATE, cooldown=CIRCUIT_COOLDOWN, half_open_calls=CIRCUIT_HALF_OPEN_CALLS):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.cooldown = cooldown
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window)    # 최근 호출 성공 여부
+        self.opened_at = 0.0
+        self.probes = 0         # half_open에서 보낸 시험 호출 수
+        self.probe_successes = 0
+        self.opened = 0         # 차단된 횟수
+        self.rejected = 0       # 차단으로 보내지 않은 요청 수
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되는지 확인 - 차단 중이면 CircuitOpen"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown:
+                    self.rejected += 1
+                    raise CircuitOpen(f"{self.name} 차단 중")
+                self.state = HALF_OPEN
+                self.probes = 0
+                self.probe_successes = 0
+
+            if self.state == HALF_OPEN:
+                if self.probes >= self.half_open_calls:
+                    self.rejected += 1
+                    raise CircuitOpen(f"{self.name} 복구 확인 중")
+                self.probes += 1
+
+    def cancel(self):
+        """allow() 후 요청을 보내지 않았을 때 시험 호출 자리 반납"""
+        with self._lock:
+            if self.state == HALF_OPEN and self.probes > 0:
+                self.probes -= 1
+
+    def record(self, success):
+        """요청 결과 반영"""
+        with self._lock:
+            if self.state == OPEN:
+                # 차단 전에 보낸 요청의 늦은 결과는 무시
+                return
+            if self.state == HALF_OPEN:
+                if not success:
+                    self._open()
+                    return
+                self.probe_successes += 1
+                if self.probe_successes >= self.half_open_calls:
+                    self.state = CLOSED
+                    self.outcomes.clear()
+                return
+
+            self.outcomes.append(success)
+            failures = self.outcomes.count(False)
+            if (self.state == CLOSED and len(self.outcomes) >= self.min_calls
+                    and failures / len(self.outcomes) >= self.failure_rate):
+                self._open()
+
+    def _open(self):
+        """차단 (lock 안에서 호출)"""
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.opened += 1
+        self.outcomes.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "recent_failures": self.outcomes.count(False),
+                "recent_calls": len(self.outcomes),
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+_deadline = None
+
+
+def get_breaker(endpoint):
+    """엔드포인트별 공용 차단기"""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint)
+            _breakers[endpoint] = breaker
+    return breaker
+
+
+def set_deadline(seconds):
+    """지금부터 seconds초 뒤를 실행 제한 시각으로 설정 (None이면 해제)"""
+    global _deadline
+    _deadline = None if seconds is None else time.monotonic() + seconds
+
+
+def remaining_time():
+    """실행 제한까지 남은 초 (제한 없으면 None) - 지났으면 DeadlineExceeded"""
+    if _deadline is None:
+        return None
+    remaining = _deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("실행 제한 시간 초과")
+    return remaining
+
+
+def stats():
+    """엔드포인트별 차단기 상태"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {endpoint: breaker.stats() for endpoint, breaker in sorted(breakers.items())}
+
+
+def print_stats():
+    """차단된 적 있는 엔드포인트만 출력"""
+    for endpoint, item in stats().items():
+        if item["opened"] or item["rejected"]:
+            print(f"🚧 {endpoint}: {item['opened']}회 차단, 요청 {item['rejected']}회 생략 (현재 {item['state']})")
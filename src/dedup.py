@@ -0,0 +1,82 @@
+import random
+import re
+
+from config import DEDUP_THRESHOLD, DEDUP_NUM_PERM, DEDUP_BANDS
+
+# [속보], (종합), 【단독】 같은 머리표/꼬리표
+TAG_RE = re.compile(r"[\[\(【<〈《][^\]\)】>〉》]{1,10}[\]\)】>〉》]")
+# "… - 연합뉴스", "… | 매일경제" 같은 언론사 꼬리
+OUTLET_RE = re.compile(r"\s+[-|ㅣ/]\s*[^\s\-|ㅣ/]{2,12}$")
+NON_WORD_RE = re.compile(r"[^0-9A-Za-z가-힣]+")
+
+_MASK_BITS = (1 << 64) - 1
+
+
+def normalize(headline):
+    """비교용 제목 정규화 (태그/언론사/문장부호/공백 제거, 소문자)"""
+    text = TAG_RE.sub(" ", headline)
+    text = OUTLET_RE.sub("", text)
+    return NON_WORD_RE.sub("", text).lower()
+
+
+def shingles(text, size=3):
+    """글자 n-gram 집합"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """MinHash + LSH 밴드 인덱스 - 헤드라인마다 후보 버킷만 확인하므로 전체가 선형 시간"""
+
+    def __init__(self, threshold=DEDUP_THRESHOLD, num_perm=DEDUP_NUM_PERM, bands=DEDUP_BANDS, seed=7):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = max(1, num_perm // bands)
+        rng = random.Random(seed)
+        self.masks = [rng.getrandbits(64) for _ in range(self.bands * self.rows)]
+        self.buckets = [{} for _ in range(self.bands)]
+        self.kept = []
+
+    def signature(self, shingle_set):
+        hashes = [hash(s) & _MASK_BITS for s in shingle_set]
+        return [min(h ^ mask for h in hashes) for mask in self.masks]
+
+    def add(self, headline):
+        """새 헤드라인이면 인덱스에 추가하고 True, 기존 것과 비슷하면 False"""
+        shingle_set = shingles(normalize(headline))
+        if not shingle_set:
+            return False
+
+        signature = self.signature(shingle_set)
+        band_keys = [
+            tuple(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+        checked = set()
+        for band, key in enumerate(band_keys):
+            for index in self.buckets[band].get(key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                if jaccard(shingle_set, self.kept[index]) >= self.threshold:
+                    return False
+
+        index = len(self.kept)
+        self.kept.append(shingle_set)
+        for band, key in enumerate(band_keys):
+            self.buckets[band].setdefault(key, []).append(index)
+        return True
+
+
+def collapse(headlines, threshold=DEDUP_THRESHOLD):
+    """비슷한 헤드라인 중 처음 나온 것만 남김 (순서 유지)"""
+    index = NearDuplicateIndex(threshold=threshold)
+    return [headline for headline in headlines if index.add(headline)]
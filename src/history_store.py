@@ -0,0 +1,304 @@
+import csv
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+from config import NEWS_CATEGORIES, HISTORY_PATH, HISTORY_CSV_DIR
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+KST = timezone(timedelta(hours=9))
+
+# 조회 결과 컬럼 순서
+COLUMNS = (
+    "ts", "category", "keyword", "monthly_search", "blog_count",
+    "news_count", "web_count", "saturation", "possibility",
+)
+
+# CSV 형식별 헤더
+# daily: output/csv/YYYY-MM-DD.csv (시간만 기록), history: output/history.csv (날짜+시간)
+CSV_LAYOUTS = {
+    "daily": ["시간", "카테고리", "키워드", "월간검색량", "블로그", "포화도", "난이도"],
+    "history": ["날짜", "카테고리", "키워드", "월간검색량", "블로그문서수", "포화도", "상위노출"],
+}
+
+# 가져오기용 CSV 열 이름 → 컬럼
+CSV_FIELDS = {
+    "시간": "ts", "날짜": "ts", "카테고리": "category", "키워드": "keyword",
+    "월간검색량": "monthly_search", "블로그": "blog_count", "블로그문서수": "blog_count",
+    "뉴스": "news_count", "웹문서": "web_count", "포화도": "saturation",
+    "난이도": "possibility", "상위노출": "possibility",
+}
+
+# until 미지정 시 상한 (어떤 시각 문자열보다 큼)
+MAX_TS = "\uffff"
+
+CATEGORY_NAMES = {cat_id: info["name"] for cat_id, info in NEWS_CATEGORIES.items()}
+CATEGORY_IDS = {info["name"]: cat_id for cat_id, info in NEWS_CATEGORIES.items()}
+
+
+def now_ts():
+    """기록 시각 (KST, 분 단위 문자열 - 사전순 = 시간순)"""
+    return datetime.now(KST).strftime("%Y-%m-%d %H:%M")
+
+
+class HistoryStore:
+    """실행별 키워드 지표 기록 (SQLite, 키워드/카테고리 + 시각 인덱스)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pending = []
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS history (
+                ts TEXT NOT NULL,
+                category TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                monthly_search INTEGER NOT NULL,
+                blog_count INTEGER NOT NULL,
+                news_count INTEGER,
+                web_count INTEGER,
+                saturation REAL NOT NULL,
+                possibility TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_history_keyword ON history (keyword, ts)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_history_category ON history (category, ts)")
+        self._conn.commit()
+
+    def record(self, category, results, ts=None):
+        """한 카테고리 결과를 쓰기 대기열에 추가 (flush 때 한 번에 저장) - 문서수를 모르는 키워드는 기록하지 않음"""
+        ts = ts or now_ts()
+        rows = [
+            (
+                ts, category, item["keyword"], item["monthly_search"], item["blog_count"],
+                item.get("news_count"), item.get("web_count"), item["saturation"], item["possibility"],
+            )
+            for item in results
+            if item.get("blog_count") is not None
+        ]
+        with self._lock:
+            self._pending.extend(rows)
+
+    def flush(self):
+        """대기 중인 행을 트랜잭션 하나로 저장 - 저장한 행 수"""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if rows:
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT INTO history ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                        rows
+                    )
+        return len(rows)
+
+    def _select(self, where, params, order="ts"):
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM history WHERE {where} ORDER BY {order}",
+                params
+            )
+            return [dict(zip(COLUMNS, row)) for row in cursor.fetchall()]
+
+    def keyword_history(self, keyword, since=None, until=None):
+        """키워드 하나의 기록 (시간순) - since/until은 'YYYY-MM-DD[ HH:MM]'"""
+        return self._select(
+            "keyword = ? AND ts >= ? AND ts <= ?",
+            (keyword, since or "", until or MAX_TS)
+        )
+
+    def category_history(self, category, since=None, until=None):
+        """카테고리 하나의 기록 (시간순)"""
+        return self._select(
+            "category = ? AND ts >= ? AND ts <= ?",
+            (category, since or "", until or MAX_TS),
+            order="ts, rowid"
+        )
+
+    def range(self, since=None, until=None):
+        """기간 내 전체 기록 (저장 순서)"""
+        return self._select(
+            "ts >= ? AND ts <= ?",
+            (since or "", until or MAX_TS),
+            order="ts, rowid"
+        )
+
+    def columns(self, names, since=None, until=None):
+        """기간 내 기록의 지정 컬럼만 튜플 목록으로 (대량 조회/배열 변환용)"""
+        names = [name for name in names if name in COLUMNS]
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT {', '.join(names)} FROM history WHERE ts >= ? AND ts <= ?",
+                (since or "", until or MAX_TS)
+            ).fetchall()
+
+    def appended(self, names, after, since=None):
+        """rowid가 after보다 큰 (= 그 뒤에 추가된) 기록의 (rowid, 지정 컬럼) 튜플 목록 - 증분 조회용"""
+        names = [name for name in names if name in COLUMNS]
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT rowid, {', '.join(names)} FROM history WHERE rowid > ? AND ts >= ?",
+                (after, since or "")
+            ).fetchall()
+
+    def last_rowid(self):
+        """마지막 기록의 rowid (비어 있으면 0) - 기록은 추가만 되므로 증분 조회 기준으로 사용"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM history").fetchone()[0]
+
+    def recent(self, days, until=None):
+        """최근 N일 기록"""
+        end = datetime.now(KST) if until is None else datetime.strptime(until[:10], "%Y-%m-%d")
+        since = (end - timedelta(days=days)).strftime("%Y-%m-%d")
+        return self.range(since=since, until=until)
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def export_csv(self, path, since=None, until=None, layout="daily"):
+        """기간 내 기록을 기존 CSV 형식으로 내보내기 - 내보낸 행 수"""
+        header = CSV_LAYOUTS[layout]
+        rows = self.range(since, until)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow([
+                    row["ts"][11:] if layout == "daily" else row["ts"],
+                    CATEGORY_NAMES.get(row["category"], row["category"]),
+                    row["keyword"],
+                    row["monthly_search"],
+                    row["blog_count"],
+                    # 블로그 문서 0개일 때 정수 0으로 기록하던 기존 CSV와 맞춤
+                    row["saturation"] or 0,
+                    row["possibility"],
+                ])
+        return len(rows)
+
+    def export_daily_csv(self, date_str, csv_dir=None):
+        """하루치 기록을 output/csv/YYYY-MM-DD.csv로 내보내기"""
+        csv_dir = Path(csv_dir) if csv_dir else BASE_DIR / HISTORY_CSV_DIR
+        return self.export_csv(
+            csv_dir / f"{date_str}.csv",
+            since=date_str,
+            until=f"{date_str} 99:99",
+            layout="daily"
+        )
+
+    def import_csv(self, path):
+        """기존 CSV 파일(일별/history 형식, 뉴스·웹문서 열 있는 예전 형식 포함) 가져오기 - 가져온 행 수"""
+        path = Path(path)
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            fields = {CSV_FIELDS[name]: index for index, name in enumerate(header) if name in CSV_FIELDS}
+            if not {"ts", "category", "keyword", "monthly_search", "saturation"} <= set(fields):
+                print(f"    ⚠️ 알 수 없는 CSV 형식: {path}")
+                return 0
+
+            # 일별 파일은 시간만 있으므로 파일 이름의 날짜를 붙임
+            date_prefix = f"{path.stem} " if header[fields["ts"]] == "시간" else ""
+
+            def value(row, field, cast, default=None):
+                index = fields.get(field)
+                if index is None or index >= len(row) or row[index] == "":
+                    return default
+                return cast(row[index])
+
+            rows = []
+            for row in reader:
+                if len(row) < len(header):
+                    continue
+                category = row[fields["category"]]
+                rows.append((
+                    date_prefix + row[fields["ts"]],
+                    CATEGORY_IDS.get(category, category),
+                    row[fields["keyword"]],
+                    value(row, "monthly_search", int, 0),
+                    value(row, "blog_count", int, 0),
+                    value(row, "news_count", int),
+                    value(row, "web_count", int),
+                    value(row, "saturation", float, 0.0),
+                    value(row, "possibility", str, ""),
+                ))
+
+        with self._lock:
+            self._pending.extend(rows)
+        return self.flush()
+
+    def close(self):
+        """WAL 내용을 본 파일에 합치고 닫기 (커밋되는 파일이 하나만 남도록)"""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """프로세스 공용 기록 저장소 - 처음 만들 때 기존 일별 CSV를 가져옴"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = HistoryStore(BASE_DIR / HISTORY_PATH)
+            if _store.count() == 0:
+                csv_dir = BASE_DIR / HISTORY_CSV_DIR
+                imported = sum(_store.import_csv(path) for path in sorted(csv_dir.glob("*.csv")))
+                if imported:
+                    print(f"📥 기존 CSV {imported}행을 기록 저장소로 가져옴")
+    return _store
+
+
+def close():
+    """공용 저장소 닫기"""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+            _store = None
+
+
+def main():
+    """사용법:
+        python -m src.history_store import output/history.csv   # CSV 가져오기
+        python -m src.history_store export out.csv 2026-01-01 2026-01-31 [daily|history]
+        python -m src.history_store keyword 환율조회 [시작일]
+    """
+    args = sys.argv[1:]
+    if not args:
+        print(main.__doc__)
+        return
+
+    store = get_store()
+    command, rest = args[0], args[1:]
+
+    if command == "import":
+        for path in rest:
+            print(f"📥 {path}: {store.import_csv(path)}행")
+    elif command == "export":
+        path, since, until = rest[0], rest[1], rest[2]
+        layout = rest[3] if len(rest) > 3 else "history"
+        print(f"📤 {path}: {store.export_csv(path, since, f'{until} 99:99', layout)}행")
+    elif command == "keyword":
+        since = rest[1] if len(rest) > 1 else None
+        for row in store.keyword_history(rest[0], since=since):
+            print(f"{row['ts']}  {CATEGORY_NAMES.get(row['category'], row['category'])}  "
+                  f"검색량 {row['monthly_search']:,}  블로그 {row['blog_count']:,}  포화도 {row['saturation']}")
+    else:
+        print(main.__doc__)
+
+    close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_READ_RETRIES
+from src import rate_limiter, profiler, quota, circuit_breaker
+
+# 호스트별 keep-alive 세션 (프로세스마다 지연 생성 → gunicorn fork 이후에도 안전)
+_sessions = {}
+_lock = threading.Lock()
+
+
+def _create_session(family=None):
+    """커넥션 풀 + 재시도 어댑터가 붙은 세션 생성"""
+    # 429/5xx 응답 재시도는 rate_limiter가 담당, 여기서는 연결/읽기 오류만 재시도
+    retry = Retry(
+        total=HTTP_RETRIES,
+        connect=HTTP_RETRIES,
+        read=HTTP_READ_RETRIES.get(family, HTTP_RETRIES),
+        status=0,
+        backoff_factor=0.3,
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(url, family=None):
+    """URL 호스트에 해당하는 공용 세션 (읽기 재시도 횟수는 처음 만들 때의 family 기준 - 호스트당 계열 하나)"""
+    host = urlsplit(url).netloc
+
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _create_session(family)
+            _sessions[host] = session
+    return session
+
+
+def timed_get(session, url, family=None, **kwargs):
+    """GET 한 번 보내고 엔드포인트별 지연/상태를 실행 보고서와 차단기에 기록 (재시도는 각각 기록)
+
+    엔드포인트가 차단 중이거나 실행 제한 시간이 지났으면 보내지 않고 circuit_breaker.FastFail,
+    제한 시간이 남아 있으면 timeout을 남은 시간 이하로 줄인다.
+    family가 있으면 보내기 직전에 일일 한도를 차감한다 (한도 초과면 QuotaExceeded).
+    """
+    endpoint = profiler.endpoint_name(url)
+    remaining = circuit_breaker.remaining_time()
+    if remaining is not None:
+        kwargs["timeout"] = min(kwargs.get("timeout") or remaining, remaining)
+
+    # 차단 중인 요청이 한도를 쓰지 않도록 차단기 확인 후 차감
+    breaker = circuit_breaker.get_breaker(endpoint)
+    breaker.allow()
+    if family is not None:
+        try:
+            quota.charge(family)
+        except quota.QuotaExceeded:
+            breaker.cancel()
+            raise
+
+    start = time.perf_counter()
+    try:
+        response = session.get(url, **kwargs)
+    except Exception as e:
+        breaker.record(False)
+        profiler.record_call(endpoint, time.perf_counter() - start, error=e)
+        raise
+    # 429는 속도 제한 문제라 rate_limiter가 처리하고, 서버 오류(5xx)만 장애로 취급
+    breaker.record(response.status_code < 500)
+    profiler.record_call(endpoint, time.perf_counter() - start, status=response.status_code)
+    return response
+
+
+def get(url, family=None, **kwargs):
+    """공용 세션으로 GET 요청 (family 지정 시 해당 계열 속도 제한 + 일일 한도 적용, 재시도도 시도마다 차감)"""
+    session = get_session(url, family)
+    if family is None:
+        return timed_get(session, url, **kwargs)
+    return rate_limiter.request(family, lambda: timed_get(session, url, family=family, **kwargs))
+
+
+def stats():
+    """호스트별 요청 수 / 새 연결 수 / 재사용 수"""
+    with _lock:
+        sessions = dict(_sessions)
+
+    result = {}
+    for host, session in sessions.items():
+        requests_count = 0
+        connections = 0
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_count += pool.num_requests
+                connections += pool.num_connections
+
+        result[host] = {
+            "requests": requests_count,
+            "connections": connections,
+            "reused": max(0, requests_count - connections),
+        }
+    return result
+
+
+def print_stats():
+    """연결 재사용 통계 출력"""
+    for host, item in stats().items():
+        print(f"🔌 {host}: 요청 {item['requests']}회 / 새 연결 {item['connections']}개 (재사용 {item['reused']}회)")
@@ -0,0 +1,167 @@
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from config import JOB_BACKEND, JOB_WORKERS, JOB_MAX_PENDING, JOB_RETENTION
+from src.cache import normalize_keyword
+from src.keyword_analysis import blog_order
+
+# 작업 상태
+QUEUED, RUNNING, DONE, ERROR = "queued", "running", "done", "error"
+
+
+class QueueFull(Exception):
+    """대기 중인 작업이 너무 많음"""
+
+
+def job_key(keywords):
+    """키워드 집합 식별자 (순서/공백/대소문자 무관) - 같은 입력의 작업을 합치는 데 사용"""
+    normalized = sorted({normalize_keyword(kw) for kw in keywords})
+    return hashlib.sha1("\n".join(normalized).encode("utf-8")).hexdigest()
+
+
+class Job:
+    """분석 작업 하나의 진행 상태와 (부분) 결과"""
+
+    def __init__(self, key, keywords):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.keywords = keywords
+        self.status = QUEUED
+        self.total = len(keywords)
+        self.results = []
+        self.related = []
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+
+    def apply(self, event):
+        """분석 이벤트 (app.stream_analysis 형식) 반영"""
+        kind = event["type"]
+        if kind == "start":
+            self.status = RUNNING
+            self.total = event["total_keywords"]
+        elif kind == "result":
+            self.results.append(event["item"])
+        elif kind == "related":
+            self.related.append((event["rank"], event["item"]))
+        elif kind == "error":
+            self.error = event["error"]
+
+    def snapshot(self, since=0):
+        """폴링 응답 - since 이후 새로 나온 결과만 partial로, 끝났으면 정렬된 전체 결과 포함"""
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "total_keywords": self.total,
+            "completed": len(self.results),
+            "partial": self.results[since:],
+            "next": len(self.results),
+            "error": self.error,
+        }
+        if self.status == DONE:
+            data["results"] = sorted(self.results, key=blog_order)
+            data["related"] = [item for _, item in sorted(self.related, key=lambda x: x[0])]
+        return data
+
+
+class LocalJobQueue:
+    """프로세스 내 작업 큐 (스레드 풀)
+
+    다른 백엔드(여러 gunicorn 워커가 공유하는 Redis 등)는 같은 메서드
+    submit(keywords, run) / get(job_id) / stats()를 제공하면 된다.
+    gunicorn 워커가 여럿이면 로컬 큐는 워커마다 따로라서 폴링이 다른 워커로 가면 작업을 찾지 못한다.
+    """
+
+    def __init__(self, workers=JOB_WORKERS, max_pending=JOB_MAX_PENDING, retention=JOB_RETENTION):
+        self.max_pending = max_pending
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._jobs = {}
+        self._active = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def submit(self, keywords, run):
+        """작업 등록 - 같은 키워드 집합이 대기/실행 중이면 그 작업을 돌려줌 (job, 합쳐졌는지)
+
+        run(keywords)은 분석 이벤트를 내는 이터레이터
+        """
+        key = job_key(keywords)
+        with self._lock:
+            self._purge()
+
+            job = self._active.get(key)
+            if job is not None:
+                self.coalesced += 1
+                return job, True
+
+            pending = sum(1 for active in self._active.values() if active.status == QUEUED)
+            if pending >= self.max_pending:
+                raise QueueFull(f"대기 중인 작업이 {pending}개입니다. 잠시 후 다시 시도해주세요.")
+
+            job = Job(key, keywords)
+            self._jobs[job.id] = job
+            self._active[key] = job
+
+        self._executor.submit(self._run, job, run)
+        return job, False
+
+    def _run(self, job, run):
+        job.status = RUNNING
+        try:
+            for event in run(job.keywords):
+                job.apply(event)
+            job.status = ERROR if job.error else DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = ERROR
+        finally:
+            job.finished = time.time()
+            with self._lock:
+                if self._active.get(job.key) is job:
+                    del self._active[job.key]
+
+    def _purge(self):
+        """보관 기간이 지난 완료 작업 삭제 (lock 안에서 호출)"""
+        cutoff = time.time() - self.retention
+        expired = [job_id for job_id, job in self._jobs.items() if job.finished and job.finished < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {
+            "backend": "local",
+            "jobs": len(statuses),
+            "queued": statuses.count(QUEUED),
+            "running": statuses.count(RUNNING),
+            "done": statuses.count(DONE),
+            "error": statuses.count(ERROR),
+            "coalesced": self.coalesced,
+        }
+
+
+# 백엔드 이름 → 큐 클래스 (공유 백엔드는 여기에 추가)
+BACKENDS = {
+    "local": LocalJobQueue,
+}
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    """프로세스 공용 작업 큐 (config.JOB_BACKEND)"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = BACKENDS[JOB_BACKEND]()
+    return _queue
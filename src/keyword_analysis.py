@@ -0,0 +1,102 @@
+import unicodedata
+
+from src.naver_api import get_search_volume, get_blog_count, get_autocomplete, UNKNOWN
+
+
+def volume_key(keyword):
+    """검색량 매칭용 키 (NFC + 공백 전부 제거 + 대소문자 무시)
+
+    keywordstool은 연관 키워드를 공백 없이 돌려주므로 입력 쪽도 공백을 모두 지운다.
+    """
+    keyword = unicodedata.normalize("NFC", str(keyword))
+    return "".join(keyword.split()).casefold()
+
+
+class VolumeIndex:
+    """검색량 응답 {연관키워드: 검색량}의 정규화 키 해시 인덱스 - 한 번 만들고 O(1) 조회"""
+
+    def __init__(self, search_volumes):
+        self._index = {}
+        for api_kw, volume in search_volumes.items():
+            # 같은 키가 여럿이면 기존 선형 탐색처럼 먼저 나온 값 사용
+            self._index.setdefault(volume_key(api_kw), volume)
+
+    def __len__(self):
+        return len(self._index)
+
+    def lookup(self, keyword, default=0):
+        return self._index.get(volume_key(keyword), default)
+
+
+def build_result(keyword, monthly, blog_count):
+    """키워드 한 개 결과 (포화도 + 블로그 문서수 기준 난이도) - 문서수를 모르면(None) 포화도 None, 난이도 UNKNOWN"""
+    if blog_count is None:
+        saturation = None
+    elif monthly > 0:
+        saturation = round(blog_count / monthly, 2)
+    else:
+        saturation = 0
+
+    if blog_count is None:
+        possibility = UNKNOWN
+    elif blog_count <= 1000:
+        possibility = "🟢"
+    elif blog_count <= 10000:
+        possibility = "🟡"
+    elif blog_count <= 50000:
+        possibility = "🟠"
+    else:
+        possibility = "🔴"
+
+    return {
+        'keyword': keyword,
+        'monthly_search': monthly,
+        'blog_count': blog_count,
+        'saturation': saturation,
+        'possibility': possibility
+    }
+
+
+def blog_order(item):
+    """블로그 문서수 적은 순 정렬 키 (모르는 키워드는 맨 뒤)"""
+    return (item['blog_count'] is None, item['blog_count'] or 0)
+
+
+def match_volumes(keywords, search_volumes):
+    """입력 키워드별 검색량 (응답에 없으면 0)"""
+    index = VolumeIndex(search_volumes)
+    return {kw: index.lookup(kw) for kw in keywords}
+
+
+def analyze_keywords(keywords):
+    """입력 키워드만 직접 분석 (필터링 없음) - 블로그 문서수 적은 순"""
+    print(f"    🔍 {len(keywords)}개 키워드 검색량 조회 중...")
+    search_volumes = get_search_volume(keywords)
+
+    filtered_volumes = match_volumes(keywords, search_volumes)
+
+    print(f"    ✅ {len(filtered_volumes)}개 키워드 분석 대상")
+
+    results = []
+    count = 0
+    for keyword, monthly in filtered_volumes.items():
+        count += 1
+        blog_count = get_blog_count(keyword)
+        results.append(build_result(keyword, monthly, blog_count))
+
+        if count % 10 == 0:
+            print(f"    ⏳ {count}개 분석 중...")
+
+    return sorted(results, key=blog_order)
+
+
+def fetch_related(results, top=10):
+    """상위 키워드 연관검색어 (최대 5개씩)"""
+    related_data = []
+    for item in results[:top]:
+        related = get_autocomplete(item['keyword'])
+        related_data.append({
+            'keyword': item['keyword'],
+            'related': related[:5]
+        })
+    return related_data
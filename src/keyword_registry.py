@@ -0,0 +1,139 @@
+from src import naver_api, quota, prefilter
+from src.cache import normalize_keyword
+
+
+class KeywordRegistry:
+    """실행 단위 키워드 레지스트리 - 카테고리 간 중복 키워드를 한 번만 조회"""
+
+    def __init__(self):
+        self.categories = {}
+        self.calls = {"requested": {}, "actual": {}}
+        self.skipped = 0
+
+    def add(self, category_id, keywords):
+        """카테고리의 추출 키워드 등록"""
+        self.categories[category_id] = list(keywords)
+
+    def _count(self, metric, requested, actual):
+        self.calls["requested"][metric] = self.calls["requested"].get(metric, 0) + requested
+        self.calls["actual"][metric] = self.calls["actual"].get(metric, 0) + actual
+
+    def analyze(self, limit, metrics=None):
+        """전체 카테고리 키워드 분석 → {카테고리: naver_api.build_results 결과}
+
+        metrics: 미리 조회할 문서수 지표 (기본 naver_api.required_metrics())
+        """
+        metrics = metrics or naver_api.required_metrics()
+        hints = {
+            category_id: [kw.strip().replace(" ", "") for kw in keywords[:limit] if kw.strip()]
+            for category_id, keywords in self.categories.items()
+        }
+
+        # 1. 검색량: 카테고리 순서대로 중복 제거한 힌트를 한 번에 조회
+        unique_hints = _unique(hint for category_hints in hints.values() for hint in category_hints)
+        print(f"    🔍 힌트 키워드 {sum(len(h) for h in hints.values())}개 → 고유 {len(unique_hints)}개 검색량 조회")
+        volumes_by_hint = naver_api.get_search_volume_by_hint(unique_hints)
+        volumes_by_key = {normalize_keyword(hint): rows for hint, rows in volumes_by_hint.items()}
+        self._count(
+            "search_volume",
+            sum((len(_unique(h)) + 4) // 5 for h in hints.values()),
+            (len(unique_hints) + 4) // 5,
+        )
+
+        # 카테고리별 후보: 예전 문서수/키워드 형태로 기준을 넘을 후보는 빼고 검색량 상위부터 선택
+        prior = prefilter.Prior.load()
+        candidates = {}
+        predictions = {}
+        for category_id, category_hints in hints.items():
+            search_volumes = {}
+            for hint in category_hints:
+                search_volumes.update(volumes_by_key.get(normalize_keyword(hint), {}))
+            candidates[category_id], category_predictions = prefilter.select(search_volumes, prior)
+            predictions.update(category_predictions)
+
+        # 2. 문서수: 전체 후보 중 고유 키워드만 조회 후 카테고리별로 분배
+        unique_keywords = _unique(kw for items in candidates.values() for kw, _ in items)
+        requested = sum(len(items) for items in candidates.values())
+        print(f"    ⏳ 후보 {requested}개 → 고유 {len(unique_keywords)}개 문서수 조회 ({', '.join(metrics)})")
+
+        # 일일 한도가 부족하면 검색량 높은 키워드부터 조회하고 나머지는 이번 실행에서 제외
+        volumes = {normalize_keyword(kw): volume for items in candidates.values() for kw, volume in items}
+        unique_keywords, skipped = quota.plan(
+            unique_keywords, len(metrics), value=lambda kw: volumes[normalize_keyword(kw)]
+        )
+        self.skipped += len(skipped)
+        if skipped:
+            print(f"    ⚠️ 일일 한도 부족: 검색량 낮은 {len(skipped)}개 키워드 문서수 조회 생략")
+
+        counts = dict(zip(
+            (normalize_keyword(kw) for kw in unique_keywords),
+            naver_api.fetch_doc_counts(unique_keywords, metrics)
+        ))
+        self._count("doc_count", requested * len(metrics), len(unique_keywords) * len(metrics))
+        prefilter.record_outcomes(
+            (predictions[key], volumes[key], item.get("blog_count")) for key, item in counts.items()
+        )
+
+        results = {}
+        for category_id, items in candidates.items():
+            items = [(kw, volume) for kw, volume in items if normalize_keyword(kw) in counts]
+            results[category_id] = naver_api.build_results(
+                items,
+                [counts[normalize_keyword(kw)] for kw, _ in items]
+            )
+        return results
+
+    def fetch_related(self, results_by_category, top=15):
+        """카테고리별 상위 키워드 연관검색어 → {카테고리: [{keyword, related}]}"""
+        tops = {
+            category_id: [item["keyword"] for item in results[:top]]
+            for category_id, results in results_by_category.items()
+        }
+
+        unique_keywords = _unique(kw for keywords in tops.values() for kw in keywords)
+        related = dict(zip(
+            (normalize_keyword(kw) for kw in unique_keywords),
+            naver_api.fetch_autocomplete(unique_keywords)
+        ))
+        self._count("autocomplete", sum(len(keywords) for keywords in tops.values()), len(unique_keywords))
+
+        return {
+            category_id: [
+                {"keyword": kw, "related": related[normalize_keyword(kw)][:5]}
+                for kw in keywords
+            ]
+            for category_id, keywords in tops.items()
+        }
+
+    def report(self):
+        """지표별 요청 대비 실제 API 호출 수"""
+        return {
+            metric: {
+                "requested": requested,
+                "actual": self.calls["actual"][metric],
+                "saved": requested - self.calls["actual"][metric],
+            }
+            for metric, requested in self.calls["requested"].items()
+        }
+
+    def print_report(self):
+        """절약한 API 호출 수 출력"""
+        report = self.report()
+        saved = sum(item["saved"] for item in report.values())
+        print(f"♻️ 중복 키워드 통합: API 호출 {saved}회 절약")
+        for metric, item in report.items():
+            print(f"   • {metric}: {item['requested']} → {item['actual']}회")
+        if self.skipped:
+            print(f"   • 일일 한도 부족으로 생략한 키워드: {self.skipped}개")
+
+
+def _unique(keywords):
+    """정규화 기준 중복 제거 (처음 나온 순서 유지)"""
+    seen = set()
+    unique = []
+    for kw in keywords:
+        key = normalize_keyword(kw)
+        if key not in seen:
+            seen.add(key)
+            unique.append(kw)
+    return unique
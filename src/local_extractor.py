@@ -0,0 +1,160 @@
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+
+from config import LOCAL_CORPUS_PATH, LOCAL_CORPUS_SIZE, LOCAL_KEYWORD_LIMIT
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# 프롬프트 규칙 3번의 일반 단어 + 헤드라인에 흔한 군더더기
+STOPWORDS = {
+    "뉴스", "오늘", "발표", "관련", "대한", "위해", "통해", "대해", "이번", "지난", "올해", "내년",
+    "작년", "최근", "현재", "이후", "이전", "까지", "부터", "에서", "으로", "하는", "있는", "없는",
+    "했다", "한다", "된다", "됐다", "있다", "없다", "밝혀", "밝혔다", "예정", "속보", "단독", "종합",
+    "포토", "영상", "기자", "사진", "이슈", "전문", "인터뷰", "오전", "오후", "무엇", "가장", "모든",
+    "우리", "그리고", "하지만", "또한", "등의", "있어", "하며", "한편", "일부", "가운데",
+}
+
+# 명사 뒤에 붙는 조사/어미 (긴 것부터 검사)
+SUFFIXES = sorted([
+    "으로부터", "에서는", "에게서", "으로는", "이라며", "이라는", "라는", "에서", "에게", "으로",
+    "까지", "부터", "보다", "처럼", "이나", "라며", "하고", "했다", "한다", "하는", "된다", "됐다",
+    "은", "는", "이", "가", "을", "를", "에", "의", "도", "로", "와", "과", "만", "서",
+], key=len, reverse=True)
+
+# 조사처럼 보이지만 명사의 일부인 끝말 (주가, 유가, 도로 등)
+PROTECTED_ENDINGS = (
+    "주가", "유가", "물가", "단가", "원가", "지가", "시가", "호가", "평가", "국가", "증가", "대가",
+    "도로", "경로", "통로", "진로", "수도", "제도", "속도", "한도", "지도", "정도", "연도", "의도",
+    "강서", "문서", "순서", "질서", "경기", "보이", "아이", "사이", "차이", "나이",
+)
+
+TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+# 복합어를 만들지 않는 구절 경계 (쉼표, 말줄임표, 괄호, 따옴표 등)
+CLAUSE_RE = re.compile(r"[,…·\"'“”‘’\[\]()<>|/!?]+|\.{2,}| - ")
+
+_corpus_lock = threading.Lock()
+
+
+def strip_suffix(token):
+    """조사/어미 제거 (남는 부분이 2글자 이상일 때만)"""
+    if token.endswith(PROTECTED_ENDINGS):
+        return token
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(headline):
+    """헤드라인 → 조사 뗀 명사 후보 목록"""
+    tokens = []
+    for raw in TOKEN_RE.findall(headline):
+        token = strip_suffix(raw)
+        if len(token) >= 2 and not token.isdigit() and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def candidates(headline):
+    """한 헤드라인의 후보 키워드: 단어 + 인접 단어 복합어 + 긴 단어의 앞쪽 글자 n-gram"""
+    tokens = tokenize(headline)
+    found = set(tokens)
+
+    # 복합 키워드 (예: 삼성전자 + 주가 → 삼성전자주가) - 같은 구절 안에서만
+    for clause in CLAUSE_RE.split(headline):
+        clause_tokens = tokenize(clause)
+        for left, right in zip(clause_tokens, clause_tokens[1:]):
+            compound = left + right
+            if len(compound) <= 10:
+                found.add(compound)
+
+    # 붙여 쓴 긴 단어의 앞부분 (예: 삼성전자주가 → 삼성전자) - 여러 헤드라인에 반복될 때만 채택
+    for token in tokens:
+        if len(token) >= 4 and re.fullmatch(r"[가-힣]+", token):
+            for size in range(2, len(token) + 1):
+                found.add(("ngram", token[:size]))
+
+    return found
+
+
+def load_corpus():
+    """최근 헤드라인 코퍼스 (IDF 계산용)"""
+    path = BASE_DIR / LOCAL_CORPUS_PATH
+    if not path.exists():
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def remember(headlines):
+    """헤드라인을 코퍼스에 추가 (최근 LOCAL_CORPUS_SIZE개만 유지)"""
+    path = BASE_DIR / LOCAL_CORPUS_PATH
+    with _corpus_lock:
+        corpus = load_corpus()
+        known = set(corpus)
+        corpus.extend(h for h in dict.fromkeys(headlines) if h not in known)
+        corpus = corpus[-LOCAL_CORPUS_SIZE:]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(corpus, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+def document_frequencies(corpus):
+    """코퍼스 헤드라인별 단어 등장 수"""
+    df = Counter()
+    for headline in corpus:
+        df.update(set(tokenize(headline)))
+    return df
+
+
+def extract_keywords(headlines, limit=LOCAL_KEYWORD_LIMIT, corpus=None):
+    """로컬 키워드 추출 (TF-IDF 점수순)"""
+    if corpus is None:
+        corpus = load_corpus()
+
+    df = document_frequencies(corpus)
+    total_docs = len(corpus) + len(headlines)
+
+    tf = Counter()
+    ngram_tf = Counter()
+    for headline in headlines:
+        for item in candidates(headline):
+            if isinstance(item, tuple):
+                ngram_tf[item[1]] += 1
+            else:
+                tf[item] += 1
+
+    # 여러 헤드라인에 반복된 앞부분 n-gram 중, 같은 횟수의 더 긴 n-gram이 없는 것만 채택
+    # (삼성/삼성전/삼성전자가 모두 2번이면 삼성전자만 남김)
+    repeated = {ngram: count for ngram, count in ngram_tf.items() if count >= 2}
+    for ngram, count in repeated.items():
+        if ngram in STOPWORDS:
+            continue
+        longer = ngram + "\uffff"
+        if any(other != ngram and ngram <= other < longer and other_count >= count
+               for other, other_count in repeated.items()):
+            continue
+        tf[ngram] = max(tf[ngram], count)
+
+    scores = {}
+    for keyword, count in tf.items():
+        # 코퍼스에 드문 단어/새 복합어일수록 점수가 높음
+        doc_count = df.get(keyword, 0)
+        idf = math.log((1 + total_docs) / (1 + doc_count)) + 1
+        length_bonus = 1 + min(len(keyword), 8) / 16
+        scores[keyword] = count * idf * length_bonus
+
+    ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+    return [keyword for keyword, _ in ranked[:limit]]
@@ -1,40 +1,74 @@
 import os
-import requests
 import hashlib
 import hmac
 import base64
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
+import requests
 from dotenv import load_dotenv
 
+from config import API_CONCURRENCY, ENDPOINTS, METRIC_CONSUMERS
+from src import http_client, profiler, quota, circuit_breaker
+from src.cache import get_cache
+
 load_dotenv()
 
+# 문서수를 조회하지 못한 키워드의 등급 (0으로 두면 포화도 0 = 가장 좋은 등급처럼 보임)
+UNKNOWN = "❔"
 
 
 def get_search_volume(keywords):
     """네이버 광고 API로 검색량 조회"""
     
+    results = {}
+    for batch_results in get_search_volume_by_hint(keywords).values():
+        results.update(batch_results)
+    return results
+
+
+@profiler.timed
+def get_search_volume_by_hint(keywords):
+    """힌트 키워드별 검색량 조회 - {힌트: {연관키워드: 검색량}}
+    
+    keywordstool은 5개 힌트를 한 번에 받아 응답을 섞어 주므로,
+    같은 배치의 힌트들은 배치 전체 결과를 함께 가진다.
+    """
+    
+    results = {}
+    
+    # 빈 키워드 제거
+    cleaned = list(dict.fromkeys(kw.strip().replace(" ", "") for kw in keywords if kw.strip()))
+    
+    # 캐시에 있는 키워드는 저장된 연관 키워드 검색량 사용
+    cache = get_cache()
+    if cache is not None:
+        missing = []
+        for kw in cleaned:
+            cached = cache.get("search_volume", kw)
+            if cached is None:
+                missing.append(kw)
+            else:
+                results[kw] = cached
+        cleaned = missing
+    
+    if not cleaned:
+        return results
+    
     customer_id = os.getenv("NAVER_AD_CUSTOMER_ID")
     api_key = os.getenv("NAVER_AD_CLIENT_ID")
     secret_key = os.getenv("NAVER_AD_CLIENT_SECRET")
     
     if not all([customer_id, api_key, secret_key]):
         print("    ⚠️ 네이버 광고 API 키 없음")
-        return {}
+        return results
     
-    base_url = "https://api.naver.com"
+    base_url = ENDPOINTS["searchad"]
     uri = "/keywordstool"
     
-    results = {}
-    
     # 5개씩 나눠서 요청
-    for i in range(0, len(keywords), 5):
-        batch = keywords[i:i+5]
-        
-        # 빈 키워드 제거
-        cleaned_batch = [kw.strip().replace(" ", "") for kw in batch if kw.strip()]
-        if not cleaned_batch:
-            continue
+    for i in range(0, len(cleaned), 5):
+        cleaned_batch = cleaned[i:i+5]
         
         timestamp = str(int(time.time() * 1000))
         signature = generate_signature(timestamp, "GET", uri, secret_key)
@@ -52,10 +86,11 @@ def get_search_volume(keywords):
             encoded_keywords = quote(",".join(cleaned_batch), safe='')
             full_url = f"{base_url}{uri}?hintKeywords={encoded_keywords}&showDetail=1"
             
-            response = requests.get(full_url, headers=headers, timeout=10)
+            response = http_client.get(full_url, family="keywordstool", headers=headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
+                batch_results = {}
                 for item in data.get("keywordList", []):
                     keyword = item.get("relKeyword", "").replace(" ", "")
                     monthly = item.get("monthlyPcQcCnt", 0)
@@ -68,9 +103,12 @@ def get_search_volume(keywords):
                     
                     total = int(monthly or 0) + int(mobile or 0)
                     if keyword and total > 0:
-                        results[keyword] = total
-            
-            time.sleep(0.1)
+                        batch_results[keyword] = total
+                
+                for kw in cleaned_batch:
+                    results[kw] = batch_results
+                    if cache is not None:
+                        cache.set("search_volume", kw, batch_results)
             
         except Exception as e:
             print(f"    ⚠️ 검색량 조회 에러: {e}")
@@ -89,16 +127,21 @@ def generate_signature(timestamp, method, path, secret_key):
     return base64.b64encode(signature).decode('utf-8')
 
 
-def get_blog_count(keyword):
-    """네이버 검색 API로 블로그 문서 수 조회"""
+def _get_doc_count(metric, url, keyword, default=None):
+    """네이버 검색 API로 문서 수 조회 (캐시 우선) - 조회하지 못하면 default (None = 모름)"""
+    
+    cache = get_cache()
+    if cache is not None:
+        cached = cache.get(metric, keyword)
+        if cached is not None:
+            return cached
     
     client_id = os.getenv("NAVER_CLIENT_ID")
     client_secret = os.getenv("NAVER_CLIENT_SECRET")
     
     if not all([client_id, client_secret]):
-        return 0
+        return default
     
-    url = "https://openapi.naver.com/v1/search/blog.json"
     headers = {
         "X-Naver-Client-Id": client_id,
         "X-Naver-Client-Secret": client_secret
@@ -106,70 +149,51 @@ def get_blog_count(keyword):
     params = {"query": keyword, "display": 1}
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=5)
+        response = http_client.get(url, family="search", headers=headers, params=params, timeout=5)
         if response.status_code == 200:
-            return response.json().get("total", 0)
-    except:
+            total = response.json().get("total", 0)
+            if cache is not None:
+                cache.set(metric, keyword, total)
+            return total
+        print(f"    ⚠️ {metric} 조회 실패 ({keyword}): HTTP {response.status_code}")
+    except (quota.QuotaExceeded, circuit_breaker.FastFail):
+        # 한도 도달/차단/제한 시간 초과는 각 통계에 집계되므로 키워드마다 출력하지 않음
         pass
+    except (requests.RequestException, ValueError) as e:
+        print(f"    ⚠️ {metric} 조회 실패 ({keyword}): {e}")
     
-    return 0
+    return default
+
+
+@profiler.timed
+def get_blog_count(keyword, default=None):
+    """네이버 검색 API로 블로그 문서 수 조회"""
+    return _get_doc_count("blog_count", f"{ENDPOINTS['openapi']}/v1/search/blog.json", keyword, default)
+
 
-def get_news_count(keyword):
+@profiler.timed
+def get_news_count(keyword, default=None):
     """네이버 검색 API로 뉴스 문서 수 조회"""
-    
-    client_id = os.getenv("NAVER_CLIENT_ID")
-    client_secret = os.getenv("NAVER_CLIENT_SECRET")
-    
-    if not all([client_id, client_secret]):
-        return 0
-    
-    url = "https://openapi.naver.com/v1/search/news.json"
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret
-    }
-    params = {"query": keyword, "display": 1}
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=5)
-        if response.status_code == 200:
-            return response.json().get("total", 0)
-    except:
-        pass
-    
-    return 0
+    return _get_doc_count("news_count", f"{ENDPOINTS['openapi']}/v1/search/news.json", keyword, default)
 
 
-def get_web_count(keyword):
+@profiler.timed
+def get_web_count(keyword, default=None):
     """네이버 검색 API로 웹문서 수 조회"""
-    
-    client_id = os.getenv("NAVER_CLIENT_ID")
-    client_secret = os.getenv("NAVER_CLIENT_SECRET")
-    
-    if not all([client_id, client_secret]):
-        return 0
-    
-    url = "https://openapi.naver.com/v1/search/webkr.json"
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret
-    }
-    params = {"query": keyword, "display": 1}
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=5)
-        if response.status_code == 200:
-            return response.json().get("total", 0)
-    except:
-        pass
-    
-    return 0
+    return _get_doc_count("web_count", f"{ENDPOINTS['openapi']}/v1/search/webkr.json", keyword, default)
 
 
+@profiler.timed
 def get_autocomplete(keyword):
     """네이버 자동완성 API로 연관검색어 조회"""
     
-    url = "https://mac.search.naver.com/mobile/ac"
+    cache = get_cache()
+    if cache is not None:
+        cached = cache.get("autocomplete", keyword)
+        if cached is not None:
+            return cached
+    
+    url = f"{ENDPOINTS['autocomplete']}/mobile/ac"
     params = {
         "q": keyword,
         "st": "1",
@@ -183,53 +207,107 @@ def get_autocomplete(keyword):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=5)
+        response = http_client.get(url, family="autocomplete", params=params, timeout=5)
         if response.status_code == 200:
             data = response.json()
             items = data.get("items", [[]])[0]
-            return [item[0] for item in items[:15] if item]  # 5 → 10개
-    except:
+            related = [item[0] for item in items[:15] if item]  # 5 → 10개
+            if cache is not None:
+                cache.set("autocomplete", keyword, related)
+            return related
+        print(f"    ⚠️ 연관검색어 조회 실패 ({keyword}): HTTP {response.status_code}")
+    except circuit_breaker.FastFail:
         pass
+    except (requests.RequestException, ValueError, IndexError, TypeError) as e:
+        print(f"    ⚠️ 연관검색어 조회 실패 ({keyword}): {e}")
     
     return []
 
 
+# 문서수 지표 → 조회 함수
+DOC_METRICS = {
+    "blog_count": get_blog_count,
+    "news_count": get_news_count,
+    "web_count": get_web_count,
+}
+
+
+def required_metrics(consumers=None):
+    """소비자들이 쓰는 문서수 지표 (DOC_METRICS 순서, 포화도 계산용 blog_count는 항상 포함)"""
+    consumers = METRIC_CONSUMERS if consumers is None else consumers
+    needed = {"blog_count"}
+    for consumer in consumers:
+        needed.update(METRIC_CONSUMERS[consumer])
+    return tuple(metric for metric in DOC_METRICS if metric in needed)
+
+
+def get_metric(result, metric):
+    """결과 항목의 문서수 지표 - 미리 조회하지 않은 지표는 이때 조회해 항목에 저장 (캐시 우선, 실패하면 None)"""
+    if result.get(metric) is None:
+        result[metric] = DOC_METRICS[metric](result["keyword"])
+    return result[metric]
 
-def analyze_keywords(keywords, limit=50):
-    """키워드 분석 (검색량 + 블로그/뉴스/웹문서 + 포화도)"""
+
+@profiler.timed
+def fetch_doc_counts(keywords, metrics=None, max_workers=API_CONCURRENCY):
+    """키워드별 {지표: 문서수} 병렬 조회 - 입력 순서 유지, 조회 실패는 None
+
+    metrics 기본값은 모든 소비자가 쓰는 지표 (required_metrics())
+    """
     
-    print(f"    📊 {len(keywords)}개 중 상위 {limit}개 분석...")
+    if not keywords:
+        return []
     
-    keywords_to_check = keywords[:limit]
+    metrics = metrics or required_metrics()
+    tasks = [
+        (DOC_METRICS[metric], keyword)
+        for keyword in keywords
+        for metric in metrics
+    ]
     
-    # 검색량 조회 (연관 키워드도 함께 반환됨)
-    search_volumes = get_search_volume(keywords_to_check)
+    # executor.map은 입력 순서대로 결과를 돌려줌
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        counts = list(executor.map(lambda task: task[0](task[1]), tasks))
+    
+    size = len(metrics)
+    return [dict(zip(metrics, counts[i:i+size])) for i in range(0, len(counts), size)]
+
+
+@profiler.timed
+def fetch_autocomplete(keywords, max_workers=API_CONCURRENCY):
+    """키워드별 연관검색어 병렬 조회 - 입력 순서 유지"""
     
-    print(f"    🔍 {len(search_volumes)}개 키워드 검색량 조회 완료")
+    if not keywords:
+        return []
     
-    # 검색량 기준 상위 80개 정렬
-    sorted_keywords = sorted(search_volumes.items(), key=lambda x: x[1], reverse=True)[:80]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(get_autocomplete, keywords))
+
+
+def build_results(candidates, doc_counts):
+    """검색량 + 문서수({지표: 값})로 포화도 계산 후 포화도순 정렬
+
+    블로그 문서수를 얻지 못한 키워드는 포화도 None, 등급 UNKNOWN으로 맨 뒤에 둔다.
+    함께 조회한 뉴스/웹문서 수는 결과에 포함하고, 조회하지 않았으면 키가 없다 (get_metric으로 조회).
+    """
     
     results = []
     
-    for idx, (keyword, monthly_search) in enumerate(sorted_keywords):
-        if monthly_search < 100:
-            continue
-        
-        # 블로그, 뉴스, 웹문서 조회
-        blog_count = get_blog_count(keyword)
-        news_count = get_news_count(keyword)
-        web_count = get_web_count(keyword)
-        time.sleep(0.05)
+    for (keyword, monthly_search), counts in zip(candidates, doc_counts):
+        blog_count = counts.get("blog_count")
         
         # 포화도 (블로그 기준)
-        if blog_count == 0:
+        if blog_count is None:
+            saturation = None
+        elif blog_count == 0:
             saturation = 0
         else:
             saturation = round(blog_count / monthly_search, 2)
         
         # 포화도 등급
-        if saturation <= 0.5:
+        if saturation is None:
+            possibility = UNKNOWN
+        elif saturation <= 0.5:
             possibility = "🟢"
         elif saturation <= 1.0:
             possibility = "🟡"
@@ -238,22 +316,16 @@ def analyze_keywords(keywords, limit=50):
         else:
             possibility = "🔴"
         
-        results.append({
+        result = {
             "keyword": keyword,
             "monthly_search": monthly_search,
             "blog_count": blog_count,
-            "news_count": news_count,
-            "web_count": web_count,
-            "saturation": saturation,
-            "possibility": possibility
-        })
-        
-        if (idx + 1) % 20 == 0:
-            print(f"    ⏳ {idx + 1}개 분석 중...")
-    
-    # 포화도순 정렬
-    results.sort(key=lambda x: x["saturation"])
+        }
+        result.update((metric, value) for metric, value in counts.items() if metric != "blog_count")
+        result["saturation"] = saturation
+        result["possibility"] = possibility
+        results.append(result)
     
-    print(f"    ✅ {len(results)}개 키워드 분석 완료")
+    # 포화도순 정렬 (모르는 키워드는 맨 뒤)
+    results.sort(key=lambda x: (x["saturation"] is None, x["saturation"] or 0))
     return results
-
@@ -1,50 +1,186 @@
 import os
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
 
+from config import (
+    CRAWL_PAGE_SIZE, CRAWL_MAX_PAGES, CRAWL_MAX_HEADLINES, CRAWL_MIN_HEADLINES,
+    CRAWL_TERM_WORKERS, CRAWL_BACKLOG_HOURS, ENDPOINTS
+)
+from src import http_client, dedup, profiler
+from src.seen_store import get_store, article_key
+
+# 기록 범위: 카테고리 = 헤드라인으로 쓴 기사, "카테고리:단어" = 단어별로 수집한 기사 (페이지 중단 기준)
+# 단어별로는 수집했지만 카테고리에 없는 기사는 헤드라인 수 제한으로 못 쓴 기사 → 다음 실행에서 사용
+# 카테고리별로 아직 기록하지 않은 (범위, [(키, 제목)]) - 분석이 끝난 뒤 commit()으로 기록
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def clean_title(title):
+    """HTML 태그/엔티티 제거"""
+    title = title.replace("<b>", "").replace("</b>", "")
+    title = title.replace("&quot;", '"').replace("&amp;", "&")
+    title = title.replace("&lt;", "<").replace("&gt;", ">")
+    return title
+
+
+@profiler.timed
+def fetch_page(query, start, headers):
+    """뉴스 검색 한 페이지 (최신순)"""
+    url = f"{ENDPOINTS['openapi']}/v1/search/news.json"
+    params = {
+        "query": query,
+        "display": CRAWL_PAGE_SIZE,
+        "start": start,
+        "sort": "date"
+    }
+    response = http_client.get(url, family="search", headers=headers, params=params, timeout=10)
+    response.raise_for_status()
+    return response.json().get("items", [])
+
+
+def split_query(query):
+    """"주식 OR 증권 OR 코스피" → ["주식", "증권", "코스피"]"""
+    terms = [term.strip() for term in query.split(" OR ")]
+    return list(dict.fromkeys(term for term in terms if term))
+
+
+def interleave(groups):
+    """단어별 목록을 번갈아 한 줄로 (한 단어가 앞자리를 독차지하지 않도록)"""
+    merged = []
+    for row in zip_longest(*groups):
+        merged.extend(item for item in row if item is not None)
+    return merged
+
+
+@profiler.timed
+def crawl_term(category_id, term, headers, store):
+    """검색어 하나를 지난 실행 이후 새 기사까지 (최대 CRAWL_MAX_PAGES쪽) 페이지 넘기며 수집 (본 기사 기록은 crawl_news가 정리)"""
+    # 페이지 중단 판단은 단어별 기록으로 (다른 단어로 이미 본 기사 때문에 일찍 멈추지 않도록)
+    scope = f"{category_id}:{term}"
+    max_pages = CRAWL_MAX_PAGES if store.has_any(scope) else 1
+
+    new_items = []
+    try:
+        for page in range(max_pages):
+            start = 1 + page * CRAWL_PAGE_SIZE
+            if start > 1000:
+                break
+
+            items = fetch_page(term, start, headers)
+            keys = [article_key(item) for item in items]
+            seen = store.seen_keys(scope, keys)
+
+            new_items.extend(
+                (key, clean_title(item.get("title", "")))
+                for key, item in zip(keys, items)
+                if key not in seen
+            )
+
+            # 최신순이므로 이미 본 기사가 나오면 그 뒤는 모두 지난 실행에서 본 기사
+            # (헤드라인 수 제한은 crawl_news가 단어들을 합친 뒤 적용 - 여기서 자르면 2쪽 이후를 못 봄)
+            if seen or len(items) < CRAWL_PAGE_SIZE:
+                break
+
+    except Exception as e:
+        print(f"    ❌ API 에러 ({term}): {e}")
+        if not new_items:
+            return None
+
+    return new_items
+
+
+@profiler.timed
 def crawl_news(category_id, query):
-    """네이버 뉴스 API로 뉴스 헤드라인 가져오기"""
-    print(f"    🔍 검색어: {query}")
-    
+    """네이버 뉴스 API로 지난 실행 이후 새 헤드라인 가져오기 (OR 검색어는 단어별로 나눠 동시 수집)"""
+    terms = split_query(query)
+    print(f"    🔍 검색어: {', '.join(terms)}")
+
     client_id = os.getenv("NAVER_CLIENT_ID")
     client_secret = os.getenv("NAVER_CLIENT_SECRET")
-    
+
     if not client_id or not client_secret:
         print("    ❌ 네이버 API 키 없음")
         return []
-    
-    url = "https://openapi.naver.com/v1/search/news.json"
+
     headers = {
         "X-Naver-Client-Id": client_id,
         "X-Naver-Client-Secret": client_secret
     }
-    params = {
-        "query": query,
-        "display": 50,
-        "sort": "date"
-    }
-    
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        items = data.get("items", [])
-        
-        headlines = []
-        for item in items:
-            # HTML 태그 제거
-            title = item.get("title", "")
-            title = title.replace("<b>", "").replace("</b>", "")
-            title = title.replace("&quot;", '"').replace("&amp;", "&")
-            title = title.replace("&lt;", "<").replace("&gt;", ">")
-            
-            if title and len(title) > 10:
-                headlines.append(title)
-        
-        # 중복 제거
-        headlines = list(dict.fromkeys(headlines))
-        return headlines[:35]
-        
-    except Exception as e:
-        print(f"    ❌ API 에러: {e}")
+
+    store = get_store()
+
+    # 요청 속도는 rate_limiter의 search 버킷이 제한
+    with ThreadPoolExecutor(max_workers=min(CRAWL_TERM_WORKERS, len(terms))) as executor:
+        groups = list(executor.map(
+            lambda term: crawl_term(category_id, term, headers, store),
+            terms
+        ))
+
+    for term, items in zip(terms, groups):
+        if items is not None:
+            print(f"    • {term}: 새 기사 {len(items)}개")
+
+    # 모든 단어가 실패했으면 스킵
+    if all(items is None for items in groups):
         return []
+
+    # 여러 단어에 걸린 기사와 지난 실행에 다른 단어로 이미 본 기사 제외
+    merged = {}
+    for key, title in interleave([items for items in groups if items]):
+        merged.setdefault(key, title)
+    seen = store.seen_keys(category_id, merged)
+    new_items = [(key, title) for key, title in merged.items() if key not in seen]
+
+    # 지난 실행에서 수집했지만 헤드라인 수 제한으로 못 쓴 기사는 새 기사 뒤에
+    scopes = [f"{category_id}:{term}" for term in terms]
+    backlog = [
+        (key, title)
+        for key, title in store.unused(category_id, scopes, since=time.time() - CRAWL_BACKLOG_HOURS * 3600)
+        if key not in merged
+    ]
+
+    # 중복 제거 (언론사 꼬리표/문장부호만 다른 비슷한 제목까지) - 헤드라인이 다 차면 나머지는 다음 실행으로
+    index = dedup.NearDuplicateIndex()
+    headlines = []
+    used = []
+    for key, title in new_items + backlog:
+        if len(headlines) >= CRAWL_MAX_HEADLINES:
+            break
+        used.append((key, title))
+        if title and len(title) > 10 and index.add(title):
+            headlines.append(title)
+    deferred = len(new_items) + len(backlog) - len(used)
+    note = f", {deferred}개는 다음 실행으로" if deferred else ""
+    carried = f" + 지난 실행에서 남은 기사 {len(backlog)}개" if backlog else ""
+    print(f"    🆕 새 기사 {len(new_items)}개{carried} → 헤드라인 {len(headlines)}개 "
+          f"(비슷한 제목 {len(used) - len(headlines)}개 제외{note})")
+
+    # 카테고리에는 쓴 기사(비슷한 제목으로 빠진 것 포함)만, 단어별로는 수집한 기사 전부 기록 대기
+    pending = [(category_id, used)]
+    for scope, items in zip(scopes, groups):
+        if items:
+            pending.append((scope, items))
+    with _pending_lock:
+        _pending[category_id] = pending
+
+    # 새 기사가 적으면 최근에 본 헤드라인으로 채움 (LLM/지표 캐시에 있어 추가 비용 거의 없음)
+    if len(headlines) < CRAWL_MIN_HEADLINES:
+        recent = store.recent_titles(category_id, CRAWL_MIN_HEADLINES - len(headlines), exclude=headlines)
+        recent = [title for title in recent if len(title) > 10]
+        if recent:
+            print(f"    ♻️ 최근 헤드라인 {len(recent)}개 재사용")
+        headlines = dedup.collapse(headlines + recent)
+
+    return headlines
+
+
+def commit(category_id):
+    """crawl_news가 돌려준 헤드라인을 본 것으로 기록 - 분석이 끝난 뒤 호출 (실패/중단된 실행의 기사는 다음에 다시 수집)"""
+    with _pending_lock:
+        pending = _pending.pop(category_id, [])
+    store = get_store()
+    for scope, items in pending:
+        store.mark(scope, items)
@@ -0,0 +1,65 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_pipeline(items, stages, workers):
+    """항목별로 단계를 순서대로 흘려보내는 파이프라인 실행기
+
+    단계마다 스레드 풀을 따로 두어 항목들이 서로 다른 단계를 동시에 진행한다.
+    fn(키, 값)이 None을 반환하거나 예외가 나면 그 항목만 중단된다.
+    반환: ({키: 마지막 값 또는 None}, {키: (단계명, 예외)})
+    """
+    keys = list(items)
+    results = {}
+    errors = {}
+    lock = threading.Lock()
+    all_done = threading.Event()
+    remaining = [len(keys)]
+
+    if not keys:
+        return {}, {}
+
+    executors = {
+        name: ThreadPoolExecutor(max_workers=max(1, workers.get(name, 1)), thread_name_prefix=name)
+        for name, _ in stages
+    }
+
+    def finish(key, value):
+        with lock:
+            results[key] = value
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                all_done.set()
+
+    def submit(index, key, value):
+        if index == len(stages):
+            finish(key, value)
+            return
+
+        name, fn = stages[index]
+
+        def on_done(future):
+            try:
+                output = future.result()
+            except Exception as e:
+                with lock:
+                    errors[key] = (name, e)
+                finish(key, None)
+                return
+
+            if output is None:
+                finish(key, None)
+            else:
+                submit(index + 1, key, output)
+
+        executors[name].submit(fn, key, value).add_done_callback(on_done)
+
+    try:
+        for key in keys:
+            submit(0, key, items[key])
+        all_done.wait()
+    finally:
+        for executor in executors.values():
+            executor.shutdown(wait=True)
+
+    return {key: results.get(key) for key in keys}, errors
@@ -0,0 +1,178 @@
+import random
+import threading
+from datetime import datetime, timedelta
+
+from config import (
+    SATURATION_THRESHOLD, PREFILTER_POOL, PREFILTER_SLOTS, PREFILTER_MARGIN,
+    PREFILTER_MIN_PASS_RATE, PREFILTER_MIN_SAMPLES, PREFILTER_HISTORY_DAYS, PREFILTER_AUDIT_RATE,
+)
+from src import history_store
+from src.cache import get_cache, normalize_keyword
+
+# 사전 예측: 통과 예상 / 제외 / 근거 없음
+PASS, FAIL, UNKNOWN = "pass", "fail", "unknown"
+
+# 실행 중 예측/결과 통계
+_stats = {
+    "pool": 0,
+    "rejected": {"history": 0, "shape": 0},
+    "audited": 0,
+    "selected": 0,
+    "outcomes": {prediction: {"pass": 0, "fail": 0} for prediction in (PASS, FAIL, UNKNOWN)},
+}
+_stats_lock = threading.Lock()
+
+
+def passes(volume, blog_count):
+    """페이지에 나올 키워드인지 (builder와 같은 포화도 기준)"""
+    saturation = round(blog_count / volume, 2) if blog_count else 0
+    return saturation <= SATURATION_THRESHOLD
+
+
+def shape(keyword):
+    """키워드 형태 (길이 구간, 숫자 포함, 영문 포함) - 짧은 일반 명사일수록 문서가 많음"""
+    return (
+        min(len(keyword), 8),
+        any(ch.isdigit() for ch in keyword),
+        any("a" <= ch <= "z" for ch in keyword.lower()),
+    )
+
+
+class Prior:
+    """예전 블로그 문서수 (기록 저장소 최신값, 만료된 캐시 값이 있으면 그쪽 우선) + 형태별 과거 통과율"""
+
+    def __init__(self, blog_counts, shape_rates):
+        self.blog_counts = blog_counts    # {정규화 키: 문서수}
+        self.shape_rates = shape_rates    # {형태: (표본 수, 통과율)}
+
+    @classmethod
+    def load(cls, store=None, days=PREFILTER_HISTORY_DAYS):
+        """기록 저장소 최근 N일로 생성"""
+        store = store or history_store.get_store()
+        since = (datetime.now(history_store.KST) - timedelta(days=days)).strftime("%Y-%m-%d")
+        return cls.from_rows(store.columns(("keyword", "ts", "monthly_search", "blog_count"), since=since))
+
+    @classmethod
+    def from_rows(cls, rows):
+        """(키워드, 시각, 검색량, 블로그 문서수) 행 목록으로 생성"""
+        latest = {}
+        samples = {}
+        for keyword, ts, volume, blog_count in rows:
+            if blog_count <= 0 or volume <= 0:
+                continue
+            key = normalize_keyword(keyword)
+            if key not in latest or ts > latest[key][0]:
+                latest[key] = (ts, blog_count)
+            total, passed = samples.get(shape(keyword), (0, 0))
+            samples[shape(keyword)] = (total + 1, passed + passes(volume, blog_count))
+
+        return cls(
+            {key: blog_count for key, (_, blog_count) in latest.items()},
+            {key: (total, passed / total) for key, (total, passed) in samples.items()},
+        )
+
+    def add_cached(self, keywords, cache=None):
+        """캐시에 남은 (만료 후 CACHE_STALE_KEEP 이내) 블로그 문서수로 예전 값 보강"""
+        cache = cache or get_cache()
+        if cache is not None:
+            self.blog_counts.update(cache.peek("blog_count", keywords))
+
+    def predict(self, keyword, volume):
+        """문서수 조회 없이 통과 여부 예측 → (예측, 근거)
+
+        블로그 문서는 계속 쌓이므로 예전 문서수 / 현재 검색량은 포화도의 하한에 가깝다.
+        """
+        blog_count = self.blog_counts.get(normalize_keyword(keyword))
+        if blog_count is not None:
+            if blog_count / volume > SATURATION_THRESHOLD * PREFILTER_MARGIN:
+                return FAIL, "history"
+            return PASS, "history"
+
+        total, rate = self.shape_rates.get(shape(keyword), (0, 0.0))
+        if total >= PREFILTER_MIN_SAMPLES and rate < PREFILTER_MIN_PASS_RATE:
+            return FAIL, "shape"
+        return UNKNOWN, "shape"
+
+
+def select(search_volumes, prior, slots=PREFILTER_SLOTS, pool=PREFILTER_POOL):
+    """검색량 상위 pool개(100 이상)를 예측해 통과 가능한 후보만 slots개까지 선택
+
+    반환: ([(키워드, 검색량)] 검색량순, {정규화 키: 예측})
+    제외한 후보 일부(PREFILTER_AUDIT_RATE)는 예측 검증용으로 함께 조회한다.
+    """
+    ranked = sorted(search_volumes.items(), key=lambda x: x[1], reverse=True)[:pool]
+    ranked = [(kw, vol) for kw, vol in ranked if vol >= 100]
+    prior.add_cached(kw for kw, _ in ranked)
+
+    plausible, rejected = [], []
+    predictions = {}
+    reasons = {"history": 0, "shape": 0}
+    for kw, vol in ranked:
+        prediction, reason = prior.predict(kw, vol)
+        predictions[normalize_keyword(kw)] = prediction
+        if prediction == FAIL:
+            rejected.append((kw, vol))
+            reasons[reason] += 1
+        else:
+            plausible.append((kw, vol))
+
+    audit_count = min(slots, round(len(rejected) * PREFILTER_AUDIT_RATE))
+    audited = random.sample(rejected, audit_count)
+    selected = plausible[:slots - audit_count] + audited
+    selected.sort(key=lambda x: x[1], reverse=True)
+
+    with _stats_lock:
+        _stats["pool"] += len(ranked)
+        _stats["audited"] += audit_count
+        _stats["selected"] += len(selected)
+        for reason, count in reasons.items():
+            _stats["rejected"][reason] += count
+
+    return selected, predictions
+
+
+def record_outcomes(outcomes):
+    """실제 조회 결과로 예측 적중 집계 - outcomes: [(예측, 검색량, 블로그 문서수)]"""
+    with _stats_lock:
+        for prediction, volume, blog_count in outcomes:
+            if blog_count is None:
+                continue
+            _stats["outcomes"][prediction]["pass" if passes(volume, blog_count) else "fail"] += 1
+
+
+def stats():
+    """후보/제외/조회 수와 예측별 실제 통과 수 + 적중률"""
+    with _stats_lock:
+        data = {
+            "pool": _stats["pool"],
+            "rejected": dict(_stats["rejected"]),
+            "audited": _stats["audited"],
+            "selected": _stats["selected"],
+            "outcomes": {prediction: dict(item) for prediction, item in _stats["outcomes"].items()},
+        }
+
+    outcomes = data["outcomes"]
+    looked_up = sum(item["pass"] + item["fail"] for item in outcomes.values())
+    passed = sum(item["pass"] for item in outcomes.values())
+    checked = outcomes[PASS]["pass"] + outcomes[PASS]["fail"] + outcomes[FAIL]["pass"] + outcomes[FAIL]["fail"]
+    data["pass_rate"] = round(passed / looked_up, 3) if looked_up else None
+    # 예측이 있었던 키워드 중 맞힌 비율 (통과 예상 → 통과, 제외 → 검증 조회에서도 실패)
+    data["hit_rate"] = round((outcomes[PASS]["pass"] + outcomes[FAIL]["fail"]) / checked, 3) if checked else None
+    return data
+
+
+def print_stats():
+    """사전 필터 효과 출력"""
+    data = stats()
+    if not data["pool"]:
+        return
+    rejected = data["rejected"]
+    print(f"🎯 사전 필터: 후보 {data['pool']}개 중 {sum(rejected.values())}개 제외 "
+          f"(예전 문서수 {rejected['history']} / 형태 {rejected['shape']}) → {data['selected']}개 조회 "
+          f"(검증 {data['audited']}개)")
+    if data["pass_rate"] is not None:
+        hit_rate = f"{data['hit_rate']:.0%}" if data["hit_rate"] is not None else "-"
+        print(f"   • 조회한 키워드 중 기준 통과 {data['pass_rate']:.0%} / 예측 적중 {hit_rate}")
+    for prediction, item in data["outcomes"].items():
+        if item["pass"] + item["fail"]:
+            print(f"   • 예측 {prediction}: 통과 {item['pass']} / 실패 {item['fail']}")
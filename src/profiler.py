@@ -0,0 +1,242 @@
+import cProfile
+import functools
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from config import PROFILE_MODE, PROFILE_SAMPLE_INTERVAL
+
+KST = timezone(timedelta(hours=9))
+
+_lock = threading.Lock()
+_started = time.time()
+_stages = {}
+_functions = {}
+_endpoints = {}
+_bytes_written = Counter()
+
+
+def reset():
+    """기록 초기화 (한 프로세스에서 여러 번 실행할 때)"""
+    global _started
+    with _lock:
+        _started = time.time()
+        _stages.clear()
+        _functions.clear()
+        _endpoints.clear()
+        _bytes_written.clear()
+
+
+def _add_timing(table, name, elapsed):
+    with _lock:
+        table.setdefault(name, []).append(elapsed)
+
+
+@contextmanager
+def stage(name):
+    """main의 단계 하나 시간 측정"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _add_timing(_stages, name, time.perf_counter() - start)
+
+
+def timed(fn):
+    """함수 호출 시간 측정 데코레이터 (모듈.함수 이름으로 기록)"""
+    name = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _add_timing(_functions, name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def endpoint_name(url):
+    """URL → 엔드포인트 이름 (호스트 + 경로, 쿼리 제외)"""
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+def record_call(endpoint, elapsed, status=None, error=None):
+    """외부 API 요청 한 번 기록 - status가 400 이상이거나 error가 있으면 실패"""
+    with _lock:
+        item = _endpoints.setdefault(endpoint, {"latencies": [], "errors": 0, "status": Counter()})
+        item["latencies"].append(elapsed)
+        if error is not None:
+            item["errors"] += 1
+            item["status"][type(error).__name__] += 1
+        else:
+            item["status"][str(status)] += 1
+            if status is not None and status >= 400:
+                item["errors"] += 1
+
+
+def add_bytes(path, size):
+    """builder가 쓴 파일 크기 기록"""
+    with _lock:
+        _bytes_written[str(path)] += size
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 목록의 백분위 값 (최근접 순위)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def _summarize_timings(table):
+    return {
+        name: {
+            "count": len(values),
+            "total_s": round(sum(values), 3),
+            "mean_ms": round(sum(values) / len(values) * 1000, 1),
+            "max_ms": round(max(values) * 1000, 1),
+        }
+        for name, values in table.items()
+    }
+
+
+def report(extra=None):
+    """실행 보고서 dict"""
+    with _lock:
+        # 단계는 실행 순서, 함수는 이름순
+        stages = _summarize_timings(_stages)
+        functions = _summarize_timings(dict(sorted(_functions.items())))
+        endpoints = {}
+        for name, item in sorted(_endpoints.items()):
+            latencies = sorted(item["latencies"])
+            endpoints[name] = {
+                "calls": len(latencies),
+                "errors": item["errors"],
+                "status": dict(item["status"]),
+                "p50_ms": round(percentile(latencies, 0.5) * 1000, 1),
+                "p90_ms": round(percentile(latencies, 0.9) * 1000, 1),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+                "max_ms": round(latencies[-1] * 1000, 1),
+            }
+        bytes_written = dict(_bytes_written)
+        started = _started
+
+    return {
+        "started": datetime.fromtimestamp(started, KST).isoformat(timespec="seconds"),
+        "wall_s": round(time.time() - started, 3),
+        "stages": stages,
+        "functions": functions,
+        "endpoints": endpoints,
+        "bytes_written": {
+            "total": sum(bytes_written.values()),
+            "files": len(bytes_written),
+            "largest": dict(sorted(bytes_written.items(), key=lambda x: -x[1])[:10]),
+        },
+        **(extra or {}),
+    }
+
+
+def save_report(path, extra=None):
+    """실행 보고서를 JSON으로 저장 - 저장한 보고서 반환"""
+    data = report(extra)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return data
+
+
+def print_report(data):
+    """단계별 시간 + 엔드포인트별 지연 요약 출력"""
+    print(f"⏱️ 단계별 시간 (전체 {data['wall_s']:.1f}s)")
+    for name, item in data["stages"].items():
+        print(f"   • {name}: {item['total_s']:.2f}s")
+    for name, item in data["endpoints"].items():
+        print(f"   🌐 {name}: {item['calls']}회 (실패 {item['errors']}) "
+              f"p50 {item['p50_ms']:.0f}ms / p90 {item['p90_ms']:.0f}ms / p99 {item['p99_ms']:.0f}ms")
+    written = data["bytes_written"]
+    print(f"   📝 파일 쓰기: {written['files']}개 / {written['total'] / 1024:,.0f} KB")
+
+
+class Sampler:
+    """샘플링 프로파일러 - 일정 간격으로 모든 스레드의 호출 스택을 세어 collapsed stack 형식으로 저장"""
+
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampler", daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def save(self, path):
+        """flamegraph.pl / speedscope에 넣을 수 있는 collapsed stack 파일"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def deep_profile(output_dir, mode=None):
+    """PROFILE_MODE가 "cprofile"/"sample"일 때만 감싼 구간을 프로파일링해 output_dir에 저장"""
+    mode = PROFILE_MODE if mode is None else mode
+    if mode not in ("cprofile", "sample"):
+        yield
+        return
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if mode == "cprofile":
+        # cProfile은 시작한 스레드만 측정 (스레드 풀 작업은 sample 모드 사용)
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            path = output_dir / "profile.prof"
+            profile.dump_stats(str(path))
+            stream = io.StringIO()
+            pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(25)
+            print(stream.getvalue())
+            print(f"🔬 cProfile 저장: {path} (python -m pstats {path})")
+    else:
+        sampler = Sampler()
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            path = output_dir / "profile.collapsed"
+            sampler.save(path)
+            print(f"🔬 샘플링 프로파일 저장: {path} ({sum(sampler.stacks.values())}개 샘플)")
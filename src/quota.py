@@ -0,0 +1,207 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+from config import QUOTA_PATH, QUOTA_LIMITS, QUOTA_KEYS, QUOTA_APP_RESERVE, QUOTA_RETENTION_DAYS
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+KST = timezone(timedelta(hours=9))
+
+# 호출 주체: "app" (app.py / 수동 분석, 예비분만 사용) / "batch" (main.py, 예비분 제외)
+# app.py(Render)와 main.py(GitHub Actions)는 서로 다른 머신에서 각자의 .cache/quota.db를 쓰므로
+# 사용량을 합산할 수 없음 → 한도를 두 몫으로 나누고 각 주체는 자기 몫만 확인 (합계가 한도를 넘지 않음)
+APP, BATCH = "app", "batch"
+
+
+class QuotaExceeded(Exception):
+    """오늘 남은 호출 수가 없어 요청하지 않음"""
+
+
+def today():
+    """네이버 한도 기준 날짜 (KST)"""
+    return datetime.now(KST).strftime("%Y-%m-%d")
+
+
+def key_id(family):
+    """계열이 쓰는 API 키 식별자 (키 원문 대신 해시 앞부분만 저장)"""
+    value = os.getenv(QUOTA_KEYS.get(family, ""), "")
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:12] if value else "default"
+
+
+def ceiling(family, role):
+    """role이 오늘 쓸 수 있는 최대 호출 수 (한도 없으면 None) - 두 주체의 몫을 더하면 한도 이하"""
+    limit = QUOTA_LIMITS.get(family)
+    if limit is None:
+        return None
+    reserve = int(limit * QUOTA_APP_RESERVE)
+    if role == BATCH:
+        return limit - reserve
+    return reserve
+
+
+class QuotaStore:
+    """키/계열/호출 주체별 일일 사용량 (SQLite, 프로세스별 파일 - 호출 주체마다 자기 몫만 계산)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage (
+                day TEXT NOT NULL,
+                key TEXT NOT NULL,
+                family TEXT NOT NULL,
+                role TEXT NOT NULL,
+                calls INTEGER NOT NULL,
+                PRIMARY KEY (day, key, family, role)
+            )
+        """)
+        cutoff = (datetime.now(KST) - timedelta(days=QUOTA_RETENTION_DAYS)).strftime("%Y-%m-%d")
+        self._conn.execute("DELETE FROM usage WHERE day < ?", (cutoff,))
+        self.refused = Counter()
+
+    def _used(self, day, key, family, role):
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(calls), 0) FROM usage WHERE day = ? AND key = ? AND family = ? AND role = ?",
+            (day, key, family, role)
+        ).fetchone()
+        return row[0]
+
+    def charge(self, family, role, calls=1):
+        """호출 calls회 차감 - role의 한도를 넘으면 차감하지 않고 False"""
+        day, key, top = today(), key_id(family), ceiling(family, role)
+        with self._lock:
+            # 같은 파일을 쓰는 다른 프로세스(같은 주체)와 동시에 차감해도 몫을 넘지 않도록 쓰기 잠금 후 확인
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if top is not None and self._used(day, key, family, role) + calls > top:
+                    self._conn.execute("ROLLBACK")
+                    self.refused[family] += calls
+                    return False
+                self._conn.execute(
+                    "INSERT INTO usage (day, key, family, role, calls) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (day, key, family, role) DO UPDATE SET calls = calls + excluded.calls",
+                    (day, key, family, role, calls)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def remaining(self, family, role):
+        """role이 오늘 더 쓸 수 있는 호출 수 (한도 없으면 None)"""
+        top = ceiling(family, role)
+        if top is None:
+            return None
+        with self._lock:
+            used = self._used(today(), key_id(family), family, role)
+        return max(0, top - used)
+
+    def usage(self, day=None):
+        """{계열: {호출 주체: 호출 수}} (현재 키 기준)"""
+        day = day or today()
+        result = {}
+        with self._lock:
+            for family in QUOTA_LIMITS:
+                rows = self._conn.execute(
+                    "SELECT role, calls FROM usage WHERE day = ? AND key = ? AND family = ?",
+                    (day, key_id(family), family)
+                ).fetchall()
+                result[family] = dict(rows)
+        return result
+
+    def stats(self):
+        """계열별 오늘 사용량 / 한도 / 이 프로세스 몫 / 남은 호출 수 / 한도로 거절한 호출 수"""
+        return {
+            family: {
+                "used": sum(by_role.values()),
+                "by_role": by_role,
+                "limit": QUOTA_LIMITS.get(family),
+                "ceiling": ceiling(family, _role),
+                "remaining": self.remaining(family, _role),
+                "refused": self.refused.get(family, 0),
+            }
+            for family, by_role in self.usage().items()
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+_role = APP
+
+
+def get_store():
+    """프로세스 공용 사용량 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = QuotaStore(BASE_DIR / QUOTA_PATH)
+    return _store
+
+
+def close():
+    """공용 저장소 닫기"""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+            _store = None
+
+
+def set_role(role):
+    """이 프로세스의 호출 주체 설정 (main.py는 BATCH)"""
+    global _role
+    _role = role
+
+
+def charge(family):
+    """요청 한 번 차감 (http_client가 시도마다 호출) - 한도 초과면 QuotaExceeded"""
+    if family not in QUOTA_LIMITS:
+        return
+    if not get_store().charge(family, _role):
+        raise QuotaExceeded(f"오늘 {family} API 호출 한도 도달 ({_role})")
+
+
+def remaining(family):
+    """이 프로세스가 오늘 더 쓸 수 있는 호출 수 (한도 없으면 None)"""
+    return get_store().remaining(family, _role)
+
+
+def plan(items, cost, value, family="search"):
+    """남은 한도 안에서 value가 큰 순으로 처리할 항목 선택 → (처리할 항목, 생략할 항목)
+
+    한도가 충분하면 입력 순서 그대로 전부 처리한다.
+    """
+    items = list(items)
+    budget = remaining(family)
+    if budget is None or budget >= len(items) * cost:
+        return items, []
+    ordered = sorted(items, key=value, reverse=True)
+    count = budget // cost
+    return ordered[:count], ordered[count:]
+
+
+def stats():
+    return get_store().stats()
+
+
+def print_stats():
+    """오늘 사용량 출력"""
+    for family, item in stats().items():
+        if not item["used"] and not item["refused"]:
+            continue
+        limit = f"/{item['ceiling']:,}" if item["ceiling"] else ""
+        refused = f" (한도로 {item['refused']}회 생략)" if item["refused"] else ""
+        print(f"🎫 {family} 오늘 사용량 ({_role} 몫): {item['by_role'].get(_role, 0):,}{limit}회{refused}")
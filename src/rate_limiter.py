@@ -0,0 +1,128 @@
+import random
+import threading
+import time
+
+from config import RATE_LIMITS, RATE_MAX_RETRIES, RATE_BACKOFF_BASE, RATE_BACKOFF_MAX
+
+# 재시도 대상 상태 코드 (429 + 5xx)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """엔드포인트 계열별 토큰 버킷 (429 시 속도를 절반으로, 성공 시 천천히 회복)"""
+
+    def __init__(self, rate, burst):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self, delay, throttled=False):
+        """계열 전체를 delay초 동안 멈추고, 429면 속도를 낮춤"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+            if throttled:
+                self.throttled += 1
+                self.rate = max(self.max_rate / 10, self.rate / 2)
+
+    def recover(self):
+        """성공 응답마다 속도를 원래 값 쪽으로 조금씩 회복"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(family):
+    """계열별 공용 버킷"""
+    with _buckets_lock:
+        bucket = _buckets.get(family)
+        if bucket is None:
+            limit = RATE_LIMITS[family]
+            bucket = TokenBucket(limit["rate"], limit["burst"])
+            _buckets[family] = bucket
+    return bucket
+
+
+def backoff_delay(attempt, retry_after=None):
+    """지터가 섞인 지수 백오프 대기 시간 (Retry-After가 있으면 그 이상)"""
+    delay = random.uniform(0, min(RATE_BACKOFF_MAX, RATE_BACKOFF_BASE * (2 ** attempt)))
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
+
+
+def acquire(family):
+    """요청 전 토큰 획득"""
+    get_bucket(family).acquire()
+
+
+def backoff(family, attempt, throttled=True, retry_after=None):
+    """429/5xx 이후 계열 전체에 백오프 적용 - 호출한 쪽이 반환된 시간만큼 대기"""
+    delay = backoff_delay(attempt, retry_after)
+    get_bucket(family).penalize(delay, throttled)
+    return delay
+
+
+def request(family, send):
+    """토큰을 얻어 send()를 호출하고, 429/5xx면 백오프 후 재시도"""
+    bucket = get_bucket(family)
+
+    for attempt in range(RATE_MAX_RETRIES + 1):
+        bucket.acquire()
+        response = send()
+
+        if response.status_code not in RETRY_STATUS:
+            bucket.recover()
+            return response
+
+        if attempt == RATE_MAX_RETRIES:
+            break
+
+        delay = backoff(
+            family,
+            attempt,
+            throttled=response.status_code == 429,
+            retry_after=response.headers.get("Retry-After"),
+        )
+        time.sleep(delay)
+
+    return response
+
+
+def stats():
+    """계열별 현재 속도 / 429 횟수"""
+    with _buckets_lock:
+        buckets = dict(_buckets)
+    return {
+        family: {"rate": round(bucket.rate, 2), "max_rate": bucket.max_rate, "throttled": bucket.throttled}
+        for family, bucket in buckets.items()
+    }
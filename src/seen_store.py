@@ -0,0 +1,114 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from config import SEEN_STORE_PATH, SEEN_RETENTION_DAYS
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def article_key(item):
+    """기사 식별 키 - 링크 우선, 없으면 제목 해시"""
+    link = item.get("originallink") or item.get("link")
+    if link:
+        return link
+    title = " ".join(item.get("title", "").split())
+    return "title:" + hashlib.sha1(title.encode("utf-8")).hexdigest()
+
+
+class SeenStore:
+    """카테고리별로 이미 처리한 기사 기록 (SQLite)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen (
+                category TEXT NOT NULL,
+                key TEXT NOT NULL,
+                title TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (category, key)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_recent ON seen (category, seen_at)")
+        self._conn.commit()
+
+    def has_any(self, category):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM seen WHERE category = ? LIMIT 1", (category,)).fetchone()
+        return row is not None
+
+    def seen_keys(self, category, keys):
+        """keys 중 이미 본 것"""
+        keys = list(keys)
+        if not keys:
+            return set()
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key FROM seen WHERE category = ? AND key IN ({placeholders})",
+                [category, *keys]
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark(self, category, items):
+        """(키, 제목) 목록을 본 것으로 기록 - 목록 순서가 최신순이면 최신순으로 저장"""
+        now = time.time()
+        # 같은 실행 안에서도 앞쪽(최신) 기사가 더 늦은 시각을 갖도록 약간씩 차이를 둠
+        rows = [(category, key, title, now - index * 1e-6) for index, (key, title) in enumerate(items)]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (category, key, title, seen_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute(
+                "DELETE FROM seen WHERE seen_at < ?",
+                (now - SEEN_RETENTION_DAYS * 86400,)
+            )
+            self._conn.commit()
+
+    def unused(self, category, scopes, since):
+        """scopes(단어별 기록)에서 since 이후 본 기사 중 category에는 없는 것 (최신순)"""
+        scopes = list(scopes)
+        if not scopes:
+            return []
+        placeholders = ",".join("?" * len(scopes))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, title, MAX(seen_at) AS latest FROM seen "
+                f"WHERE category IN ({placeholders}) AND seen_at >= ? "
+                f"AND key NOT IN (SELECT key FROM seen WHERE category = ?) "
+                f"GROUP BY key ORDER BY latest DESC",
+                [*scopes, since, category]
+            ).fetchall()
+        return [(key, title) for key, title, _ in rows]
+
+    def recent_titles(self, category, limit, exclude=()):
+        """최근에 본 제목 (최신순)"""
+        exclude = set(exclude)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT title FROM seen WHERE category = ? ORDER BY seen_at DESC LIMIT ?",
+                (category, limit + len(exclude))
+            ).fetchall()
+        titles = [row[0] for row in rows if row[0] not in exclude]
+        return list(dict.fromkeys(titles))[:limit]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """프로세스 공용 기사 기록"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SeenStore(BASE_DIR / SEEN_STORE_PATH)
+    return _store
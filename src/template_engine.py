@@ -0,0 +1,51 @@
+import re
+import threading
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# {{키}} 형태의 치환 자리
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+_sources = {}
+_compiled = {}
+_lock = threading.Lock()
+
+
+def load(path):
+    """템플릿 원문 (프로세스당 한 번만 디스크에서 읽음)"""
+    source = _sources.get(path)
+    if source is None:
+        with open(BASE_DIR / path, "r", encoding="utf-8") as f:
+            source = f.read()
+        with _lock:
+            _sources[path] = source
+    return source
+
+
+def compile_template(path):
+    """템플릿을 (고정 문자열 목록, 자리 이름 목록)으로 분해해 캐시"""
+    compiled = _compiled.get(path)
+    if compiled is None:
+        parts = PLACEHOLDER_RE.split(load(path))
+        compiled = (parts[0::2], parts[1::2])
+        with _lock:
+            _compiled[path] = compiled
+    return compiled
+
+
+def render(path, context):
+    """한 번의 join으로 렌더링 - context에 없는 자리는 원문 그대로 둠"""
+    literals, names = compile_template(path)
+    out = [literals[0]]
+    for name, literal in zip(names, literals[1:]):
+        out.append(str(context[name]) if name in context else "{{" + name + "}}")
+        out.append(literal)
+    return "".join(out)
+
+
+def clear():
+    """캐시 비우기 (템플릿 수정 후 재로딩용)"""
+    with _lock:
+        _sources.clear()
+        _compiled.clear()
@@ -0,0 +1,322 @@
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from config import TREND_WINDOWS, TREND_MIN_POINTS, TREND_TOP, TREND_SNAPSHOT_PATH
+from src import history_store
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+class TrendTable:
+    """키워드-날짜별 지표 배열 (키워드 → 날짜순 정렬, 같은 날 여러 실행은 평균)"""
+
+    def __init__(self, keywords, keyword_ids, days, volume, blog, saturation, categories):
+        self.keywords = keywords          # 고유 키워드 (np.ndarray[str])
+        self.keyword_ids = keyword_ids    # 행별 키워드 번호
+        self.days = days                  # 행별 날짜 (datetime64[D])
+        self.volume = volume
+        self.blog = blog
+        self.saturation = saturation
+        self.categories = categories      # {카테고리: 해당 카테고리에 나온 키워드 번호 배열}
+
+    def __len__(self):
+        return len(self.keyword_ids)
+
+    @property
+    def latest_day(self):
+        return self.days.max() if len(self.days) else None
+
+
+def _codes(values, uniques=()):
+    """값 목록 → (고유값 배열, 행별 번호 배열) - uniques의 번호는 유지하고 새 값만 뒤에 추가"""
+    uniques = list(uniques)
+    index = {value: code for code, value in enumerate(uniques)}
+    for value in values:
+        if value not in index:
+            index[value] = len(uniques)
+            uniques.append(value)
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int64, count=len(values))
+    return np.array(uniques, dtype=str), codes
+
+
+def _day_numbers(timestamps):
+    """'YYYY-MM-DD HH:MM' 목록 → 1970-01-01 기준 일수 배열 (실행 시각은 종류가 적어 고유값만 변환)"""
+    unique_ts, ts_ids = _codes(timestamps)
+    if not len(ts_ids):
+        return np.array([], dtype=np.int64)
+    return np.asarray([ts[:10] for ts in unique_ts], dtype="datetime64[D]").astype(np.int64)[ts_ids]
+
+
+def _empty_table():
+    empty = np.array([], dtype=np.int64)
+    return TrendTable(np.array([], dtype=str), empty, np.array([], dtype="datetime64[D]"),
+                      empty.astype(float), empty.astype(float), empty.astype(float), {})
+
+
+def build_table(keywords, timestamps, categories, volume, blog, saturation):
+    """행 단위 기록 → 키워드-날짜 단위 TrendTable (모두 벡터 연산)"""
+    if not len(keywords):
+        return _empty_table()
+    # 문자열은 dict로 번호를 매기는 편이 np.unique 정렬보다 빠름
+    unique_keywords, keyword_ids = _codes(keywords)
+    unique_categories, category_ids = _codes(categories)
+    return _aggregate(
+        unique_keywords, keyword_ids, _day_numbers(timestamps), unique_categories, category_ids,
+        np.asarray(volume, dtype=float), np.asarray(blog, dtype=float), np.asarray(saturation, dtype=float),
+    )
+
+
+def _aggregate(unique_keywords, keyword_ids, day_numbers, unique_categories, category_ids, volume, blog, saturation):
+    """번호/숫자 배열 → TrendTable (키워드-날짜 그룹별 평균)"""
+    # 블로그 문서수 0은 조회 실패일 수 있어 추세 계산에서 제외
+    valid = blog > 0
+    if not valid.any():
+        return _empty_table()
+    keyword_ids, day_numbers, category_ids = keyword_ids[valid], day_numbers[valid], category_ids[valid]
+    volume, blog, saturation = volume[valid], blog[valid], saturation[valid]
+
+    # (키워드, 날짜) 그룹별 평균
+    first_day = day_numbers.min()
+    span = int(day_numbers.max() - first_day) + 1
+    group = keyword_ids * span + (day_numbers - first_day)
+    groups, inverse, counts = np.unique(group, return_inverse=True, return_counts=True)
+
+    def mean(values):
+        return np.bincount(inverse, weights=values) / counts
+
+    # 카테고리별 키워드 번호 ((카테고리, 키워드) 쌍을 한 번에 정렬)
+    n = len(unique_keywords)
+    pairs = np.unique(category_ids * n + keyword_ids)
+    pair_categories = pairs // n
+    by_category = {}
+    for code, category in enumerate(unique_categories):
+        ids = pairs[pair_categories == code] % n
+        if len(ids):
+            by_category[str(category)] = ids
+
+    return TrendTable(
+        keywords=unique_keywords,
+        keyword_ids=groups // span,
+        days=(groups % span + first_day).astype("datetime64[D]"),
+        volume=mean(volume),
+        blog=mean(blog),
+        saturation=mean(saturation),
+        categories=by_category,
+    )
+
+
+# 스냅샷의 행별 배열 / 기록 저장소에서 읽는 컬럼
+SNAPSHOT_ARRAYS = ("keyword_ids", "days", "category_ids", "volume", "blog", "saturation")
+SNAPSHOT_COLUMNS = ("keyword", "ts", "category", "monthly_search", "blog_count", "saturation")
+
+
+def _new_snapshot(source, since):
+    ids = np.array([], dtype=np.int64)
+    values = np.array([], dtype=float)
+    return {
+        "source": np.array(source), "since": np.int64(since), "last_rowid": np.int64(0),
+        "keywords": np.array([], dtype=str), "categories": np.array([], dtype=str),
+        "keyword_ids": ids, "days": ids, "category_ids": ids,
+        "volume": values, "blog": values, "saturation": values,
+    }
+
+
+def _read_snapshot(path, source):
+    """저장된 기록 배열 - 없거나 깨졌거나 다른 저장소 것이면 None"""
+    try:
+        with np.load(path) as data:
+            snapshot = {name: data[name] for name in data.files}
+    except (OSError, ValueError, EOFError):
+        return None
+    required = ("source", "since", "last_rowid", "keywords", "categories", *SNAPSHOT_ARRAYS)
+    if any(name not in snapshot for name in required) or str(snapshot["source"]) != source:
+        return None
+    return snapshot
+
+
+def _write_snapshot(path, snapshot):
+    """임시 파일에 쓴 뒤 교체 (중간에 끊겨도 이전 스냅샷 유지)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.stem + ".tmp.npz")
+    np.savez(tmp_path, **snapshot)
+    os.replace(tmp_path, path)
+
+
+def _append_rows(snapshot, rows):
+    """스냅샷 배열 뒤에 새 기록 (rowid + SNAPSHOT_COLUMNS) 추가"""
+    _, keywords, timestamps, categories, volume, blog, saturation = zip(*rows)
+    snapshot["keywords"], keyword_ids = _codes(keywords, snapshot["keywords"])
+    snapshot["categories"], category_ids = _codes(categories, snapshot["categories"])
+    new = {
+        "keyword_ids": keyword_ids,
+        "days": _day_numbers(timestamps),
+        "category_ids": category_ids,
+        "volume": np.asarray(volume, dtype=float),
+        "blog": np.asarray(blog, dtype=float),
+        "saturation": np.asarray(saturation, dtype=float),
+    }
+    for name in SNAPSHOT_ARRAYS:
+        snapshot[name] = np.concatenate([snapshot[name], new[name]])
+
+
+def _prune(snapshot, keep_since):
+    """keep_since(일수)보다 오래된 행과 더 이상 나오지 않는 키워드 제거 - 지운 게 있으면 True"""
+    keep = snapshot["days"] >= keep_since
+    snapshot["since"] = np.int64(keep_since)
+    if keep.all():
+        return False
+    for name in SNAPSHOT_ARRAYS:
+        snapshot[name] = snapshot[name][keep]
+    used, snapshot["keyword_ids"] = np.unique(snapshot["keyword_ids"], return_inverse=True)
+    snapshot["keywords"] = snapshot["keywords"][used]
+    return True
+
+
+def load(days=None, store=None, snapshot_path=None):
+    """기록 저장소에서 최근 N일 기록을 읽어 TrendTable 생성
+
+    SQLite에서 행마다 파이썬 객체를 만드는 데 대부분의 시간이 들어, 키워드/카테고리 번호와 숫자 배열을
+    스냅샷(.npz)으로 저장해 두고 다음 실행에서는 그 뒤에 추가된 기록(rowid 기준 - 기록은 추가만 됨)만 읽는다.
+    """
+    days = days or max(TREND_WINDOWS)
+    store = store or history_store.get_store()
+    path = Path(snapshot_path or BASE_DIR / TREND_SNAPSHOT_PATH)
+    today = np.datetime64(datetime.now(history_store.KST).strftime("%Y-%m-%d"), "D").astype(np.int64)
+    since = int(today) - days
+    # 짧은 기간을 먼저 읽어도 가장 긴 추세 기간은 남겨 둠 (다음 조회가 처음부터 읽지 않도록)
+    keep_since = min(since, int(today) - max(TREND_WINDOWS))
+
+    source = str(store.path.resolve())
+    last_rowid = store.last_rowid()
+    snapshot = _read_snapshot(path, source)
+    changed = False
+    # 처음이거나, 스냅샷보다 긴 기간이 필요하거나, 기록 파일이 바뀌었으면(rowid가 줄어듦) 처음부터
+    if snapshot is None or int(snapshot["since"]) > keep_since or int(snapshot["last_rowid"]) > last_rowid:
+        snapshot = _new_snapshot(source, keep_since)
+        changed = True
+
+    if last_rowid > int(snapshot["last_rowid"]):
+        rows = store.appended(
+            SNAPSHOT_COLUMNS,
+            after=int(snapshot["last_rowid"]),
+            since=str(np.datetime64(keep_since, "D"))
+        )
+        if rows:
+            _append_rows(snapshot, rows)
+        snapshot["last_rowid"] = np.int64(last_rowid)
+        changed = True
+    changed = _prune(snapshot, keep_since) or changed
+    if changed:
+        _write_snapshot(path, snapshot)
+
+    mask = snapshot["days"] >= since
+    return _aggregate(
+        snapshot["keywords"], snapshot["keyword_ids"][mask], snapshot["days"][mask],
+        snapshot["categories"], snapshot["category_ids"][mask],
+        snapshot["volume"][mask], snapshot["blog"][mask], snapshot["saturation"][mask],
+    )
+
+
+def compute(table, window):
+    """window일 동안의 키워드별 추세 (검색량 변화, 블로그 증가 속도, 포화도 기울기)
+
+    반환: 키워드별 배열 dict - 관측일이 TREND_MIN_POINTS 미만인 키워드는 제외
+    """
+    if not len(table):
+        return None
+
+    start = table.latest_day - np.timedelta64(window - 1, "D")
+    mask = table.days >= start
+    ids = table.keyword_ids[mask]
+    x = (table.days[mask] - start).astype(float)
+    volume = table.volume[mask]
+    blog = table.blog[mask]
+    saturation = table.saturation[mask]
+
+    # 키워드 번호 → 날짜순 정렬 (build_table이 이미 이 순서)
+    n = len(table.keywords)
+    points = np.bincount(ids, minlength=n)
+    present = np.flatnonzero(points)
+    starts = np.searchsorted(ids, present, side="left")
+    ends = np.searchsorted(ids, present, side="right") - 1
+
+    # 처음/마지막 관측값 비교
+    first_volume, last_volume = volume[starts], volume[ends]
+    first_blog, last_blog = blog[starts], blog[ends]
+    elapsed = np.maximum(x[ends] - x[starts], 1.0)
+
+    volume_delta = last_volume - first_volume
+    volume_change = volume_delta / np.maximum(first_volume, 1.0)
+    blog_growth = (last_blog - first_blog) / elapsed
+    blog_change = (last_blog - first_blog) / np.maximum(first_blog, 1.0)
+
+    # 포화도 최소제곱 기울기 (하루당): (nΣxy - ΣxΣy) / (nΣx² - (Σx)²)
+    count = points[present].astype(float)
+    sum_x = np.bincount(ids, weights=x, minlength=n)[present]
+    sum_y = np.bincount(ids, weights=saturation, minlength=n)[present]
+    sum_xy = np.bincount(ids, weights=x * saturation, minlength=n)[present]
+    sum_xx = np.bincount(ids, weights=x * x, minlength=n)[present]
+    denominator = count * sum_xx - sum_x * sum_x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        saturation_slope = np.where(denominator > 0, (count * sum_xy - sum_x * sum_y) / denominator, 0.0)
+
+    # 급상승 점수: 검색 수요 증가율이 블로그 공급 증가율보다 클수록 높음 (= 포화도가 떨어지는 중)
+    score = volume_change - blog_change
+
+    keep = count >= TREND_MIN_POINTS
+    return {
+        "keyword_ids": present[keep],
+        "keywords": table.keywords[present[keep]],
+        "points": points[present][keep],
+        "volume": last_volume[keep],
+        "volume_delta": volume_delta[keep],
+        "volume_change": volume_change[keep],
+        "blog_growth": blog_growth[keep],
+        "saturation_slope": saturation_slope[keep],
+        "score": score[keep],
+    }
+
+
+def compute_all(table, windows=TREND_WINDOWS):
+    """설정된 모든 기간의 추세 - {기간: compute 결과}"""
+    return {window: compute(table, window) for window in windows}
+
+
+def rising(table, trend, category=None, limit=TREND_TOP):
+    """검색량이 늘고 있는 키워드를 점수순으로 (category 지정 시 그 카테고리 키워드만)"""
+    if trend is None or not len(trend["keywords"]):
+        return []
+
+    mask = trend["volume_delta"] > 0
+    if category is not None:
+        mask &= np.isin(trend["keyword_ids"], table.categories.get(category, []))
+
+    indices = np.flatnonzero(mask)
+    indices = indices[np.argsort(-trend["score"][indices], kind="stable")[:limit]]
+    return [
+        {
+            "keyword": str(trend["keywords"][i]),
+            "points": int(trend["points"][i]),
+            "monthly_search": int(trend["volume"][i]),
+            "volume_delta": int(trend["volume_delta"][i]),
+            "volume_change": round(float(trend["volume_change"][i]), 3),
+            "blog_growth": round(float(trend["blog_growth"][i]), 1),
+            "saturation_slope": round(float(trend["saturation_slope"][i]), 4),
+            "score": round(float(trend["score"][i]), 3),
+        }
+        for i in indices
+    ]
+
+
+def rising_by_category(categories, window=None, table=None):
+    """카테고리별 + 전체 급상승 키워드 - {"all": [...], 카테고리: [...]}"""
+    window = window or min(TREND_WINDOWS)
+    table = table if table is not None else load()
+    trend = compute(table, window)
+    result = {"all": rising(table, trend)}
+    for category in categories:
+        result[category] = rising(table, trend, category=category)
+    return result